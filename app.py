@@ -11,19 +11,29 @@ CHANGES from original:
 - All original features preserved: 7 templates, ATS analysis, cover letter, interview prep
 """
 
-import base64
 import json
+import uuid
 
 import streamlit as st
 import streamlit.components.v1 as components
 
-from core.scraper import extract_pdf_text, scrape_url_text
+from core.ats_scoring import score_cv
+from core.dedup import CVIndex
+from core.jobs import ACTIVE_STATES, JobExecutor
+from core.scraper import build_http_cache, extract_pdf_text, http_cache_stats, scrape_url_text
 from core.ai_engine import (
-    extract_base_cv,
-    analyze_and_tailor_cv,
+    build_response_cache,
+    compaction_stats,
     generate_with_fallback,
+    input_token_budget,
+    provider_health,
+    stream_extract_base_cv,
 )
-from templates.cv_styles import render_cv
+from core.tailoring import analyze_and_tailor_cv_parallel
+from templates.cv_model import CVModel
+from templates.cv_styles import TEMPLATE_NAMES, render_cv
+from templates.export import FORMATS, Exporter, available_formats, build_export_cache
+from templates.render_cache import RenderCache, cv_hash
 
 # ─────────────────────────────────────────────────────
 # PAGE CONFIG
@@ -57,21 +67,69 @@ except KeyError as e:
     st.stop()
 
 
+@st.cache_resource
+def get_response_cache():
+    """One LLM response cache per server process — shared across sessions."""
+    return build_response_cache()
+
+
+@st.cache_resource
+def get_http_cache():
+    """One scraped-page cache per server process (ETag / Last-Modified revalidation)."""
+    return build_http_cache()
+
+
+@st.cache_resource
+def get_cv_index():
+    """Prior extractions, so re-uploading the same (or a lightly edited) CV is instant."""
+    return CVIndex()
+
+
+@st.cache_resource
+def get_render_cache():
+    """Rendered templates + download payloads, keyed by template and CV content."""
+    return RenderCache()
+
+
+@st.cache_resource
+def get_exporter():
+    """PDF/DOCX renderer pools + artifact cache, shared across sessions."""
+    return Exporter(build_export_cache())
+
+
+@st.cache_resource
+def get_job_executor():
+    """Background pool for LLM calls — one per process, so its concurrency cap spans all sessions."""
+    return JobExecutor()
+
+
+RESPONSE_CACHE = get_response_cache()
+HTTP_CACHE     = get_http_cache()
+CV_INDEX       = get_cv_index()
+RENDER_CACHE   = get_render_cache()
+EXPORTER       = get_exporter()
+JOBS           = get_job_executor()
+
+JOB_POLL_SECONDS = 1.0      # how often a running job's status box refreshes
+JOB_KINDS = {
+    "cv":             {"label": "🧠 AI is building your professional CV", "failed": "❌ Error"},
+    "ats":            {"label": "🧠 Analysing CV against JD",             "failed": "❌ ATS Analysis failed"},
+    "cover_letter":   {"label": "Writing your cover letter",              "failed": "Failed"},
+    "interview_prep": {"label": "Preparing questions based on your gaps", "failed": "Failed"},
+}
+
+
 # ─────────────────────────────────────────────────────
 # SIDEBAR
 # ─────────────────────────────────────────────────────
 st.sidebar.title("🎨 CV Design")
 
-TEMPLATE_OPTIONS = [
-    "1. Premium Two-Column (Navy & White)",
-    "2. Executive Corporate (Clean & Bold)",
-    "3. Creative Professional (Ribbons & Colors)",
-    "4. Minimalist Clean (Kinsley Morrison)",
-    "5. Modern Single Column (Teal Accent)",
-    "6. Academic Structured (Classic)",
-    "7. Dark Premium (Gold & Charcoal)",
-]
+TEMPLATE_OPTIONS = TEMPLATE_NAMES
 selected_template = st.sidebar.selectbox("Choose a Template:", TEMPLATE_OPTIONS)
+show_gallery = st.sidebar.checkbox(
+    "🖼️ Compare all designs",
+    help="Preview every template side by side (tabs) for your CV.",
+)
 
 st.sidebar.markdown("---")
 st.sidebar.info(
@@ -81,20 +139,219 @@ st.sidebar.info(
     "3. *(Optional)* Add a Job Description for ATS analysis"
 )
 
+with st.sidebar.expander("🩺 AI Backend Health"):
+    health = provider_health()
+    if health:
+        for backend, h in health.items():
+            latency = f"{h['ewma_latency']:.1f}s" if h["ewma_latency"] is not None else "—"
+            st.caption(f"**{backend}** · {h['state']} · {latency} · errors {h['error_rate']:.0%}")
+    else:
+        st.caption("No AI calls yet in this server process.")
+    saved = compaction_stats()
+    if saved["calls"]:
+        st.caption(
+            f"✂️ Input compaction saved ~{saved['tokens_saved']:,} tokens "
+            f"({saved['chars_saved']:,} chars) over {saved['calls']} inputs"
+        )
+    reused = CV_INDEX.stats()
+    if reused["exact"] or reused["near"]:
+        st.caption(f"♻️ CV re-uploads reused: {reused['exact']} identical · {reused['near']} lightly edited")
+    pages = http_cache_stats()
+    if any(pages.values()):
+        st.caption(
+            f"🌐 Profile URLs: {pages['fresh']} cached · {pages['revalidated']} revalidated (304) · "
+            f"{pages['fetched']} fetched"
+        )
+    renders = RENDER_CACHE.stats()
+    if renders["hits"] or renders["misses"]:
+        st.caption(
+            f"🖼️ CV renders: {renders['hit_rate']:.0%} served from cache "
+            f"({renders['hits']} hits · {renders['misses']} rendered)"
+        )
+    exports = EXPORTER.stats()
+    if exports["rendered"] or exports["cached"]:
+        st.caption(f"📄 Exports: {exports['rendered']} rendered · {exports['cached']} reused")
+    jobs = JOBS.stats()
+    if jobs["submitted"]:
+        st.caption(
+            f"⏱️ AI jobs: {jobs['running']} running ({jobs['cancelling']} cancelling) · {jobs['queued']} queued · "
+            f"{jobs['done']} done · {jobs['failed']} failed · {jobs['cancelled']} cancelled"
+        )
+
 
 # ─────────────────────────────────────────────────────
 # SESSION STATE
 # ─────────────────────────────────────────────────────
 _defaults = {
-    "base_cv_data":    None,
-    "analysis_result": None,
+    "base_cv":         None,    # (content hash, CVModel)
+    "analysis_result": None,    # ATS report, without its tailored CV
+    "tailored_cv":     None,    # (content hash, CVModel)
     "jd_text":         "",
     "cover_letter":    None,
     "interview_prep":  None,
+    "jobs":            {},      # kind → id of this session's background job
+    "job_errors":      {},      # kind → error of its last failed job
 }
 for key, val in _defaults.items():
     if key not in st.session_state:
         st.session_state[key] = val
+if "session_id" not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex
+
+
+def session_cv(data: dict) -> tuple:
+    """
+    (content hash, CVModel) for an LLM CV dict. Only this pair is kept in
+    session state — reruns, template switches and the gallery reuse it, and
+    prompts / keyword scoring get the dict back from CVModel.to_dict().
+    """
+    model = CVModel.from_dict(data)
+    return cv_hash(model), model
+
+
+def show_downloads(stem: str, page: dict, view, cv_key: str) -> None:
+    """
+    HTML download plus PDF/DOCX exports, all served as bytes. An export is
+    built on first request and cached, so later reruns just offer it.
+    """
+    formats = available_formats()
+    cols = st.columns(1 + len(formats))
+    cols[0].download_button(
+        "📥 Download HTML", data=page["bytes"], file_name=f"{stem}.html",
+        mime="text/html", key=f"{stem}_html", use_container_width=True,
+    )
+    for col, fmt in zip(cols[1:], formats):
+        spec = FORMATS[fmt]
+        data = EXPORTER.cached(fmt, page["html"], cv_key)
+        with col:
+            if data is None and st.button(f"⚙️ Build {spec['label']}", key=f"{stem}_{fmt}_build", use_container_width=True):
+                with st.spinner(f"Rendering {spec['label']}…"):
+                    try:
+                        data = EXPORTER.export(fmt, page["html"], view, cv_key)
+                    except Exception as e:
+                        st.error(f"❌ {spec['label']} export failed: {e}")
+            if data is not None:
+                st.download_button(
+                    f"📥 Download {spec['label']}", data=data, file_name=f"{stem}.{spec['extension']}",
+                    mime=spec["mime"], key=f"{stem}_{fmt}", use_container_width=True,
+                )
+    if not formats:
+        st.caption("PDF / Word downloads need `pip install weasyprint python-docx` — or print the HTML to PDF.")
+
+
+def show_template_gallery(cv_key: str, prepared) -> None:
+    tabs = st.tabs([name.split(" (")[0] for name in TEMPLATE_OPTIONS])
+    rendered = RENDER_CACHE.render_all(prepared, TEMPLATE_OPTIONS, cv_key=cv_key)
+    for tab, page in zip(tabs, rendered.values()):
+        with tab:
+            components.html(page["html"], height=750, scrolling=True)
+
+
+# ─────────────────────────────────────────────────────
+# BACKGROUND JOBS — LLM calls run off the script thread
+# ─────────────────────────────────────────────────────
+def cv_job(method: str, payload):
+    """Read the profile (PDF bytes / URL / text), then stream the extraction — each partial CV is yielded."""
+    if method == "pdf":
+        # Long PDFs: stop reading pages once the prompt budget is full
+        raw_text = extract_pdf_text(payload, parallel=True, max_tokens=input_token_budget())
+    elif method == "url":
+        raw_text = scrape_url_text(payload, cache=HTTP_CACHE)
+    else:
+        raw_text = payload
+    if not raw_text or len(raw_text.strip()) < 50:
+        raise ValueError("Not enough text extracted. Please try another input method.")
+    yield from stream_extract_base_cv(
+        raw_text, GEMINI_KEY, GROQ_KEY, is_url=method == "url", cache=RESPONSE_CACHE, index=CV_INDEX
+    )
+
+
+def ats_job(cv: dict, jd: str, progress) -> dict:
+    finished = []
+
+    def on_section(name, section):
+        # Sub-requests finish independently — show which are in
+        finished.append(name)
+        progress(list(finished))
+
+    return analyze_and_tailor_cv_parallel(
+        cv, jd, GEMINI_KEY, GROQ_KEY, cache=RESPONSE_CACHE, on_section=on_section,
+    )
+
+
+def start_job(kind: str, fn, *args, **kwargs) -> None:
+    """Submit fn as this session's `kind` job; a still-running one of that kind is cancelled."""
+    st.session_state.job_errors.pop(kind, None)
+    try:
+        st.session_state.jobs[kind] = JOBS.submit(
+            fn, *args, kind=kind, owner=st.session_state.session_id, **kwargs
+        )
+    except RuntimeError as e:
+        st.session_state.job_errors[kind] = str(e)
+
+
+def collect_jobs() -> None:
+    """Move results of finished jobs into session state (start of every run)."""
+    for kind, job_id in list(st.session_state.jobs.items()):
+        job = JOBS.get(job_id)
+        if job is not None and job["state"] in ACTIVE_STATES:
+            continue
+        del st.session_state.jobs[kind]
+        JOBS.forget(job_id)
+        if job is None or job["state"] == "cancelled":
+            continue
+        if job["state"] == "failed" or not job["result"]:
+            st.session_state.job_errors[kind] = job["error"] or "No result was produced. Please try again."
+        elif kind == "cv":
+            st.session_state.base_cv         = session_cv(job["result"])
+            st.session_state.analysis_result = None  # reset previous ATS run
+            st.session_state.tailored_cv     = None
+            for other in list(st.session_state.jobs):  # they were started for the previous CV
+                JOBS.cancel(st.session_state.jobs.pop(other))
+            st.toast("✅ CV generated! Scroll down to preview and download.")
+        elif kind == "ats":
+            analysis = dict(job["result"])
+            tailored = analysis.pop("tailored_cv", None)
+            st.session_state.analysis_result = analysis
+            st.session_state.tailored_cv     = session_cv(tailored) if tailored else None
+            st.toast("✅ Analysis complete!")
+        else:
+            st.session_state[kind] = job["result"]
+
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def watch_job(kind: str) -> None:
+    """Status box of a running job; reruns the whole app once it has finished."""
+    job_id = st.session_state.jobs.get(kind)
+    job    = JOBS.get(job_id) if job_id else None
+    if job is None or job["state"] not in ACTIVE_STATES:
+        st.rerun(scope="app")
+
+    label = JOB_KINDS[kind]["label"]
+    if job["state"] == "queued":
+        st.info(f"⏳ {label} — waiting for a free AI slot ({job['waited']:.0f}s)…")
+    else:
+        st.info(f"{label}… ({job['elapsed']:.0f}s)")
+    if kind == "cv" and job["partial"]:
+        components.html(render_cv(selected_template, job["partial"]), height=750, scrolling=True)
+    elif kind == "ats" and job["partial"]:
+        st.caption("Finished: " + ", ".join(job["partial"]) + " — writing the rest of the tailored CV…")
+    if st.button("✖ Cancel", key=f"{kind}_cancel"):
+        JOBS.cancel(job_id)
+        st.session_state.jobs.pop(kind, None)
+        st.rerun(scope="app")
+
+
+def show_job(kind: str) -> None:
+    """Where a job's button lives: its last error, or its live status while it runs."""
+    error = st.session_state.job_errors.pop(kind, None)
+    if error:
+        st.error(f"{JOB_KINDS[kind]['failed']}: {error}")
+    if kind in st.session_state.jobs:
+        watch_job(kind)
+
+
+collect_jobs()
 
 
 # ─────────────────────────────────────────────────────
@@ -145,77 +402,54 @@ with st.expander("📄 **STEP 1 — Upload Your Profile / CV**", expanded=True):
         generate_btn = st.button("⚡ Generate CV", type="primary", use_container_width=True)
 
     if generate_btn:
-        raw_text = None
-        is_url   = False
-        try:
-            with st.spinner("🔍 Extracting profile data…"):
-                if input_method == "📄 Upload CV (PDF)":
-                    if not uploaded_file:
-                        st.error("❌ Please upload a PDF file first.")
-                        st.stop()
-                    raw_text = extract_pdf_text(uploaded_file)
-
-                elif input_method == "🔗 Enter Profile URL (LinkedIn / Portfolio)":
-                    if not url_input:
-                        st.error("❌ Please enter a URL.")
-                        st.stop()
-                    raw_text = scrape_url_text(url_input)
-                    is_url   = True
-
-                else:
-                    if not pasted_text:
-                        st.error("❌ Please paste your profile text.")
-                        st.stop()
-                    raw_text = pasted_text
-
-                if not raw_text or len(raw_text.strip()) < 50:
-                    st.error("❌ Not enough text extracted. Please try another input method.")
-                    st.stop()
-
-            with st.spinner("🧠 AI is building your professional CV…"):
-                st.session_state.base_cv_data  = extract_base_cv(
-                    raw_text, GEMINI_KEY, GROQ_KEY, is_url=is_url
-                )
-                st.session_state.analysis_result = None  # reset previous ATS run
+        if input_method == "📄 Upload CV (PDF)":
+            if not uploaded_file:
+                st.error("❌ Please upload a PDF file first.")
+                st.stop()
+            # Read the upload here — the job outlives this run's UploadedFile
+            start_job("cv", cv_job, "pdf", uploaded_file.getvalue())
 
-            st.success("✅ CV generated! Scroll down to preview and download.")
+        elif input_method == "🔗 Enter Profile URL (LinkedIn / Portfolio)":
+            if not url_input:
+                st.error("❌ Please enter a URL.")
+                st.stop()
+            start_job("cv", cv_job, "url", url_input)
+
+        else:
+            if not pasted_text:
+                st.error("❌ Please paste your profile text.")
+                st.stop()
+            start_job("cv", cv_job, "text", pasted_text)
 
-        except Exception as e:
-            st.error(f"❌ Error: {e}")
+    show_job("cv")
 
 
 # ─────────────────────────────────────────────────────
 # STEP 1 RESULT — CV PREVIEW + DOWNLOAD
 # ─────────────────────────────────────────────────────
-if st.session_state.base_cv_data:
-    cv_data = st.session_state.base_cv_data
+if st.session_state.base_cv:
+    base_key, base_view = st.session_state.base_cv
 
-    if not cv_data.get("name") or cv_data.get("name") == "Candidate":
+    if not base_view.name or base_view.name == "Candidate":
         st.warning("⚠️ Name could not be extracted. CV was still generated with available data.")
 
     st.markdown("### 👀 Your Professional CV Preview")
 
     col1, col2, col3 = st.columns(3)
-    skills_count = len([s for s in cv_data.get("skills", "").split(",") if s.strip()])
     with col1:
-        st.info(f"**👤 Name:** {cv_data.get('name', 'N/A')}")
+        st.info(f"**👤 Name:** {base_view.name or 'N/A'}")
     with col2:
-        st.info(f"**🛠️ Skills Found:** {skills_count}")
+        st.info(f"**🛠️ Skills Found:** {len(base_view.skills)}")
     with col3:
-        st.info(f"**🚀 Projects:** {'Yes ✅' if cv_data.get('projects') else 'None found'}")
-
-    base_html = render_cv(selected_template, cv_data)
-    components.html(base_html, height=750, scrolling=True)
-
-    b64 = base64.b64encode(base_html.encode()).decode()
-    st.markdown(
-        f'<a href="data:text/html;base64,{b64}" download="CareerForge_CV.html" '
-        f'style="display:inline-block;padding:12px 28px;background:#1e3a8a;color:white;'
-        f'text-decoration:none;border-radius:8px;font-weight:700;font-size:15px;'
-        f'width:100%;text-align:center;margin-top:8px;">'
-        f'📥 Download CV (HTML — Print to PDF)</a>',
-        unsafe_allow_html=True,
-    )
+        st.info(f"**🚀 Projects:** {'Yes ✅' if base_view.projects else 'None found'}")
+
+    base_page = RENDER_CACHE.render(selected_template, base_view, cv_key=base_key)
+    if show_gallery:
+        show_template_gallery(base_key, base_view)
+    else:
+        components.html(base_page["html"], height=750, scrolling=True)
+
+    show_downloads("CareerForge_CV", base_page, base_view, base_key)
 
     st.markdown("---")
 
@@ -232,6 +466,17 @@ if st.session_state.base_cv_data:
             value=st.session_state.jd_text,
             placeholder="Paste the full JD from LinkedIn, Naukri, Indeed…",
         )
+        if jd_input and len(jd_input.strip()) >= 100:
+            # Local keyword scoring — instant, no AI call
+            quick = score_cv(base_view.to_dict(), jd_input)
+            q_col1, q_col2 = st.columns([1, 3])
+            q_col1.metric("⚡ Instant ATS Score", f"{quick['old_ats_score']}%")
+            if quick["missing_keywords"]:
+                q_col2.markdown(
+                    "**Missing JD keywords:** " + ", ".join(f"`{kw}`" for kw in quick["missing_keywords"])
+                )
+            q_col2.caption("Keyword-based estimate. Run the deep analysis for a tailored CV.")
+
         ats_btn = st.button("🔬 Run Deep ATS Analysis", type="primary")
 
         if ats_btn:
@@ -239,14 +484,9 @@ if st.session_state.base_cv_data:
                 st.error("❌ Please paste a full Job Description (at least a few sentences).")
             else:
                 st.session_state.jd_text = jd_input
-                with st.spinner("🧠 Analysing CV against JD…"):
-                    try:
-                        st.session_state.analysis_result = analyze_and_tailor_cv(
-                            cv_data, jd_input, GEMINI_KEY, GROQ_KEY
-                        )
-                        st.success("✅ Analysis complete!")
-                    except Exception as e:
-                        st.error(f"❌ ATS Analysis failed: {e}")
+                start_job("ats", ats_job, base_view.to_dict(), jd_input, with_progress=True)
+
+        show_job("ats")
 
 
 # ─────────────────────────────────────────────────────
@@ -254,7 +494,6 @@ if st.session_state.base_cv_data:
 # ─────────────────────────────────────────────────────
 if st.session_state.analysis_result:
     analysis = st.session_state.analysis_result
-    tailored = analysis.get("tailored_cv", {})
 
     st.markdown("---")
     st.markdown("## 📊 Deep ATS Analysis Report")
@@ -269,6 +508,8 @@ if st.session_state.analysis_result:
     col2.metric("✅ Tailored ATS Score",  f"{new_score}%", f"+{delta}%")
     col3.metric("🚨 Missing Keywords",    str(missing_count))
     col4.metric("🔧 Improvements Made",   str(len(analysis.get("improvements_made", []))))
+    if analysis.get("score_source") == "local":
+        st.caption("Scores are local keyword-match estimates — the AI scoring or review step was unavailable.")
 
     section_scores = analysis.get("section_scores", {})
     if section_scores:
@@ -312,43 +553,38 @@ if st.session_state.analysis_result:
 
     st.markdown("---")
     st.markdown("### 🏆 Your Tailored CV")
-    if tailored:
-        tailored_html = render_cv(selected_template, tailored)
-        components.html(tailored_html, height=750, scrolling=True)
-        b64_t = base64.b64encode(tailored_html.encode()).decode()
-        st.markdown(
-            f'<a href="data:text/html;base64,{b64_t}" download="CareerForge_Tailored_CV.html" '
-            f'style="display:inline-block;padding:12px 28px;background:#0d9488;color:white;'
-            f'text-decoration:none;border-radius:8px;font-weight:700;font-size:15px;'
-            f'width:100%;text-align:center;margin-top:8px;">'
-            f'📥 Download Tailored CV</a>',
-            unsafe_allow_html=True,
-        )
+    if st.session_state.tailored_cv:
+        tailored_key, tailored_view = st.session_state.tailored_cv
+        tailored_page = RENDER_CACHE.render(selected_template, tailored_view, cv_key=tailored_key)
+        if show_gallery:
+            show_template_gallery(tailored_key, tailored_view)
+        else:
+            components.html(tailored_page["html"], height=750, scrolling=True)
+        show_downloads("CareerForge_Tailored_CV", tailored_page, tailored_view, tailored_key)
     else:
         st.error("❌ Tailored CV could not be generated. Please run the analysis again.")
 
     st.markdown("---")
     st.markdown("## 🚀 Career Tools")
     saved_jd = st.session_state.get("jd_text", "")
+    _, career_cv = st.session_state.tailored_cv or st.session_state.base_cv
 
     col_cl, col_prep = st.columns(2)
 
     with col_cl:
         st.markdown("### ✉️ Cover Letter")
         if st.button("Generate Cover Letter", use_container_width=True):
-            with st.spinner("Writing your cover letter…"):
-                try:
-                    tv = json.dumps(tailored or cv_data)
-                    cl_prompt = (
-                        "Write a professional cover letter (3 paragraphs) based ONLY on the candidate's "
-                        "actual CV and the target JD. No fake facts.\n\n"
-                        f"CV: {tv[:4000]}\nJD: {saved_jd[:4000]}"
-                    )
-                    st.session_state.cover_letter = generate_with_fallback(
-                        cl_prompt, GEMINI_KEY, GROQ_KEY, temp=0.4
-                    )
-                except Exception as e:
-                    st.error(f"Failed: {e}")
+            tv = json.dumps(career_cv.to_dict())
+            cl_prompt = (
+                "Write a professional cover letter (3 paragraphs) based ONLY on the candidate's "
+                "actual CV and the target JD. No fake facts.\n\n"
+                f"CV: {tv[:4000]}\nJD: {saved_jd[:4000]}"
+            )
+            start_job(
+                "cover_letter", generate_with_fallback,
+                cl_prompt, GEMINI_KEY, GROQ_KEY, temp=0.4,
+            )
+        show_job("cover_letter")
 
         if st.session_state.cover_letter:
             st.text_area("Your Cover Letter:", st.session_state.cover_letter, height=380)
@@ -356,21 +592,19 @@ if st.session_state.analysis_result:
     with col_prep:
         st.markdown("### 🎤 Interview Prep")
         if st.button("Generate Interview Questions", use_container_width=True):
-            with st.spinner("Preparing questions based on your gaps…"):
-                try:
-                    missing_kw = ", ".join(analysis.get("missing_keywords", []))
-                    tv = json.dumps(tailored or cv_data)
-                    ip_prompt = (
-                        f"Generate 5 targeted interview questions for this candidate. "
-                        f"Focus on skill gaps: {missing_kw}\n"
-                        "Format: **Q[N]: [Question]** *Answer Strategy:* [How to answer]\n\n"
-                        f"CV: {tv[:3000]}\nJD: {saved_jd[:3000]}"
-                    )
-                    st.session_state.interview_prep = generate_with_fallback(
-                        ip_prompt, GEMINI_KEY, GROQ_KEY, temp=0.4
-                    )
-                except Exception as e:
-                    st.error(f"Failed: {e}")
+            missing_kw = ", ".join(analysis.get("missing_keywords", []))
+            tv = json.dumps(career_cv.to_dict())
+            ip_prompt = (
+                f"Generate 5 targeted interview questions for this candidate. "
+                f"Focus on skill gaps: {missing_kw}\n"
+                "Format: **Q[N]: [Question]** *Answer Strategy:* [How to answer]\n\n"
+                f"CV: {tv[:3000]}\nJD: {saved_jd[:3000]}"
+            )
+            start_job(
+                "interview_prep", generate_with_fallback,
+                ip_prompt, GEMINI_KEY, GROQ_KEY, temp=0.4,
+            )
+        show_job("interview_prep")
 
         if st.session_state.interview_prep:
             st.markdown(st.session_state.interview_prep)
@@ -0,0 +1,68 @@
+"""
+benchmarks/_cv_samples.py
+=========================
+Deterministic synthetic CVs in the shape the extraction model returns,
+scaled by number of roles and skills.
+
+make_cv() gives the raw LLM JSON (structured lists — what to_html and
+clean_and_parse_json receive); normalised() gives the HTML-string dict the
+templates render after _normalise_base_cv.
+"""
+
+import copy
+import json
+import random
+
+from core.ai_engine import _normalise_base_cv
+
+_TITLES    = ["Data Engineer", "Senior Software Engineer", "ML Engineer", "Tech Lead", "Analytics Engineer"]
+_COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Hooli", "Stark Industries"]
+_VERBS     = ["Built", "Led", "Reduced", "Designed", "Migrated", "Automated", "Scaled"]
+_OBJECTS   = [
+    "Spark pipelines processing 2 TB/day",
+    "a team of five engineers across two time zones",
+    "warehouse cost by 30% through partition pruning",
+    "a feature store serving 40 models",
+    "CI/CD for 25 microservices on Kubernetes",
+    "the on-call rotation and incident reviews",
+]
+_SKILLS = [
+    "Python", "SQL", "Spark", "Airflow", "Kafka", "AWS", "GCP", "Docker", "Kubernetes", "dbt",
+    "Terraform", "PostgreSQL", "Snowflake", "Pandas", "NumPy", "PyTorch", "FastAPI", "Go",
+]
+
+
+def make_cv(roles: int, skills: int, bullets: int = 4, seed: int = 0) -> dict:
+    """Raw extraction JSON for a CV with the given number of roles and skills."""
+    rnd = random.Random(seed * 1_000_003 + roles * 1_009 + skills)
+    return {
+        "name": "Priya Sharma",
+        "headline": "Senior Data Engineer | Python · Spark · AWS",
+        "summary": "Data engineer building batch and streaming pipelines at scale.",
+        "contact": "priya@example.com | +91 98765 43210 | linkedin.com/in/priya | github.com/priya | Bengaluru, India",
+        "skills": [f"{_SKILLS[i % len(_SKILLS)]} {i // len(_SKILLS) or ''}".strip() for i in range(skills)],
+        "experience": [
+            {
+                "title": rnd.choice(_TITLES),
+                "company": f"{rnd.choice(_COMPANIES)} {r}",
+                "dates": f"{2000 + r % 24} – {2001 + r % 24}",
+                "bullets": [f"{rnd.choice(_VERBS)} {rnd.choice(_OBJECTS)}" for _ in range(bullets)],
+            }
+            for r in range(roles)
+        ],
+        "projects": [
+            {"title": f"Project {p} | Spark, Delta", "bullets": [f"{rnd.choice(_VERBS)} {rnd.choice(_OBJECTS)}"]}
+            for p in range(max(1, roles // 3))
+        ],
+        "education": [{"degree": "B.Tech Computer Science", "institution": "IIT Bombay", "year": 2014}],
+        "certificates": [f"AWS Certification {c} — Amazon ({2015 + c})" for c in range(max(1, roles // 5))],
+    }
+
+
+def llm_response(cv: dict) -> str:
+    """The CV as the model would print it (pretty JSON)."""
+    return json.dumps(cv, ensure_ascii=False, indent=2)
+
+
+def normalised(cv: dict) -> dict:
+    return _normalise_base_cv(copy.deepcopy(cv))
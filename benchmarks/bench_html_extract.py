@@ -0,0 +1,80 @@
+"""
+benchmarks/bench_html_extract.py
+================================
+Profile-page extraction: BeautifulSoup tree (_extract_from_html) vs. the
+bounded streaming parser (_extract_from_chunks).
+
+Corpus = synthetic profile pages shaped like modern SPAs (megabytes of
+inline JS/JSON state around a little visible text), plus any saved pages
+(*.html) in a folder passed on the command line. Every page is checked for
+identical output; the streaming path is fed HTML_CHUNK_BYTES pieces the way
+scrape_url_text reads a response.
+
+Usage:
+    python -m benchmarks.bench_html_extract [saved_pages_dir]
+"""
+
+import glob
+import os
+import sys
+import time
+
+from core.scraper import HTML_CHUNK_BYTES, _extract_from_chunks, _extract_from_html
+
+
+def _profile_page(script_kb: int, og: bool = True) -> str:
+    head = ["<!DOCTYPE html><html><head><title>Priya Sharma | Data Engineer</title>"]
+    if og:
+        head.append(
+            "<meta property='og:title' content='Priya Sharma'>"
+            "<meta property='og:description' content='Data Engineer at Acme &amp; Co'>"
+        )
+    state  = ('{"k":"' + "x" * 1000 + '"},') * script_kb
+    script = "<script>window.__STATE__=[" + state + "0];</script>"
+    head.append(script + "<style>" + ".c{color:red}" * 500 + "</style></head><body>")
+    body = "".join(
+        f"<section><h2>Role {i}</h2><p>Built Spark pipelines processing 2 TB/day for team {i}.</p>"
+        f"<ul><li>Reduced cost by 30%</li><li>Led five engineers</li></ul></section>"
+        for i in range(120)
+    )
+    return "".join(head) + body + script + "</body></html>"
+
+
+def _chunks(text: str, consumed: list):
+    for start in range(0, len(text), HTML_CHUNK_BYTES):
+        chunk = text[start : start + HTML_CHUNK_BYTES]
+        consumed[0] += len(chunk)
+        yield chunk
+
+
+def _time(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000   # ms per page
+
+
+def main(saved_dir: str = None) -> None:
+    corpus = [
+        ("spa_200kb", _profile_page(200)),
+        ("spa_2mb", _profile_page(2000)),
+        ("spa_2mb_no_og", _profile_page(2000, og=False)),
+    ]
+    if saved_dir:
+        for path in sorted(glob.glob(os.path.join(saved_dir, "*.html"))):
+            with open(path, encoding="utf-8", errors="replace") as f:
+                corpus.append((os.path.basename(path), f.read()))
+
+    print(f"{'page':<22}{'size':>10}{'bs4 ms':>10}{'stream ms':>11}{'read':>8}{'same':>6}")
+    for label, html in corpus:
+        consumed = [0]
+        same = _extract_from_html(html) == _extract_from_chunks(_chunks(html, consumed))
+        repeat = 3 if len(html) > 1_000_000 else 10
+        old = _time(lambda: _extract_from_html(html), repeat)
+        new = _time(lambda: _extract_from_chunks(_chunks(html, [0])), repeat)
+        read = consumed[0] / len(html) if html else 1.0
+        print(f"{label:<22}{len(html):>10,}{old:>10.1f}{new:>11.1f}{read:>8.0%}{'yes' if same else 'NO':>6}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
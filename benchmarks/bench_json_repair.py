@@ -0,0 +1,110 @@
+"""
+benchmarks/bench_json_repair.py
+===============================
+clean_and_parse_json over a corpus of malformed LLM responses.
+
+Corpus = real responses saved as *.txt in a folder passed on the command
+line, plus synthetic variants of well-formed responses covering the failure
+modes we see in production: MAX_TOKENS truncation at every ~5% of the
+output, markdown fences, chatter before/after the object, trailing commas.
+
+Limitation: no recorded responses ship with the repo, so without a folder
+the numbers come from the synthetic variants alone. Those are clean cuts of
+one sample CV; real failures also mix slips (a truncated answer with a
+trailing comma, unescaped quotes inside HTML) that these don't exercise.
+Save failing responses from the logs and pass their folder before drawing
+conclusions from the recovered-field totals.
+
+Reports per variant: fields recovered vs. the old all-or-nothing parser,
+and parse time (fast path vs. repair path).
+
+Usage:
+    python -m benchmarks.bench_json_repair [saved_responses_dir]
+"""
+
+import glob
+import json
+import os
+import sys
+import time
+
+from core.ai_engine import BASE_CV_KEYS, extract_json_string, clean_and_parse_json
+
+SAMPLE_CV = {
+    "name": "Priya Sharma",
+    "headline": "Data Engineer | Python · Spark · AWS",
+    "summary": "Data engineer with 5 years building batch and streaming pipelines.",
+    "contact": "priya@example.com | +91-9876543210 | linkedin.com/in/priya | Pune, India",
+    "skills": "Python, SQL, Spark, Airflow, Kafka, AWS, Docker, dbt",
+    "experience": "".join(
+        f"<p><b>Data Engineer at Company {i} (20{10 + i} – 20{11 + i})</b></p>"
+        "<ul><li>Built Spark pipelines processing 2 TB/day</li>"
+        "<li>Cut warehouse cost 30% by partition pruning</li></ul>"
+        for i in range(6)
+    ),
+    "projects": "<p><b>Lakehouse Migration | Delta, Spark</b></p><ul><li>Moved 40 tables</li></ul>",
+    "education": "<p><b>B.Tech, IIT Bombay</b><br>2014 | CGPA 8.6</p>",
+    "certificates": "<p><b>AWS Data Analytics</b> — Amazon (2022)</p>",
+}
+
+
+def _variants(clean: str) -> list:
+    """(label, text) pairs derived from one well-formed response."""
+    out = [
+        ("well_formed", clean),
+        ("fenced", f"```json\n{clean}\n```"),
+        ("chatter", f"Here is the CV you asked for:\n{clean}\nLet me know if you need changes!"),
+        ("trailing_comma", clean[:-1] + ",}"),
+    ]
+    for pct in range(5, 100, 5):
+        out.append((f"truncated_{pct:02d}%", clean[: len(clean) * pct // 100]))
+    return out
+
+
+def _old_parse(text: str) -> int:
+    """Fields the pre-repair parser recovered (all or nothing)."""
+    try:
+        parsed = json.loads(extract_json_string(text))
+        return len([k for k in BASE_CV_KEYS if k in parsed])
+    except Exception:
+        return 0
+
+
+def _new_parse(text: str) -> int:
+    result = clean_and_parse_json(text)
+    missing = set(result.get("_missing_fields", []))
+    if result.get("experience", "").startswith("<p><b>Extraction Error"):
+        return 0
+    return len([k for k in BASE_CV_KEYS if k not in missing])
+
+
+def _time(fn, text: str, repeat: int = 200) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(text)
+    return (time.perf_counter() - start) / repeat * 1e6   # µs per parse
+
+
+def main(saved_dir: str = None) -> None:
+    corpus = _variants(json.dumps(SAMPLE_CV, ensure_ascii=False, indent=2))
+    if saved_dir:
+        for path in sorted(glob.glob(os.path.join(saved_dir, "*.txt"))):
+            with open(path, encoding="utf-8") as f:
+                corpus.append((os.path.basename(path), f.read()))
+
+    print(f"{'variant':<22}{'old fields':>11}{'new fields':>11}{'new µs':>10}")
+    old_total = new_total = 0
+    for label, text in corpus:
+        old, new = _old_parse(text), _new_parse(text)
+        old_total += old
+        new_total += new
+        print(f"{label:<22}{old:>11}{new:>11}{_time(clean_and_parse_json, text):>10.1f}")
+
+    possible = len(corpus) * len(BASE_CV_KEYS)
+    print(f"\nfields recovered: old {old_total}/{possible}  new {new_total}/{possible}")
+    if not saved_dir:
+        print("(synthetic variants only — pass a folder of saved responses for real-world failures)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
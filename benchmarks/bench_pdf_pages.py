@@ -0,0 +1,63 @@
+"""
+benchmarks/bench_pdf_pages.py
+=============================
+extract_pdf_text throughput (pages/sec) vs. worker count.
+
+Each run uses a fresh page cache so every page is really extracted; the last
+row re-runs the same file to show the cached path. The "budget" rows read
+pages lazily and stop at BUDGET_TOKENS (what extract_base_cv can use), one
+page at a time and in max_workers-page waves on the pool (what the app does).
+
+Usage:
+    python -m benchmarks.bench_pdf_pages [pages] [max_workers]
+"""
+
+import io
+import sys
+import time
+
+from benchmarks._pdf_samples import make_pdf
+from core import scraper
+
+BUDGET_TOKENS = 8000
+
+
+def _run(data: bytes, parallel: bool, workers: int) -> float:
+    start = time.perf_counter()
+    scraper.extract_pdf_text(io.BytesIO(data), parallel=parallel, max_workers=workers)
+    return time.perf_counter() - start
+
+
+def main(pages: int = 24, max_workers: int = 4) -> None:
+    data = make_pdf(pages)
+    serial_text = None
+
+    print(f"{pages}-page sample PDF")
+    print(f"{'mode':<14}{'seconds':>10}{'pages/sec':>12}")
+    for workers in range(1, max_workers + 1):
+        scraper._page_cache.clear()
+        elapsed = _run(data, workers > 1, workers)
+        label = "serial" if workers == 1 else f"{workers} workers"
+        print(f"{label:<14}{elapsed:>10.3f}{pages / elapsed:>12.1f}")
+
+        text = scraper.extract_pdf_text(io.BytesIO(data))
+        serial_text = serial_text or text
+        assert text == serial_text, "parallel output differs from serial"
+
+    elapsed = _run(data, True, max_workers)
+    print(f"{'cached':<14}{elapsed:>10.3f}{pages / elapsed:>12.1f}")
+
+    budget_text = None
+    for label, parallel in (("budget", False), ("budget ‖", True)):
+        scraper._page_cache.clear()
+        start = time.perf_counter()
+        text = scraper.extract_pdf_text(io.BytesIO(data), parallel=parallel, max_workers=max_workers, max_tokens=BUDGET_TOKENS)
+        elapsed = time.perf_counter() - start
+        budget_text = budget_text or text
+        assert text == budget_text, "parallel budgeted output differs from serial"
+        print(f"{label:<14}{elapsed:>10.3f}{'':>12}  ({len(text):,} of {len(serial_text):,} chars)")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,82 @@
+"""
+benchmarks/bench_scrape_urls.py
+===============================
+Bulk URL scraping throughput: sequential scrape_url_text() vs. scrape_urls().
+
+A local ThreadingHTTPServer per "host" serves a small profile page after
+LATENCY seconds, so the numbers reflect waiting on the network rather than
+parsing. Warm-up is disabled (no LinkedIn round-trip).
+
+Usage:
+    python -m benchmarks.bench_scrape_urls [urls] [hosts] [latency_s]
+"""
+
+import asyncio
+import http.server
+import sys
+import threading
+import time
+
+from core import scraper
+from core.sessions import SESSIONS
+
+PAGE = (
+    "<html><head><title>Jane Doe</title>"
+    "<meta property='og:title' content='Jane Doe - Data Engineer'></head>"
+    "<body><p>" + "Built Spark pipelines and led a team of five engineers. " * 20 + "</p></body></html>"
+).encode("utf-8")
+
+
+def _serve(latency: float) -> str:
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(PAGE)))
+            self.end_headers()
+            self.wfile.write(PAGE)
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+async def _bulk(urls: list, per_host: int, delay: float) -> list:
+    out = []
+    async for index, url, text in scraper.scrape_urls(urls, per_host=per_host, delay=delay):
+        out.append((index, text))
+    return out
+
+
+def main(n_urls: int = 40, n_hosts: int = 4, latency: float = 0.2) -> None:
+    SESSIONS.configure(warmup_url="")
+    bases = [_serve(latency) for _ in range(n_hosts)]
+    urls = [f"{bases[i % n_hosts]}/in/jane-doe-{i}" for i in range(n_urls)]
+
+    print(f"{n_urls} URLs over {n_hosts} hosts, {latency * 1000:.0f} ms injected latency")
+    print(f"{'mode':<30}{'seconds':>9}{'urls/sec':>10}")
+
+    start = time.perf_counter()
+    expected = [scraper.scrape_url_text(url) for url in urls]
+    elapsed = time.perf_counter() - start
+    print(f"{'sequential':<30}{elapsed:>9.2f}{n_urls / elapsed:>10.1f}")
+
+    for per_host, delay in ((2, 0.0), (4, 0.0), (4, 0.05)):
+        start = time.perf_counter()
+        results = asyncio.run(_bulk(urls, per_host, delay))
+        elapsed = time.perf_counter() - start
+        label = f"scrape_urls host={per_host} delay={delay:g}"
+        print(f"{label:<30}{elapsed:>9.2f}{n_urls / elapsed:>10.1f}")
+        assert [text for _, text in sorted(results)] == expected, "bulk results differ from sequential"
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:4]
+    main(*(int(a) for a in args[:2]), *(float(a) for a in args[2:3]))
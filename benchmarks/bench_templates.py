@@ -0,0 +1,67 @@
+"""
+benchmarks/bench_templates.py
+=============================
+render_cv() throughput per template on a small and a very large CV.
+
+"small" is a typical one-page CV; "large" has 40 roles with 8 bullets each,
+300 skills and long education/certificate/project lists. Each row also
+shows how much of a render is building the CVModel (shared by every template)
+versus filling the compiled template, and what render_all() saves when
+every template is rendered for the same CV (the gallery view).
+
+Usage:
+    python -m benchmarks.bench_templates [seconds_per_row]
+"""
+
+import sys
+import time
+
+from templates.cv_styles import TEMPLATES, prepare_cv, render_all, render_cv
+
+
+def _cv(roles: int, bullets: int, skills: int, extras: int) -> dict:
+    return {
+        "name": "Priya Sharma",
+        "headline": "Senior Data Engineer",
+        "contact": "priya@example.com | +91 98765 43210 | linkedin.com/in/priya | Bengaluru, India",
+        "skills": [f"Skill {i}" for i in range(skills)],
+        "experience": [
+            f"<b>Data Engineer — Company {r} (2015 - 2023)</b>"
+            + "<ul>" + "".join(f"<li>Built pipeline {b} processing 2 TB/day with Spark</li>" for b in range(bullets)) + "</ul>"
+            for r in range(roles)
+        ],
+        "education": [{"degree": f"B.Tech {i}", "institution": "IIT Delhi", "year": 2015} for i in range(extras)],
+        "certificates": [f"Certificate {i}" for i in range(extras)],
+        "projects": [f"<b>Project {i}</b><ul><li>Shipped feature {i}</li></ul>" for i in range(extras)],
+    }
+
+
+def _rate(fn, seconds: float) -> float:
+    n, start = 0, time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        fn()
+        n += 1
+    return n / (time.perf_counter() - start)
+
+
+def main(seconds: float = 0.5) -> None:
+    cvs = {
+        "small": _cv(roles=3, bullets=4, skills=12, extras=2),
+        "large": _cv(roles=40, bullets=8, skills=300, extras=25),
+    }
+    print(f"{'template':<46}{'cv':<7}{'KB':>7}{'renders/s':>11}{'fill/s':>10}")
+    for size, data in cvs.items():
+        prepared = prepare_cv(data)
+        for name, template in TEMPLATES.items():
+            kb = len(render_cv(name, data).encode("utf-8")) / 1024
+            full = _rate(lambda: render_cv(name, data), seconds)
+            fill = _rate(lambda: template.render(prepared), seconds)
+            print(f"{name:<46}{size:<7}{kb:>7.1f}{full:>11,.0f}{fill:>10,.0f}")
+        print(f"{'CVModel parse only':<46}{size:<7}{'':>7}{_rate(lambda: prepare_cv(data), seconds):>11,.0f}")
+        each = _rate(lambda: [render_cv(name, data) for name in TEMPLATES], seconds)
+        print(f"{'all 7, render_cv each':<46}{size:<7}{'':>7}{each:>11,.0f}")
+        print(f"{'all 7, render_all':<46}{size:<7}{'':>7}{_rate(lambda: render_all(data), seconds):>11,.0f}\n")
+
+
+if __name__ == "__main__":
+    main(*[float(a) for a in sys.argv[1:2]])
@@ -7,16 +7,38 @@ CHANGES from original:
 - Removed st.secrets dependency (now accepts api_keys as params → testable)
 - Added @st.cache_resource on client builders (called from app.py only)
 - Gemini model list is now a constant — easy to update
-- _to_html() handles edge cases better (nested lists, None values)
+- to_html() handles edge cases better (nested lists, None values)
 - clean_and_parse_json() has stricter type enforcement
 - No functional changes — all features preserved
+- Optional response cache (core/cache.py) keyed on prompt/provider/model/temp/max_tokens
+- Provider clients reused via core/clients.py; last working Gemini model tried first
+- agenerate_with_fallback(): asyncio variant that hedges Gemini with Groq after a latency budget
+- stream_extract_base_cv() / stream_analyze_and_tailor_cv(): token streaming with
+  per-field partial results (core/json_stream.py)
+- Circuit breakers + latency-aware routing across providers/models (core/health.py)
+- Prompt inputs compacted to a token budget instead of hard char cuts (core/compaction.py);
+  BudgetedPrompt builds each prompt for the budget of the backend actually called
+- Truncated JSON repaired (core/json_repair.py); only the missing fields are re-requested
+- Optional near-duplicate index (core/dedup.py): re-uploads of a known CV skip extraction
 """
 
+import asyncio
+import copy
+import hashlib
+import itertools
 import json
 import re
+import threading
+import time
 
 import google.generativeai as genai
-from groq import Groq
+
+from core.cache import TieredCache, make_key
+from core.clients import REGISTRY
+from core.compaction import compact_json, compact_text, estimate_tokens
+from core.health import HEALTH
+from core.json_repair import missing_fields, repair_json
+from core.json_stream import IncrementalJSONParser
 
 # ─────────────────────────────────────────────────────
 # CONSTANTS
@@ -32,79 +54,546 @@ GEMINI_MODELS = [
 GROQ_MODEL = "llama-3.3-70b-versatile"
 MAX_TOKENS = 4096
 
+RESPONSE_CACHE_PATH = ".cache/llm_responses.sqlite"
+
+HEDGE_AFTER = 6.0  # seconds to wait for Gemini before also asking Groq
+
+EXTRACTION_ERROR = "Extraction Error"   # heading of the fallback CV when parsing fails
+
+# Prompt token budget per backend, instructions included. Prompts are
+# built per backend (BudgetedPrompt), so Gemini gets its larger budget even
+# when Groq is in the cascade. Groq's 6500 fits what the old 12000 + 8000
+# char cut-offs sent it plus the instructions; no budget leaves the inputs
+# less room than the old limits.
+INPUT_TOKEN_BUDGETS = {
+    **{model: 8000 for model in GEMINI_MODELS},
+    GROQ_MODEL: 6500,
+}
+CV_BUDGET_SHARE = 0.6  # analysis prompt: CV JSON vs JD split of the budget
+
+# The old hard cut-offs (12000 / 8000 chars) at ~3.3 chars per token — the
+# dense end of CV text. split_budget honours them within the budget.
+MIN_INPUT_TOKENS = {"cv": 12000 * 3 // 10, "jd": 8000 * 3 // 10}
+
+BASE_CV_KEYS = [
+    "name", "headline", "summary", "contact", "skills",
+    "experience", "projects", "education", "certificates",
+]
+ANALYSIS_KEYS = [
+    "old_ats_score", "new_ats_score", "missing_keywords", "keyword_match_details",
+    "formatting_issues", "section_scores", "improvements_made",
+    "hallucination_check", "analysis_report", "tailored_cv",
+]
+
+
+# ─────────────────────────────────────────────────────
+# RESPONSE CACHE
+# ─────────────────────────────────────────────────────
+
+def build_response_cache(path: str = RESPONSE_CACHE_PATH, **kwargs) -> TieredCache:
+    """Create the LLM response cache (wrap in @st.cache_resource from app.py)."""
+    return TieredCache(path, **kwargs)
+
+
+def _response_key(prompt, provider: str, model: str, temp: float) -> str:
+    """
+    Content-addressed key: (prompt hash, provider, model, temperature, MAX_TOKENS).
+    A BudgetedPrompt is hashed by its inputs and the model's budget, so
+    probing the cache never builds (compacts) it.
+    """
+    if isinstance(prompt, BudgetedPrompt):
+        prompt_hash = make_key(prompt.digest, input_token_budget(model))
+    else:
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    return make_key(prompt_hash, provider, model, round(float(temp), 4), MAX_TOKENS)
+
+
+def _cache_candidates(prompt, temp: float) -> list:
+    """Keys to probe, in the same order the providers would be tried."""
+    keys = [_response_key(prompt, "gemini", m, temp) for m in GEMINI_MODELS]
+    keys.append(_response_key(prompt, "groq", GROQ_MODEL, temp))
+    return keys
+
+
+def _has_text(text) -> bool:
+    return isinstance(text, str) and bool(text.strip())
+
+
+def _cached_response(cache: TieredCache, prompt, temp: float, validate) -> str:
+    """First cached response for prompt that passes validate, else None."""
+    _, cached = cache.get_any(_cache_candidates(prompt, temp), accept=validate)
+    return cached
+
+
+def _store_response(cache: TieredCache, key: str, text: str, validate) -> None:
+    """Cache only responses that pass validate — a refusal or broken JSON is retried, not replayed."""
+    if cache is not None and validate(text):
+        cache.set(key, text)
+
+
+# ─────────────────────────────────────────────────────
+# INPUT COMPACTION
+# ─────────────────────────────────────────────────────
+
+_compaction_lock   = threading.Lock()
+_compaction_totals = {"calls": 0, "chars_before": 0, "chars_after": 0, "tokens_before": 0, "tokens_after": 0}
+
+
+def input_token_budget(model: str = None) -> int:
+    """Prompt-input tokens for one backend; without a model, the largest (how much input to read)."""
+    if model is not None:
+        return INPUT_TOKEN_BUDGETS[model]
+    return max(INPUT_TOKEN_BUDGETS.values())
+
+
+class BudgetedPrompt:
+    """
+    A prompt whose inputs are compacted to the budget of the backend that
+    is called. build(budget_tokens) -> (prompt, compaction reports) runs
+    lazily, once per budget; *source (template + raw inputs) identifies the
+    prompt for cache keys without building it.
+    Anything that takes a prompt string also takes one of these.
+    """
+
+    def __init__(self, build, *source):
+        self.digest = make_key(*source)
+        self._build = build
+        self._built = {}
+        self._lock  = threading.Lock()
+
+    def for_model(self, model: str) -> str:
+        """The prompt to send to model; its compaction counts towards compaction_stats()."""
+        budget = input_token_budget(model)
+        with self._lock:
+            built = self._built.get(budget)
+            if built is None:
+                built = self._built[budget] = self._build(budget)
+        prompt, reports = built
+        for report in reports:
+            _record_compaction(report)
+        return prompt
+
+    def __add__(self, suffix: str) -> "BudgetedPrompt":
+        def build(budget):
+            prompt, reports = self._build(budget)
+            return prompt + suffix, reports
+        return BudgetedPrompt(build, self.digest, suffix)
+
+
+def _prompt_for(prompt, model: str) -> str:
+    """Text to send to model — only call this when actually sending."""
+    return prompt.for_model(model) if isinstance(prompt, BudgetedPrompt) else prompt
+
+
+def fill_prompt(template: str, **values) -> str:
+    """Substitute {key} placeholders in one pass — inserted text is never rescanned."""
+    return re.sub(
+        r"\{(\w+)\}",
+        lambda m: str(values[m.group(1)]) if m.group(1) in values else m.group(0),
+        template,
+    )
+
+
+def _record_compaction(report: dict) -> None:
+    with _compaction_lock:
+        _compaction_totals["calls"] += 1
+        for key in ("chars_before", "chars_after", "tokens_before", "tokens_after"):
+            _compaction_totals[key] += report[key]
+
+
+def compaction_stats() -> dict:
+    """Cumulative bytes/tokens sent vs. what raw inputs would have cost."""
+    with _compaction_lock:
+        out = dict(_compaction_totals)
+    out["chars_saved"]  = out["chars_before"] - out["chars_after"]
+    out["tokens_saved"] = out["tokens_before"] - out["tokens_after"]
+    return out
+
 
 # ─────────────────────────────────────────────────────
 # API HELPERS  (api keys passed in — no st.secrets here)
 # ─────────────────────────────────────────────────────
 
-def _call_gemini(prompt: str, gemini_api_key: str, temp: float = 0.2) -> str:
-    """Try each Gemini model in order. Returns text on first success."""
-    genai.configure(api_key=gemini_api_key)
+def _is_missing_model(err: Exception) -> bool:
+    """True for 404 / not-found / deprecated model errors (try the next model)."""
+    err_str = str(err).lower()
+    return "404" in err_str or "not found" in err_str or "deprecated" in err_str
+
+
+def _gemini_order(gemini_api_key: str) -> list:
+    """Gemini models with a closed (or probe-ready) circuit, fastest / last working first."""
+    models = REGISTRY.gemini_candidates(gemini_api_key, GEMINI_MODELS)
+    return [model for _, model in HEALTH.rank([("gemini", m) for m in models])]
+
+
+def _provider_order(gemini_api_key: str) -> list:
+    """
+    Providers ordered by their fastest healthy backend.
+    Gemini leads until latencies are known; a provider whose circuits
+    are all open goes last (and fails fast there).
+    """
+    backends = [("gemini", m) for m in _gemini_order(gemini_api_key)] + [("groq", GROQ_MODEL)]
+    order = []
+    for provider, _ in HEALTH.rank(backends):
+        if provider not in order:
+            order.append(provider)
+    return order + [p for p in ("gemini", "groq") if p not in order]
+
+
+def _call_gemini(prompt, gemini_api_key: str, temp: float = 0.2, cache: TieredCache = None, validate=_has_text) -> str:
+    """Try healthy Gemini models (fastest / last working first). Returns text on first success."""
     last_err = None
-    for model_name in GEMINI_MODELS:
+    for model_name in _gemini_order(gemini_api_key):
+        backend = ("gemini", model_name)
+        if not HEALTH.acquire(backend):
+            continue
+        started = time.time()
+        text_in = _prompt_for(prompt, model_name)
         try:
-            model = genai.GenerativeModel(model_name)
+            model = REGISTRY.gemini_model(gemini_api_key, model_name)
             response = model.generate_content(
-                prompt,
+                text_in,
                 generation_config=genai.types.GenerationConfig(
                     temperature=temp,
                     max_output_tokens=MAX_TOKENS,
                 ),
             )
-            return response.text
+            text = response.text
         except Exception as e:
-            err_str = str(e).lower()
-            if "404" in err_str or "not found" in err_str or "deprecated" in err_str:
+            if _is_missing_model(e):
+                HEALTH.release(backend)
+                REGISTRY.mark_missing(gemini_api_key, model_name)
                 last_err = e
                 continue          # try next model
+            HEALTH.record_failure(backend, time.time() - started)
             raise e               # surface real errors immediately
+        HEALTH.record_success(backend, time.time() - started)
+        REGISTRY.mark_success(gemini_api_key, model_name)
+        _store_response(cache, _response_key(prompt, "gemini", model_name, temp), text, validate)
+        return text
+    if last_err is None:
+        raise Exception("All Gemini models unavailable (circuit open).")
     raise Exception(f"All Gemini models failed. Last error: {last_err}")
 
 
-def _call_groq(prompt: str, groq_api_key: str, temp: float = 0.2) -> str:
+def _call_groq(prompt, groq_api_key: str, temp: float = 0.2, cache: TieredCache = None, validate=_has_text) -> str:
     """Groq fallback using Llama 3.3 70B."""
-    client = Groq(api_key=groq_api_key)
-    response = client.chat.completions.create(
-        messages=[{"role": "user", "content": prompt}],
-        model=GROQ_MODEL,
-        temperature=temp,
-        max_tokens=MAX_TOKENS,
-    )
-    return response.choices[0].message.content
+    backend = ("groq", GROQ_MODEL)
+    if not HEALTH.acquire(backend):
+        raise Exception("Groq unavailable (circuit open).")
+    started = time.time()
+    text_in = _prompt_for(prompt, GROQ_MODEL)
+    try:
+        client = REGISTRY.groq(groq_api_key)
+        response = client.chat.completions.create(
+            messages=[{"role": "user", "content": text_in}],
+            model=GROQ_MODEL,
+            temperature=temp,
+            max_tokens=MAX_TOKENS,
+        )
+        text = response.choices[0].message.content
+    except Exception:
+        HEALTH.record_failure(backend, time.time() - started)
+        raise
+    HEALTH.record_success(backend, time.time() - started)
+    _store_response(cache, _response_key(prompt, "groq", GROQ_MODEL, temp), text, validate)
+    return text
 
 
 def generate_with_fallback(
-    prompt: str,
+    prompt,
     gemini_api_key: str,
     groq_api_key: str,
     temp: float = 0.2,
+    cache: TieredCache = None,
+    validate=_has_text,
 ) -> str:
     """
-    Try Gemini first, fall back to Groq.
+    Try the fastest healthy provider first (Gemini by default), fall back to the other.
+    prompt is a string or a BudgetedPrompt (built for each backend tried).
+    If a cache is given, an identical earlier prompt is served from it.
+    validate(text) -> bool gates the cache both ways: only responses that
+    pass are stored, and a cached value that fails is treated as a miss.
     Raises Exception only if BOTH fail.
     """
-    gemini_error = None
+    if cache is not None:
+        cached = _cached_response(cache, prompt, temp, validate)
+        if cached is not None:
+            return cached
+
+    errors = {}
+    for provider in _provider_order(gemini_api_key):
+        try:
+            if provider == "gemini":
+                return _call_gemini(prompt, gemini_api_key, temp, cache, validate)
+            return _call_groq(prompt, groq_api_key, temp, cache, validate)
+        except Exception as e:
+            errors[provider] = str(e)
+
+    raise Exception(
+        f"Both APIs failed.\n"
+        f"Gemini: {errors.get('gemini')}\n"
+        f"Groq:   {errors.get('groq')}"
+    )
+
+
+def provider_health() -> dict:
+    """Circuit state, error rate and EWMA latency for every backend seen so far."""
+    return HEALTH.snapshot()
+
+
+# ─────────────────────────────────────────────────────
+# HEDGED ASYNC GENERATION
+# ─────────────────────────────────────────────────────
+
+_hedge_lock  = threading.Lock()
+_hedge_stats = {"gemini": 0, "groq": 0, "cache": 0, "hedged": 0}
+
+
+def _record_hedge(event: str) -> None:
+    with _hedge_lock:
+        _hedge_stats[event] += 1
+
+
+def hedge_stats() -> dict:
+    """Which provider won each hedged call, plus how often the hedge fired."""
+    with _hedge_lock:
+        return dict(_hedge_stats)
+
+
+async def agenerate_with_fallback(
+    prompt,
+    gemini_api_key: str,
+    groq_api_key: str,
+    temp: float = 0.2,
+    cache: TieredCache = None,
+    hedge_after: float = HEDGE_AFTER,
+    validate=None,
+) -> str:
+    """
+    Async generate_with_fallback with a hedged backup request.
+
+    The preferred provider (Gemini unless health routing says otherwise)
+    starts immediately. If it has not answered within hedge_after seconds
+    (or fails sooner), the same prompt goes to the other provider in
+    parallel and the first valid response wins; the other task is cancelled.
+    validate(text) -> bool decides what counts as valid (default: non-empty)
+    and gates the cache: a cached value that fails is a miss, and only valid
+    responses are stored. If both providers answer but neither validly, the
+    first answer is returned uncached so the caller can still salvage it
+    (e.g. repair truncated JSON).
+    The SDK calls run in worker threads, so a cancelled call finishes in the
+    background and its result is only used to warm the cache.
+    Raises Exception only if BOTH fail.
+    """
+    is_valid = validate or _has_text
+    if cache is not None:
+        cached = _cached_response(cache, prompt, temp, is_valid)
+        if cached is not None:
+            _record_hedge("cache")
+            return cached
+
+    errors  = {}
+    invalid = []   # answers that failed validation, in arrival order
+
+    primary, backup = _provider_order(gemini_api_key)
+    tasks = {}
+
+    def launch(provider):
+        if provider == "gemini":
+            call = asyncio.to_thread(_call_gemini, prompt, gemini_api_key, temp, cache, is_valid)
+        else:
+            call = asyncio.to_thread(_call_groq, prompt, groq_api_key, temp, cache, is_valid)
+        task = asyncio.create_task(call)
+        tasks[task] = provider
+        return task
+
+    first = launch(primary)
 
     try:
-        return _call_gemini(prompt, gemini_api_key, temp)
-    except Exception as e:
-        gemini_error = str(e)
+        done, _ = await asyncio.wait({first}, timeout=hedge_after)
+        if not done:
+            _record_hedge("hedged")
+            launch(backup)
+
+        while tasks:
+            done, _ = await asyncio.wait(set(tasks), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                provider = tasks.pop(task)
+                if task.exception() is not None:
+                    errors[provider] = str(task.exception())
+                elif not is_valid(task.result()):
+                    errors[provider] = "Invalid response"
+                    if _has_text(task.result()):
+                        invalid.append(task.result())
+                else:
+                    _record_hedge(provider)
+                    return task.result()
+                if provider == primary and backup not in tasks.values() and backup not in errors:
+                    launch(backup)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    if invalid:
+        return invalid[0]
+    raise Exception(
+        f"Both APIs failed.\n"
+        f"Gemini: {errors.get('gemini')}\n"
+        f"Groq:   {errors.get('groq')}"
+    )
+
+
+# ─────────────────────────────────────────────────────
+# STREAMING
+# ─────────────────────────────────────────────────────
 
+def _chunk_text(chunk) -> str:
+    """Gemini raises on .text for chunks without parts (e.g. the final stop chunk)."""
     try:
-        return _call_groq(prompt, groq_api_key, temp)
-    except Exception as groq_e:
-        raise Exception(
-            f"Both APIs failed.\n"
-            f"Gemini: {gemini_error}\n"
-            f"Groq:   {groq_e}"
+        return chunk.text or ""
+    except Exception:
+        return ""
+
+
+def _stream_gemini(prompt, gemini_api_key: str, temp: float = 0.2, cache: TieredCache = None, validate=_has_text):
+    """Yield text chunks from the first Gemini model that accepts the request."""
+    last_err = None
+    for model_name in _gemini_order(gemini_api_key):
+        backend = ("gemini", model_name)
+        if not HEALTH.acquire(backend):
+            continue
+        started = time.time()
+        text_in = _prompt_for(prompt, model_name)
+        try:
+            model = REGISTRY.gemini_model(gemini_api_key, model_name)
+            chunks = iter(model.generate_content(
+                text_in,
+                generation_config=genai.types.GenerationConfig(
+                    temperature=temp,
+                    max_output_tokens=MAX_TOKENS,
+                ),
+                stream=True,
+            ))
+            first = next(chunks, None)   # 404s surface on the first chunk
+        except Exception as e:
+            if _is_missing_model(e):
+                HEALTH.release(backend)
+                REGISTRY.mark_missing(gemini_api_key, model_name)
+                last_err = e
+                continue
+            HEALTH.record_failure(backend, time.time() - started)
+            raise e
+
+        REGISTRY.mark_success(gemini_api_key, model_name)
+        parts = []
+        try:
+            for chunk in itertools.chain([first] if first is not None else [], chunks):
+                text = _chunk_text(chunk)
+                if text:
+                    parts.append(text)
+                    yield text
+        except GeneratorExit:
+            HEALTH.release(backend)    # consumer stopped early — no latency sample
+            raise
+        except Exception:
+            HEALTH.record_failure(backend, time.time() - started)
+            raise
+        # Full stream duration: the same series non-streamed calls fill
+        HEALTH.record_success(backend, time.time() - started)
+        _store_response(cache, _response_key(prompt, "gemini", model_name, temp), "".join(parts), validate)
+        return
+    if last_err is None:
+        raise Exception("All Gemini models unavailable (circuit open).")
+    raise Exception(f"All Gemini models failed. Last error: {last_err}")
+
+
+def _stream_groq(prompt, groq_api_key: str, temp: float = 0.2, cache: TieredCache = None, validate=_has_text):
+    """Yield text chunks from Groq."""
+    backend = ("groq", GROQ_MODEL)
+    if not HEALTH.acquire(backend):
+        raise Exception("Groq unavailable (circuit open).")
+    started = time.time()
+    text_in = _prompt_for(prompt, GROQ_MODEL)
+    try:
+        client = REGISTRY.groq(groq_api_key)
+        stream = client.chat.completions.create(
+            messages=[{"role": "user", "content": text_in}],
+            model=GROQ_MODEL,
+            temperature=temp,
+            max_tokens=MAX_TOKENS,
+            stream=True,
         )
+    except Exception:
+        HEALTH.record_failure(backend, time.time() - started)
+        raise
+    parts = []
+    try:
+        for chunk in stream:
+            text = chunk.choices[0].delta.content if chunk.choices else None
+            if text:
+                parts.append(text)
+                yield text
+    except GeneratorExit:
+        HEALTH.release(backend)        # consumer stopped early — no latency sample
+        raise
+    except Exception:
+        HEALTH.record_failure(backend, time.time() - started)
+        raise
+    # Full stream duration: the same series non-streamed calls fill
+    HEALTH.record_success(backend, time.time() - started)
+    _store_response(cache, _response_key(prompt, "groq", GROQ_MODEL, temp), "".join(parts), validate)
+
+
+def stream_with_fallback(
+    prompt,
+    gemini_api_key: str,
+    groq_api_key: str,
+    temp: float = 0.2,
+    cache: TieredCache = None,
+    validate=_has_text,
+):
+    """
+    Streaming generate_with_fallback — yields text chunks.
+    Falls back to the other provider only if the first fails before
+    producing any output; a failure mid-stream is re-raised to the caller.
+    The cache is gated by validate as in generate_with_fallback.
+    """
+    if cache is not None:
+        cached = _cached_response(cache, prompt, temp, validate)
+        if cached is not None:
+            yield cached
+            return
+
+    errors = {}
+    for provider in _provider_order(gemini_api_key):
+        if provider == "gemini":
+            stream = _stream_gemini(prompt, gemini_api_key, temp, cache, validate)
+        else:
+            stream = _stream_groq(prompt, groq_api_key, temp, cache, validate)
+        emitted = False
+        try:
+            for text in stream:
+                emitted = True
+                yield text
+            return
+        except Exception as e:
+            if emitted:
+                raise
+            errors[provider] = str(e)
+
+    raise Exception(
+        f"Both APIs failed.\n"
+        f"Gemini: {errors.get('gemini')}\n"
+        f"Groq:   {errors.get('groq')}"
+    )
 
 
 # ─────────────────────────────────────────────────────
 # HTML CONVERTER
 # ─────────────────────────────────────────────────────
 
-def _to_html(value) -> str:
+def to_html(value) -> str:
     """Convert any AI output (str / list / dict / None) → safe HTML string."""
     if value is None or value == "" or value == [] or value == {}:
         return ""
@@ -161,7 +650,7 @@ def _to_html(value) -> str:
 # JSON PARSER
 # ─────────────────────────────────────────────────────
 
-def _extract_json_string(text: str) -> str:
+def extract_json_string(text: str) -> str:
     """Strip markdown fences and extract the outermost {...} block."""
     clean = text.strip()
     clean = re.sub(r"^```(?:json)?\s*", "", clean)
@@ -173,6 +662,21 @@ def _extract_json_string(text: str) -> str:
     return clean
 
 
+def is_json_response(text) -> bool:
+    """True if text holds one complete JSON object (fences allowed) — what the response cache keeps."""
+    if not _has_text(text):
+        return False
+    try:
+        return isinstance(json.loads(extract_json_string(text)), dict)
+    except ValueError:
+        return False
+
+
+def _usable_extraction(result: dict) -> bool:
+    """Not the parse-error fallback and nothing left to re-request — safe to index."""
+    return "_missing_fields" not in result and EXTRACTION_ERROR not in str(result.get("experience", ""))
+
+
 def _normalise_base_cv(parsed: dict) -> dict:
     """Ensure base CV has all required keys with correct types."""
     # Skills → always a comma-separated string
@@ -184,7 +688,7 @@ def _normalise_base_cv(parsed: dict) -> dict:
 
     # HTML fields
     for key in ["experience", "education", "certificates", "projects"]:
-        parsed[key] = _to_html(parsed.get(key, ""))
+        parsed[key] = to_html(parsed.get(key, ""))
 
     # Required string fields
     parsed.setdefault("name",     "Candidate")
@@ -194,7 +698,7 @@ def _normalise_base_cv(parsed: dict) -> dict:
     return parsed
 
 
-def _normalise_analysis(parsed: dict) -> dict:
+def normalise_analysis(parsed: dict) -> dict:
     """Ensure ATS analysis result has all required keys with correct types."""
     parsed.setdefault("old_ats_score",        0)
     parsed.setdefault("new_ats_score",        0)
@@ -218,7 +722,7 @@ def _normalise_analysis(parsed: dict) -> dict:
     if isinstance(tailored, dict):
         for key in ["experience", "education", "certificates", "projects"]:
             if key in tailored:
-                tailored[key] = _to_html(tailored[key])
+                tailored[key] = to_html(tailored[key])
         skills = tailored.get("skills", "")
         if isinstance(skills, list):
             tailored["skills"] = ", ".join(str(s) for s in skills if s)
@@ -230,17 +734,32 @@ def clean_and_parse_json(response_text: str, is_analysis: bool = False) -> dict:
     """
     Bulletproof JSON parser with full fallback dicts.
     Never raises — always returns a usable dict.
+
+    Well-formed JSON takes the json.loads fast path. Otherwise the tolerant
+    parser recovers every complete top-level field; required keys that were
+    cut off are listed under "_missing_fields" for a follow-up call.
     """
     try:
-        json_str = _extract_json_string(response_text or "")
+        json_str = extract_json_string(response_text or "")
         if not json_str:
             raise ValueError("Empty response from AI")
-        parsed = json.loads(json_str)
+        missing = []
+        try:
+            parsed = json.loads(json_str)
+        except ValueError:
+            fields, truncated = repair_json(response_text)
+            if not fields:
+                raise
+            required = ANALYSIS_KEYS if is_analysis else BASE_CV_KEYS
+            parsed, missing = fields, missing_fields(fields, truncated, required)
 
         if is_analysis:
-            return _normalise_analysis(parsed)
+            result = normalise_analysis(parsed)
         else:
-            return _normalise_base_cv(parsed)
+            result = _normalise_base_cv(parsed)
+        if missing:
+            result["_missing_fields"] = missing
+        return result
 
     except Exception as e:
         if is_analysis:
@@ -255,11 +774,47 @@ def clean_and_parse_json(response_text: str, is_analysis: bool = False) -> dict:
         return {
             "name": "Candidate", "headline": "Professional",
             "contact": "", "skills": "", "summary": "",
-            "experience": f"<p><b>Extraction Error:</b> {e}. Please try again.</p>",
+            "experience": f"<p><b>{EXTRACTION_ERROR}:</b> {e}. Please try again.</p>",
             "projects": "", "education": "", "certificates": "",
         }
 
 
+def complete_missing_fields(
+    result: dict,
+    prompt,
+    gemini_api_key: str,
+    groq_api_key: str,
+    is_analysis: bool = False,
+    cache: TieredCache = None,
+) -> dict:
+    """
+    Re-request only the fields listed in result["_missing_fields"] and merge
+    them in. The follow-up output is a fraction of the original, so this is
+    far cheaper than re-running the whole request. Never raises.
+    """
+    missing = result.pop("_missing_fields", None)
+    if not missing:
+        return result
+
+    keys = ", ".join(f'"{k}"' for k in missing)
+    followup = prompt + fill_prompt(FOLLOWUP_SUFFIX, keys=keys)
+    try:
+        response = generate_with_fallback(
+            followup, gemini_api_key, groq_api_key, temp=0.15, cache=cache, validate=is_json_response,
+        )
+        fields, _ = repair_json(response)
+    except Exception:
+        result["_missing_fields"] = missing
+        return result
+
+    result.update({k: fields[k] for k in missing if k in fields})
+    result = normalise_analysis(result) if is_analysis else _normalise_base_cv(result)
+    still_missing = [k for k in missing if k not in fields]
+    if still_missing:
+        result["_missing_fields"] = still_missing
+    return result
+
+
 # ─────────────────────────────────────────────────────
 # PROMPTS
 # ─────────────────────────────────────────────────────
@@ -328,23 +883,205 @@ JOB DESCRIPTION:
 {jd}
 """
 
+FOLLOWUP_SUFFIX = """
+
+IMPORTANT: A previous answer to this request was cut off.
+Return ONLY a raw JSON object containing these keys (nothing else): {keys}
+"""
+
 
 # ─────────────────────────────────────────────────────
 # PUBLIC API
 # ─────────────────────────────────────────────────────
 
-def extract_base_cv(raw_text: str, gemini_api_key: str, groq_api_key: str, is_url: bool = False) -> dict:
-    """Extract structured CV from raw text using AI."""
-    prompt = EXTRACT_PROMPT.replace("{text}", raw_text[:14000])
-    if is_url:
-        prompt += "\n\nNote: This text is from a web scrape — extract whatever is available."
-    response = generate_with_fallback(prompt, gemini_api_key, groq_api_key, temp=0.15)
-    return clean_and_parse_json(response, is_analysis=False)
+def inputs_budget(budget: int, template: str) -> int:
+    """Tokens left for the inputs of a prompt once its instructions are counted."""
+    return max(0, budget - estimate_tokens(template))
+
+
+def split_budget(budget: int) -> tuple:
+    """
+    (CV tokens, JD tokens) of an analysis prompt, summing to budget:
+    CV_BUDGET_SHARE of it, moved to honour the MIN_INPUT_TOKENS cut-offs
+    when the budget has room for both.
+    """
+    cv_budget = int(budget * CV_BUDGET_SHARE)
+    if MIN_INPUT_TOKENS["cv"] + MIN_INPUT_TOKENS["jd"] <= budget:
+        cv_budget = min(max(cv_budget, MIN_INPUT_TOKENS["cv"]), budget - MIN_INPUT_TOKENS["jd"])
+    return cv_budget, budget - cv_budget
+
+
+def _extract_prompt(raw_text: str, is_url: bool = False) -> BudgetedPrompt:
+    def build(budget):
+        text, report = compact_text(raw_text, inputs_budget(budget, EXTRACT_PROMPT))
+        prompt = fill_prompt(EXTRACT_PROMPT, text=text)
+        if is_url:
+            prompt += "\n\nNote: This text is from a web scrape — extract whatever is available."
+        return prompt, [report]
+    return BudgetedPrompt(build, EXTRACT_PROMPT, raw_text, is_url)
+
+
+def _ats_prompt(base_cv_json: dict, jd_text: str) -> BudgetedPrompt:
+    def build(budget):
+        cv_budget, jd_budget = split_budget(inputs_budget(budget, ATS_PROMPT))
+        cv_str, cv_report = compact_json(base_cv_json, cv_budget)
+        jd_str, jd_report = compact_text(jd_text, jd_budget)
+        return fill_prompt(ATS_PROMPT, cv=cv_str, jd=jd_str), [cv_report, jd_report]
+    return BudgetedPrompt(build, ATS_PROMPT, json.dumps(base_cv_json, sort_keys=True, default=str), jd_text)
 
 
-def analyze_and_tailor_cv(base_cv_json: dict, jd_text: str, gemini_api_key: str, groq_api_key: str) -> dict:
+def extract_base_cv(
+    raw_text: str,
+    gemini_api_key: str,
+    groq_api_key: str,
+    is_url: bool = False,
+    cache: TieredCache = None,
+    index=None,
+) -> dict:
+    """
+    Extract structured CV from raw text using AI.
+    index (core.dedup.CVIndex): an exact or near-duplicate of an earlier
+    upload is answered from it with no LLM call; new results are added.
+    """
+    if index is not None:
+        known, _ = index.lookup(raw_text)
+        if known is not None:
+            return known
+    prompt = _extract_prompt(raw_text, is_url)
+    response = generate_with_fallback(
+        prompt, gemini_api_key, groq_api_key, temp=0.15, cache=cache, validate=is_json_response,
+    )
+    result = clean_and_parse_json(response, is_analysis=False)
+    result = complete_missing_fields(result, prompt, gemini_api_key, groq_api_key, False, cache)
+    if index is not None and _usable_extraction(result):
+        index.add(raw_text, result)
+    return result
+
+
+def analyze_and_tailor_cv(
+    base_cv_json: dict,
+    jd_text: str,
+    gemini_api_key: str,
+    groq_api_key: str,
+    cache: TieredCache = None,
+) -> dict:
     """Run ATS analysis and return tailored CV + full report."""
-    cv_str = json.dumps(base_cv_json, ensure_ascii=False)[:12000]
-    prompt = ATS_PROMPT.replace("{cv}", cv_str).replace("{jd}", jd_text[:8000])
-    response = generate_with_fallback(prompt, gemini_api_key, groq_api_key, temp=0.15)
-    return clean_and_parse_json(response, is_analysis=True)
+    prompt = _ats_prompt(base_cv_json, jd_text)
+    response = generate_with_fallback(
+        prompt, gemini_api_key, groq_api_key, temp=0.15, cache=cache, validate=is_json_response,
+    )
+    result = clean_and_parse_json(response, is_analysis=True)
+    return complete_missing_fields(result, prompt, gemini_api_key, groq_api_key, True, cache)
+
+
+async def aextract_base_cv(
+    raw_text: str,
+    gemini_api_key: str,
+    groq_api_key: str,
+    is_url: bool = False,
+    cache: TieredCache = None,
+    hedge_after: float = HEDGE_AFTER,
+    index=None,
+) -> dict:
+    """extract_base_cv with a hedged Gemini/Groq request."""
+    if index is not None:
+        known, _ = index.lookup(raw_text)
+        if known is not None:
+            return known
+    prompt = _extract_prompt(raw_text, is_url)
+    response = await agenerate_with_fallback(
+        prompt, gemini_api_key, groq_api_key, temp=0.15,
+        cache=cache, hedge_after=hedge_after, validate=is_json_response,
+    )
+    result = clean_and_parse_json(response, is_analysis=False)
+    result = await asyncio.to_thread(
+        complete_missing_fields, result, prompt, gemini_api_key, groq_api_key, False, cache
+    )
+    if index is not None and _usable_extraction(result):
+        index.add(raw_text, result)
+    return result
+
+
+async def aanalyze_and_tailor_cv(
+    base_cv_json: dict,
+    jd_text: str,
+    gemini_api_key: str,
+    groq_api_key: str,
+    cache: TieredCache = None,
+    hedge_after: float = HEDGE_AFTER,
+) -> dict:
+    """analyze_and_tailor_cv with a hedged Gemini/Groq request."""
+    prompt = _ats_prompt(base_cv_json, jd_text)
+    response = await agenerate_with_fallback(
+        prompt, gemini_api_key, groq_api_key, temp=0.15,
+        cache=cache, hedge_after=hedge_after, validate=is_json_response,
+    )
+    result = clean_and_parse_json(response, is_analysis=True)
+    return await asyncio.to_thread(
+        complete_missing_fields, result, prompt, gemini_api_key, groq_api_key, True, cache
+    )
+
+
+def _stream_parsed(prompt, gemini_api_key: str, groq_api_key: str, is_analysis: bool, cache: TieredCache):
+    """Yield normalised partial dicts as top-level fields complete; the last yield is final."""
+    normalise = normalise_analysis if is_analysis else _normalise_base_cv
+    parser = IncrementalJSONParser()
+    parts  = []
+    try:
+        for chunk in stream_with_fallback(
+            prompt, gemini_api_key, groq_api_key, temp=0.15, cache=cache, validate=is_json_response,
+        ):
+            parts.append(chunk)
+            if parser.feed(chunk):
+                yield normalise(copy.deepcopy(parser.fields))
+        response = "".join(parts)
+    except Exception:
+        if not parts:
+            raise
+        # Stream broke part-way — finish with a blocking call
+        response = generate_with_fallback(
+            prompt, gemini_api_key, groq_api_key, temp=0.15, cache=cache, validate=is_json_response,
+        )
+    result = clean_and_parse_json(response, is_analysis=is_analysis)
+    if result.get("_missing_fields"):
+        yield result    # show what survived while the missing fields are fetched
+        result = complete_missing_fields(result, prompt, gemini_api_key, groq_api_key, is_analysis, cache)
+    yield result
+
+
+def stream_extract_base_cv(
+    raw_text: str,
+    gemini_api_key: str,
+    groq_api_key: str,
+    is_url: bool = False,
+    cache: TieredCache = None,
+    index=None,
+):
+    """
+    Streaming extract_base_cv. Yields a render-ready partial CV dict each time
+    a top-level field completes; the last item yielded is the final result.
+    A CV already in index is yielded once, immediately.
+    """
+    if index is not None:
+        known, _ = index.lookup(raw_text)
+        if known is not None:
+            yield known
+            return
+    prompt = _extract_prompt(raw_text, is_url)
+    result = None
+    for result in _stream_parsed(prompt, gemini_api_key, groq_api_key, False, cache):
+        yield result
+    if index is not None and result is not None and _usable_extraction(result):
+        index.add(raw_text, result)
+
+
+def stream_analyze_and_tailor_cv(
+    base_cv_json: dict,
+    jd_text: str,
+    gemini_api_key: str,
+    groq_api_key: str,
+    cache: TieredCache = None,
+):
+    """Streaming analyze_and_tailor_cv — same contract as stream_extract_base_cv."""
+    prompt = _ats_prompt(base_cv_json, jd_text)
+    yield from _stream_parsed(prompt, gemini_api_key, groq_api_key, True, cache)
@@ -0,0 +1,228 @@
+"""
+core/ats_scoring.py
+===================
+Local, deterministic ATS scoring — no LLM call.
+
+- Keyword coverage: share of the JD's weighted terms (unigrams + repeated
+  bigrams, sublinear TF) that appear anywhere in the CV
+- Cosine similarity between the JD and CV term-frequency vectors
+- Section scores: coverage per CV section + a structural format check
+- Missing keywords: highest-weighted JD terms absent from the CV
+
+score_cv() returns the same keys the LLM analysis uses for these fields
+(old_ats_score, missing_keywords, section_scores). score_cv_many() scores
+one CV against any number of JDs with flat NumPy arrays + bincount, so it
+stays fast and memory-light for thousands of JDs (IDF is computed across
+the JD set there).
+No st imports — pure utility module
+"""
+
+import math
+import re
+from collections import Counter
+
+import numpy as np
+
+# ─────────────────────────────────────────────────────
+# CONSTANTS
+# ─────────────────────────────────────────────────────
+
+JD_TOP_TERMS     = 40   # weighted terms kept per JD
+MISSING_KEYWORDS = 8
+SECTION_KEYS     = ["experience", "skills", "education", "projects"]
+
+SCORE_WEIGHTS = {"coverage": 0.6, "similarity": 0.25, "format": 0.15}
+
+_TAG   = re.compile(r"<[^>]+>")
+_TOKEN = re.compile(r"[a-z][a-z0-9+#]*(?:[.\-/][a-z0-9+#]+)*")
+
+_STOPWORDS = frozenset("""
+a about above across after again against all also am an and any are as at be because been before
+being below between both but by can could did do does doing down during each either etc few for
+from further had has have having he her here hers him his how i if in into is it its itself just
+may me might more most must my no nor not of off on once only or other our ours out over own per
+same she should so some such than that the their them then there these they this those through to
+too under until up upon us very via was we well were what when where which while who whom why will
+with within without would you your yours
+ability able candidate candidates company role roles position job jobs team teams work working
+experience experienced years year strong excellent good great including include includes required
+requirements preferred responsibilities responsible looking join plus etc using use new skills
+knowledge understanding opportunity environment day build ensure help drive
+hiring hire hires seeking seek want wants need needs know knowing like love ideal ideally desired
+desirable nice bonus minimum least senior junior mid level levels related relevant various multiple
+key passionate motivated dynamic exciting fast paced world class apply applicant applicants salary
+benefits competitive offer offers based every make get across part members member highly proven
+""".split())
+
+
+# ─────────────────────────────────────────────────────
+# TEXT → TERMS
+# ─────────────────────────────────────────────────────
+
+def _tokens(text: str) -> list:
+    text = _TAG.sub(" ", str(text or "")).lower()
+    return [t for t in _TOKEN.findall(text) if t not in _STOPWORDS and len(t) > 1]
+
+
+def _terms(text: str) -> Counter:
+    """Unigram + bigram counts for text."""
+    toks = _tokens(text)
+    counts = Counter(toks)
+    counts.update(f"{a} {b}" for a, b in zip(toks, toks[1:]))
+    return counts
+
+
+def _jd_weights(jd_text: str, top_k: int = JD_TOP_TERMS) -> dict:
+    """Sublinear-TF weights for the JD's most salient terms."""
+    counts = _terms(jd_text)
+    weights = {}
+    for term, tf in counts.items():
+        if " " in term:
+            if tf < 2:
+                continue        # one-off word pairs are noise, repeated ones are phrases
+            weights[term] = 1.2 * (1 + math.log(tf))
+        else:
+            weights[term] = 1 + math.log(tf)
+    top = sorted(weights.items(), key=lambda kv: (-kv[1], kv[0]))[:top_k]
+    return dict(top)
+
+
+def _cv_text(base_cv: dict, keys=None) -> str:
+    keys = keys or ["headline", "summary", "skills", "experience", "projects", "education", "certificates"]
+    parts = []
+    for key in keys:
+        value = base_cv.get(key, "")
+        if isinstance(value, list):
+            value = " ".join(str(v) for v in value)
+        parts.append(str(value or ""))
+    return " \n ".join(parts)
+
+
+# ─────────────────────────────────────────────────────
+# VECTOR MATH
+# ─────────────────────────────────────────────────────
+
+def _flatten(jd_weight_dicts: list):
+    """Ragged JD term lists → (jd_index, term_index, weight) arrays + vocabulary."""
+    vocab = {}
+    jd_idx, term_idx, weights = [], [], []
+    for j, weights_j in enumerate(jd_weight_dicts):
+        for term, w in weights_j.items():
+            jd_idx.append(j)
+            term_idx.append(vocab.setdefault(term, len(vocab)))
+            weights.append(w)
+    return (
+        np.asarray(jd_idx, dtype=np.int64),
+        np.asarray(term_idx, dtype=np.int64),
+        np.asarray(weights, dtype=np.float64),
+        vocab,
+    )
+
+
+def _coverage_and_similarity(jd_idx, term_idx, weights, vocab, cv_counts: Counter, n_jds: int):
+    """Per-JD keyword coverage and cosine similarity, fully vectorised."""
+    cv_tf = np.zeros(len(vocab), dtype=np.float64)
+    for term, i in vocab.items():
+        tf = cv_counts.get(term, 0)
+        if tf:
+            cv_tf[i] = 1 + math.log(tf)
+
+    present = (cv_tf[term_idx] > 0).astype(np.float64)
+    total   = np.bincount(jd_idx, weights=weights, minlength=n_jds)
+    covered = np.bincount(jd_idx, weights=weights * present, minlength=n_jds)
+    dot     = np.bincount(jd_idx, weights=weights * cv_tf[term_idx], minlength=n_jds)
+    jd_norm = np.sqrt(np.bincount(jd_idx, weights=weights ** 2, minlength=n_jds))
+
+    cv_norm = math.sqrt(sum((1 + math.log(tf)) ** 2 for tf in cv_counts.values())) or 1.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coverage   = np.where(total > 0, covered / total, 0.0)
+        similarity = np.where(jd_norm > 0, dot / (jd_norm * cv_norm), 0.0)
+    return coverage, np.clip(similarity, 0.0, 1.0)
+
+
+def _format_score(base_cv: dict) -> float:
+    """Structural ATS hygiene: 0.0–1.0."""
+    contact = str(base_cv.get("contact", "") or "")
+    skills  = base_cv.get("skills", "")
+    n_skills = len(skills) if isinstance(skills, list) else len([s for s in str(skills or "").split(",") if s.strip()])
+    experience = str(base_cv.get("experience", "") or "")
+    checks = [
+        "@" in contact,
+        bool(re.search(r"\d{7,}|\d{3,}[\s\-]\d{3,}", contact)),
+        bool(str(base_cv.get("headline", "") or "").strip()),
+        len(str(base_cv.get("summary", "") or "")) > 60,
+        n_skills >= 5,
+        experience.count("<li") >= 2,
+        bool(str(base_cv.get("education", "") or "").strip()),
+    ]
+    return sum(checks) / len(checks)
+
+
+def _combine(coverage, similarity, fmt):
+    w = SCORE_WEIGHTS
+    return np.rint(100 * (w["coverage"] * coverage + w["similarity"] * similarity + w["format"] * fmt))
+
+
+# ─────────────────────────────────────────────────────
+# PUBLIC API
+# ─────────────────────────────────────────────────────
+
+def score_cv(base_cv: dict, jd_text: str) -> dict:
+    """
+    Instant local ATS score for one CV against one JD.
+
+    Returns {"old_ats_score", "keyword_coverage", "similarity",
+             "missing_keywords", "matched_keywords", "section_scores"}
+    """
+    jd_weights = _jd_weights(jd_text)
+    cv_counts  = _terms(_cv_text(base_cv))
+    jd_idx, term_idx, weights, vocab = _flatten([jd_weights])
+
+    coverage, similarity = _coverage_and_similarity(jd_idx, term_idx, weights, vocab, cv_counts, 1)
+    fmt = _format_score(base_cv)
+
+    ranked = sorted(jd_weights.items(), key=lambda kv: (-kv[1], kv[0]))
+    missing = [t for t, _ in ranked if t not in cv_counts]
+    matched = [t for t, _ in ranked if t in cv_counts]
+
+    # Section scores — each section's own coverage of the JD, on a sqrt curve
+    # (a single section is never expected to cover the whole JD)
+    section_scores = {}
+    if jd_weights:
+        for key in SECTION_KEYS:
+            counts = _terms(_cv_text(base_cv, [key]))
+            cov, _ = _coverage_and_similarity(jd_idx, term_idx, weights, vocab, counts, 1)
+            section_scores[key] = int(round(100 * math.sqrt(float(cov[0]))))
+    section_scores["overall_format"] = int(round(100 * fmt))
+
+    return {
+        "old_ats_score":    int(_combine(coverage, similarity, fmt)[0]),
+        "keyword_coverage": round(float(coverage[0]), 4),
+        "similarity":       round(float(similarity[0]), 4),
+        "missing_keywords": missing[:MISSING_KEYWORDS],
+        "matched_keywords": matched,
+        "section_scores":   section_scores,
+    }
+
+
+def score_cv_many(base_cv: dict, jd_texts: list) -> np.ndarray:
+    """
+    Score one CV against many JDs. Returns an int array of 0-100 scores
+    aligned with jd_texts. JD term weights are IDF-scaled across the set,
+    so boilerplate shared by every posting counts for less.
+    """
+    jd_texts = list(jd_texts)
+    if not jd_texts:
+        return np.zeros(0, dtype=np.int64)
+
+    per_jd = [_jd_weights(jd) for jd in jd_texts]
+    jd_idx, term_idx, weights, vocab = _flatten(per_jd)
+
+    n = len(jd_texts)
+    df  = np.bincount(term_idx, minlength=len(vocab))
+    idf = np.log((1 + n) / (1 + df)) + 1.0
+    weights = weights * idf[term_idx]
+
+    cv_counts = _terms(_cv_text(base_cv))
+    coverage, similarity = _coverage_and_similarity(jd_idx, term_idx, weights, vocab, cv_counts, n)
+    return _combine(coverage, similarity, _format_score(base_cv)).astype(np.int64)
@@ -0,0 +1,100 @@
+"""
+core/batch.py
+=============
+Bulk CV extraction + ATS analysis over a bounded worker pool.
+
+- Results come back in input order, one entry per item
+- A failing item is reported in its own entry; the batch keeps going
+- on_progress(done, total, entry) fires on the calling thread as items finish
+- No st imports — pure utility module
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from core.ai_engine import analyze_and_tailor_cv, extract_base_cv
+
+# ─────────────────────────────────────────────────────
+# CONSTANTS
+# ─────────────────────────────────────────────────────
+
+DEFAULT_WORKERS = 4  # concurrent LLM calls — keep under the provider rate limit
+
+
+# ─────────────────────────────────────────────────────
+# GENERIC RUNNER
+# ─────────────────────────────────────────────────────
+
+def run_batch(fn, items: list, max_workers: int = DEFAULT_WORKERS, on_progress=None) -> list:
+    """
+    Call fn(item) for every item on a pool of max_workers threads.
+
+    Returns a list aligned with items; each entry is
+        {"index": i, "result": <fn return value or None>, "error": <str or None>}
+    """
+    items   = list(items)
+    total   = len(items)
+    results = [None] * total
+    if not total:
+        return results
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total))) as pool:
+        futures = {pool.submit(fn, item): i for i, item in enumerate(items)}
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            try:
+                entry = {"index": i, "result": future.result(), "error": None}
+            except Exception as e:
+                entry = {"index": i, "result": None, "error": str(e)}
+            results[i] = entry
+            if on_progress is not None:
+                on_progress(done, total, entry)
+    return results
+
+
+# ─────────────────────────────────────────────────────
+# PUBLIC API
+# ─────────────────────────────────────────────────────
+
+def batch_extract_base_cv(
+    raw_texts: list,
+    gemini_api_key: str,
+    groq_api_key: str,
+    is_url: bool = False,
+    cache=None,
+    max_workers: int = DEFAULT_WORKERS,
+    on_progress=None,
+    index=None,
+) -> list:
+    """extract_base_cv for many raw texts. Entries follow run_batch()."""
+    def work(raw_text):
+        return extract_base_cv(raw_text, gemini_api_key, groq_api_key, is_url=is_url, cache=cache, index=index)
+
+    return run_batch(work, raw_texts, max_workers, on_progress)
+
+
+def batch_analyze_and_tailor_cv(
+    base_cvs: list,
+    jd_texts: list,
+    gemini_api_key: str,
+    groq_api_key: str,
+    cache=None,
+    max_workers: int = DEFAULT_WORKERS,
+    on_progress=None,
+) -> list:
+    """
+    Run every CV against every JD (CV × JD matrix).
+
+    Returns matrix[cv_index][jd_index] → run_batch() entry, where the entry's
+    "index" is the flat position cv_index * len(jd_texts) + jd_index.
+    """
+    base_cvs = list(base_cvs)
+    jd_texts = list(jd_texts)
+    pairs = [(cv, jd) for cv in base_cvs for jd in jd_texts]
+
+    def work(pair):
+        cv, jd = pair
+        return analyze_and_tailor_cv(cv, jd, gemini_api_key, groq_api_key, cache=cache)
+
+    flat = run_batch(work, pairs, max_workers, on_progress)
+    width = len(jd_texts)
+    return [flat[row * width : (row + 1) * width] for row in range(len(base_cvs))]
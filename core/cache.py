@@ -0,0 +1,230 @@
+"""
+core/cache.py
+=============
+Two-tier key/value cache — in-memory LRU in front of a persistent SQLite store.
+
+- Memory tier: bounded LRU (OrderedDict), per-entry expiry
+- Disk tier:   optional SQLite file with TTL + size-based eviction
+- Values:      bytes stored raw, anything else stored as JSON
+- Thread-safe; hit/miss counters exposed via stats()
+- No st imports — pure utility module
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# ─────────────────────────────────────────────────────
+# CONSTANTS
+# ─────────────────────────────────────────────────────
+
+DEFAULT_TTL            = 7 * 24 * 3600     # seconds
+DEFAULT_MEMORY_ENTRIES = 256
+DEFAULT_DISK_BYTES     = 64 * 1024 * 1024  # 64 MB
+
+
+# ─────────────────────────────────────────────────────
+# KEYS
+# ─────────────────────────────────────────────────────
+
+def make_key(*parts) -> str:
+    """
+    Stable sha256 hex key over an ordered tuple of parts.
+    Each part is length-prefixed so ("ab", "c") != ("a", "bc").
+    """
+    h = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, bytes):
+            raw = part
+        elif isinstance(part, str):
+            raw = part.encode("utf-8")
+        else:
+            raw = repr(part).encode("utf-8")
+        h.update(len(raw).to_bytes(8, "big"))
+        h.update(raw)
+    return h.hexdigest()
+
+
+# ─────────────────────────────────────────────────────
+# CACHE
+# ─────────────────────────────────────────────────────
+
+class TieredCache:
+    """
+    LRU memory tier + optional SQLite disk tier.
+
+    path=None keeps the cache memory-only (nothing persisted).
+    Expired entries are treated as misses and purged lazily.
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        ttl: float = DEFAULT_TTL,
+        max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        max_disk_bytes: int = DEFAULT_DISK_BYTES,
+    ):
+        self.path               = path
+        self.ttl                = ttl
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes     = max_disk_bytes
+
+        self._lock   = threading.RLock()
+        self._memory = OrderedDict()   # key → (expires_at, value)
+        self._conn   = None
+        self._counts = {"hits": 0, "misses": 0, "memory_hits": 0, "disk_hits": 0, "evictions": 0}
+
+        if path:
+            folder = os.path.dirname(os.path.abspath(path))
+            os.makedirs(folder, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " kind TEXT NOT NULL,"
+                " value BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON entries(accessed_at)")
+            self._conn.commit()
+
+    # ── public API ───────────────────────────────────
+
+    def get(self, key: str, default=None):
+        """Return the cached value for key, or default on miss/expiry."""
+        with self._lock:
+            value, found = self._lookup(key)
+            self._counts["hits" if found else "misses"] += 1
+            return value if found else default
+
+    def get_any(self, keys, default=None, accept=None):
+        """
+        Return (key, value) for the first key that hits, else (None, default).
+        accept(value) -> bool: values it rejects are skipped like misses.
+        Counts as a single hit or miss regardless of how many keys are probed.
+        """
+        with self._lock:
+            for key in keys:
+                value, found = self._lookup(key)
+                if found and (accept is None or accept(value)):
+                    self._counts["hits"] += 1
+                    return key, value
+            self._counts["misses"] += 1
+            return None, default
+
+    def set(self, key: str, value, ttl: float = None) -> None:
+        """Store value under key in both tiers."""
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._remember(key, value, expires_at)
+            if self._conn is None:
+                return
+            if isinstance(value, bytes):
+                kind, blob = "b", value
+            else:
+                kind, blob = "j", json.dumps(value, ensure_ascii=False).encode("utf-8")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, kind, value, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, kind, blob, len(blob), expires_at, time.time()),
+            )
+            self._evict_disk()
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        """Drop key from both tiers."""
+        with self._lock:
+            self._memory.pop(key, None)
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM entries")
+                self._conn.commit()
+
+    def stats(self) -> dict:
+        """Hit/miss counters plus current tier sizes."""
+        with self._lock:
+            total = self._counts["hits"] + self._counts["misses"]
+            out = dict(self._counts)
+            out["hit_rate"]       = round(self._counts["hits"] / total, 4) if total else 0.0
+            out["memory_entries"] = len(self._memory)
+            if self._conn is not None:
+                rows, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+                out["disk_entries"] = rows
+                out["disk_bytes"]   = size
+            return out
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ── internals (caller holds the lock) ────────────
+
+    def _lookup(self, key: str):
+        now = time.time()
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                self._counts["memory_hits"] += 1
+                return value, True
+            del self._memory[key]
+
+        if self._conn is None:
+            return None, False
+
+        row = self._conn.execute(
+            "SELECT kind, value, expires_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None, False
+
+        kind, blob, expires_at = row
+        if expires_at <= now:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+            return None, False
+
+        value = bytes(blob) if kind == "b" else json.loads(bytes(blob).decode("utf-8"))
+        self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        self._conn.commit()
+        self._remember(key, value, expires_at)
+        self._counts["disk_hits"] += 1
+        return value, True
+
+    def _remember(self, key: str, value, expires_at: float) -> None:
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self) -> None:
+        """Purge expired rows, then least-recently-accessed rows over the byte budget."""
+        self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self.max_disk_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM entries ORDER BY accessed_at ASC").fetchall()
+        for key, size in rows:
+            if total <= self.max_disk_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._memory.pop(key, None)
+            self._counts["evictions"] += 1
+            total -= size
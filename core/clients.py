@@ -0,0 +1,158 @@
+"""
+core/clients.py
+===============
+Process-wide provider client registry.
+
+- One Groq client per API key (its HTTP connection pool is reused)
+- genai.configure() runs only when the active Gemini key changes
+- GenerativeModel objects built once per (key, model)
+- Sticky Gemini model: the last model that answered is tried first
+- Model list refreshed in a background thread (models that 404 are skipped)
+- No st imports — pure utility module
+"""
+
+import hashlib
+import threading
+import time
+
+import google.generativeai as genai
+from groq import Groq
+
+# ─────────────────────────────────────────────────────
+# CONSTANTS
+# ─────────────────────────────────────────────────────
+
+MODEL_REFRESH_INTERVAL = 30 * 60  # seconds between background list_models() calls
+
+
+def _key_id(api_key: str) -> str:
+    """Short, non-reversible id so raw keys are never used as dict keys."""
+    return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+
+
+# ─────────────────────────────────────────────────────
+# REGISTRY
+# ─────────────────────────────────────────────────────
+
+class ClientRegistry:
+    """Caches provider clients and per-key Gemini model preferences."""
+
+    def __init__(self, refresh_interval: float = MODEL_REFRESH_INTERVAL):
+        self.refresh_interval = refresh_interval
+
+        self._lock           = threading.RLock()
+        self._configured_key = None
+        self._groq_clients   = {}   # key_id → Groq
+        self._gemini_models  = {}   # (key_id, model_name) → GenerativeModel
+        self._sticky         = {}   # key_id → model_name that last succeeded
+        self._missing        = {}   # key_id → {model names that returned 404}
+        self._available      = {}   # key_id → {model names from list_models()}
+        self._refreshed_at   = {}   # key_id → timestamp of last refresh start
+
+    # ── Groq ─────────────────────────────────────────
+
+    def groq(self, api_key: str) -> Groq:
+        """Return the shared Groq client for this key."""
+        kid = _key_id(api_key)
+        with self._lock:
+            client = self._groq_clients.get(kid)
+            if client is None:
+                client = Groq(api_key=api_key)
+                self._groq_clients[kid] = client
+            return client
+
+    # ── Gemini ───────────────────────────────────────
+
+    def gemini_model(self, api_key: str, model_name: str):
+        """Return a cached GenerativeModel, configuring genai only on key change."""
+        kid = _key_id(api_key)
+        with self._lock:
+            if self._configured_key != kid:
+                genai.configure(api_key=api_key)
+                self._configured_key = kid
+                # Models built under another key hold that key's client
+                self._gemini_models = {k: v for k, v in self._gemini_models.items() if k[0] == kid}
+            model = self._gemini_models.get((kid, model_name))
+            if model is None:
+                model = genai.GenerativeModel(model_name)
+                self._gemini_models[(kid, model_name)] = model
+            return model
+
+    def gemini_candidates(self, api_key: str, models: list) -> list:
+        """
+        Order models for this key: sticky winner first, then the rest in
+        their configured order. Models known to 404 are dropped unless
+        that would leave nothing to try.
+        """
+        kid = _key_id(api_key)
+        self._maybe_refresh(api_key)
+        with self._lock:
+            missing   = self._missing.get(kid, set())
+            available = self._available.get(kid)
+            ordered = [
+                m for m in models
+                if m not in missing and (available is None or m in available)
+            ]
+            sticky = self._sticky.get(kid)
+            if sticky in ordered:
+                ordered.remove(sticky)
+                ordered.insert(0, sticky)
+            return ordered or list(models)
+
+    def mark_success(self, api_key: str, model_name: str) -> None:
+        with self._lock:
+            self._sticky[_key_id(api_key)] = model_name
+
+    def mark_missing(self, api_key: str, model_name: str) -> None:
+        """Remember a 404/deprecated model so later requests skip it."""
+        kid = _key_id(api_key)
+        with self._lock:
+            self._missing.setdefault(kid, set()).add(model_name)
+            if self._sticky.get(kid) == model_name:
+                del self._sticky[kid]
+
+    # ── background refresh ───────────────────────────
+
+    def _maybe_refresh(self, api_key: str) -> None:
+        kid = _key_id(api_key)
+        with self._lock:
+            last = self._refreshed_at.get(kid, 0.0)
+            if time.time() - last < self.refresh_interval:
+                return
+            self._refreshed_at[kid] = time.time()
+        threading.Thread(target=self._refresh, args=(api_key,), daemon=True).start()
+
+    def _refresh(self, api_key: str) -> None:
+        """List models that support generateContent; failures keep the old view."""
+        kid = _key_id(api_key)
+        try:
+            with self._lock:
+                if self._configured_key != kid:
+                    genai.configure(api_key=api_key)
+                    self._configured_key = kid
+            names = {
+                m.name.split("/", 1)[-1]
+                for m in genai.list_models()
+                if "generateContent" in (getattr(m, "supported_generation_methods", None) or [])
+            }
+        except Exception:
+            return
+        if not names:
+            return
+        with self._lock:
+            self._available[kid] = names
+            # A fresh listing supersedes earlier 404 observations
+            self._missing[kid] = self._missing.get(kid, set()) - names
+
+    def snapshot(self) -> dict:
+        """Current sticky/missing/available state, keyed by key id (for monitoring)."""
+        with self._lock:
+            return {
+                "sticky":    dict(self._sticky),
+                "missing":   {k: sorted(v) for k, v in self._missing.items()},
+                "available": {k: sorted(v) for k, v in self._available.items()},
+            }
+
+
+# Shared by every caller in this process
+REGISTRY = ClientRegistry()
@@ -0,0 +1,302 @@
+"""
+core/compaction.py
+==================
+Prompt input compaction — replaces hard character truncation.
+
+Three passes, all single-pass over the lines:
+  1. collapse layout whitespace (pdfplumber layout=True pads with spaces)
+  2. drop page furniture: page numbers and running headers/footers, i.e.
+     lines repeated at the top or bottom of several pages (PDF text marks
+     page boundaries with PAGE_BREAK; repeats inside a page are content)
+  3. fit to a token budget by dropping the lowest-value lines first,
+     keeping the survivors in their original order
+
+Token counts are an estimate (no tokenizer dependency): the larger of
+chars/4 and words×1.3, which tracks Gemini/Llama tokenizers closely on
+English CV text.
+No st imports — pure utility module
+"""
+
+import json
+import math
+import re
+
+# ─────────────────────────────────────────────────────
+# CONSTANTS
+# ─────────────────────────────────────────────────────
+
+PAGE_BREAK           = "\f"  # between PDF pages in extract_pdf_text output
+FURNITURE_EDGE_LINES = 2     # non-blank lines at each end of a page that may be header/footer
+FURNITURE_MIN_PAGES  = 2     # an edge line repeated on this many pages is a running header/footer
+
+_WIDE_GAP     = re.compile(r"[ \t ]{3,}")     # layout padding between columns
+_INNER_SPACES = re.compile(r"[ \t ]{2}")
+_PAGE_NUMBER  = re.compile(r"^[-–—\s]*(page\s*)?\d{1,3}(\s*(of|/)\s*\d{1,3})?[-–—\s]*$", re.IGNORECASE)
+_WORD         = re.compile(r"\w+")
+_SIGNAL       = re.compile(r"@|https?://|www\.|linkedin|github|\+?\d(?:[\s\-]?\d){9,}", re.IGNORECASE)
+_BULLET       = re.compile(r"^\s*[•·\-\*▪●◦]\s*")
+_LIST_ITEM    = re.compile(r"(<li>.*?</li>)", re.IGNORECASE | re.DOTALL)
+_TAG          = re.compile(r"<[^>]+>")
+
+
+# ─────────────────────────────────────────────────────
+# TOKENS
+# ─────────────────────────────────────────────────────
+
+def estimate_tokens(text: str) -> int:
+    """Approximate LLM token count for text."""
+    if not text:
+        return 0
+    words = len(_WORD.findall(text))
+    return int(math.ceil(max(len(text) / 4.0, words * 1.3)))
+
+
+# ─────────────────────────────────────────────────────
+# PASSES
+# ─────────────────────────────────────────────────────
+
+def collapse_whitespace(text: str) -> str:
+    """Trim lines, shrink column padding to two spaces, squeeze blank-line runs."""
+    out = []
+    blank = False
+    for line in (text or "").splitlines():
+        line = _WIDE_GAP.sub("  ", line.strip())
+        if not line:
+            if not blank and out:
+                out.append("")
+            blank = True
+            continue
+        blank = False
+        out.append(line)
+    while out and not out[-1]:
+        out.pop()
+    return "\n".join(out)
+
+
+def _furniture_key(line: str) -> str:
+    return _INNER_SPACES.sub(" ", line.strip().lower())
+
+
+def _edge_lines(lines: list) -> list:
+    """Indices of the first and last FURNITURE_EDGE_LINES non-blank lines of a page."""
+    filled = [i for i, line in enumerate(lines) if line.strip()]
+    return sorted(set(filled[:FURNITURE_EDGE_LINES] + filled[-FURNITURE_EDGE_LINES:]))
+
+
+def remove_furniture(text: str) -> tuple:
+    """
+    Drop page furniture. Returns (text, lines_removed); pages are joined
+    with plain newlines in the result.
+
+    Only the lines at the top or bottom of a page are candidates:
+    - page numbers ("3", "Page 2 of 4", "- 2 -", "2/4") are dropped
+    - a line found there on FURNITURE_MIN_PAGES+ pages keeps only its first
+      occurrence, unless it looks like content structure (a label ending
+      in ":" or a bullet)
+    Repeats inside a page (shared job titles, locations) are never touched.
+    """
+    pages = [page.split("\n") for page in text.split(PAGE_BREAK)]
+    edges = [_edge_lines(lines) for lines in pages]
+
+    on_pages = {}
+    for lines, idx in zip(pages, edges):
+        for key in {_furniture_key(lines[i]) for i in idx}:
+            on_pages[key] = on_pages.get(key, 0) + 1
+
+    out, seen, removed = [], set(), 0
+    for lines, idx in zip(pages, edges):
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+            if i in idx:
+                key = _furniture_key(line)
+                if _PAGE_NUMBER.match(key):
+                    removed += 1
+                    continue
+                if (
+                    on_pages[key] >= FURNITURE_MIN_PAGES
+                    and not stripped.endswith(":")
+                    and not _BULLET.match(stripped)
+                ):
+                    if key in seen:
+                        removed += 1
+                        continue
+                    seen.add(key)
+            out.append(line)
+    return "\n".join(out), removed
+
+
+def _line_value(line: str) -> float:
+    """Higher = more worth keeping. Contact details, headings, metrics and bullets score high."""
+    stripped = line.strip()
+    if not stripped:
+        return 0.0
+    letters = sum(ch.isalpha() for ch in stripped)
+    if letters < 3:
+        return 0.1
+    value = min(letters, 120) / 120.0
+    if _SIGNAL.search(stripped):
+        value += 2.0
+    if stripped.isupper() and len(stripped) <= 40:
+        value += 1.0          # section headings keep the document's structure
+    if any(ch.isdigit() for ch in stripped):
+        value += 0.5          # dates, metrics, grades
+    if _BULLET.match(stripped):
+        value += 0.3
+    return value
+
+
+def fit_to_budget(text: str, max_tokens: int) -> tuple:
+    """
+    Drop the lowest-value lines until text fits max_tokens.
+    Ties drop later lines first (CVs front-load what matters).
+    Returns (text, lines_dropped).
+    """
+    if max_tokens is None or estimate_tokens(text) <= max_tokens:
+        return text, 0
+
+    lines  = text.split("\n")
+    costs  = [estimate_tokens(line) + 1 for line in lines]
+    total  = sum(costs)
+    order  = sorted(range(len(lines)), key=lambda i: (_line_value(lines[i]), -i))
+    keep   = [True] * len(lines)
+    dropped = 0
+    for i in order:
+        if total <= max_tokens:
+            break
+        keep[i] = False
+        total  -= costs[i]
+        dropped += 1 if lines[i].strip() else 0
+
+    fitted = "\n".join(line for line, k in zip(lines, keep) if k)
+    # A single huge line can still overflow — hard-cut as a last resort
+    if estimate_tokens(fitted) > max_tokens:
+        fitted = fitted[: max_tokens * 4]
+    return fitted, dropped
+
+
+def _split_bullets(value, bullets: list):
+    """
+    Copy of a JSON value with every string split into cells ([text] lists)
+    around its <li> items; the <li> cells are appended to bullets so they
+    can be blanked in place.
+    """
+    if isinstance(value, dict):
+        return {k: _split_bullets(v, bullets) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_split_bullets(v, bullets) for v in value]
+    if not isinstance(value, str):
+        return value
+    cells = [[part] for part in _LIST_ITEM.split(value) if part]
+    bullets.extend(cell for cell in cells if _LIST_ITEM.fullmatch(cell[0]))
+    return tuple(cells)
+
+
+def _join_bullets(value):
+    if isinstance(value, dict):
+        return {k: _join_bullets(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_join_bullets(v) for v in value]
+    if isinstance(value, tuple):
+        return "".join(cell[0] for cell in value)
+    return value
+
+
+def _drop_bullets(obj, max_tokens: int) -> tuple:
+    """
+    fit_to_budget for JSON: drop whole <li> bullets, lowest value first
+    (ties drop later bullets first). Returns (obj, bullets_dropped).
+    """
+    bullets = []
+    cells   = _split_bullets(obj, bullets)
+    total   = estimate_tokens(json.dumps(obj, ensure_ascii=False, separators=(",", ":")))
+    order   = sorted(
+        range(len(bullets)),
+        key=lambda i: (_line_value(_TAG.sub(" ", bullets[i][0])), -i),
+    )
+    dropped = 0
+    for i in order:
+        if total <= max_tokens:
+            break
+        total -= estimate_tokens(bullets[i][0])
+        bullets[i][0] = ""
+        dropped += 1
+    return _join_bullets(cells), dropped
+
+
+# ─────────────────────────────────────────────────────
+# PUBLIC API
+# ─────────────────────────────────────────────────────
+
+def compact_text(text: str, max_tokens: int = None) -> tuple:
+    """
+    Run all passes. Returns (compacted_text, report) where report is
+        {"chars_before", "chars_after", "tokens_before", "tokens_after",
+         "furniture_removed", "lines_dropped"}
+    """
+    text = text or ""
+    pages = PAGE_BREAK.join(collapse_whitespace(page) for page in text.split(PAGE_BREAK))
+    deduped, furniture = remove_furniture(pages)
+    fitted, dropped = fit_to_budget(collapse_whitespace(deduped), max_tokens)
+    return fitted, {
+        "chars_before":      len(text),
+        "chars_after":       len(fitted),
+        "tokens_before":     estimate_tokens(text),
+        "tokens_after":      estimate_tokens(fitted),
+        "furniture_removed": furniture,
+        "lines_dropped":     dropped,
+    }
+
+
+def compact_json(obj, max_tokens: int = None) -> tuple:
+    """
+    Serialise obj compactly for a prompt. Returns (json_str, report).
+
+    String values get their whitespace collapsed; if the result is still
+    over budget whole <li> bullets are dropped, lowest value first, so the
+    JSON and its HTML stay valid and every key survives. Only if that is
+    not enough are the longest strings shortened from the end.
+    """
+    before = json.dumps(obj, ensure_ascii=False)
+
+    def squeeze(value):
+        if isinstance(value, str):
+            return " ".join(value.split())
+        if isinstance(value, list):
+            return [squeeze(v) for v in value]
+        if isinstance(value, dict):
+            return {k: squeeze(v) for k, v in value.items()}
+        return value
+
+    obj = squeeze(obj)
+    dump = lambda o: json.dumps(o, ensure_ascii=False, separators=(",", ":"))
+    out = dump(obj)
+    dropped = 0
+
+    while max_tokens is not None and estimate_tokens(out) > max_tokens:
+        obj, n = _drop_bullets(obj, max_tokens)   # per-bullet costs are estimates — repeat
+        if not n:
+            break
+        dropped += n
+        out = dump(obj)
+
+    if max_tokens is not None and isinstance(obj, dict):
+        # Last resort: a budget too small even for the bullet-free skeleton
+        while estimate_tokens(out) > max_tokens:
+            strings = [k for k, v in obj.items() if isinstance(v, str) and v]
+            if not strings:
+                break
+            longest = max(strings, key=lambda k: len(obj[k]))
+            value   = obj[longest]
+            over    = estimate_tokens(out) - max_tokens
+            keep    = int(len(value) * (1 - over / max(estimate_tokens(value), 1))) - 16
+            obj[longest] = value[: max(0, keep)]
+            out = dump(obj)
+
+    return out, {
+        "chars_before":      len(before),
+        "chars_after":       len(out),
+        "tokens_before":     estimate_tokens(before),
+        "tokens_after":      estimate_tokens(out),
+        "furniture_removed": 0,
+        "lines_dropped":     dropped,
+    }
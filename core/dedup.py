@@ -0,0 +1,234 @@
+"""
+core/dedup.py
+=============
+Near-duplicate detection for raw CV text, so a re-upload reuses the base CV
+extracted last time instead of paying for another extraction call.
+
+- Normalised text (NFKC, lowercase, punctuation/whitespace folded) → exact
+  match by sha256; a re-exported PDF with different spacing lands here
+- 64-bit SimHash over word 3-shingles for near matches; candidates found
+  through 4 × 16-bit bands (Hamming ≤ 3 ⇒ at least one band is identical)
+- Near match → the stored base CV is diff-updated: small word-level
+  replacements (a changed date, a fixed typo) are applied to the stored
+  fields when each old phrase occurs exactly once; anything else is a miss
+- Bounded LRU, thread-safe; per process (share it via st.cache_resource)
+- No st imports — pure utility module
+"""
+
+import copy
+import difflib
+import hashlib
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+
+import numpy as np
+
+# ─────────────────────────────────────────────────────
+# CONSTANTS
+# ─────────────────────────────────────────────────────
+
+FINGERPRINT_BITS = 64
+BANDS            = 4       # FINGERPRINT_BITS / BANDS bits per band
+MAX_DISTANCE     = 3       # Hamming distance that still counts as "the same CV"
+SHINGLE_WORDS    = 3
+MAX_PATCH_WORDS  = 12      # changed words a near match may carry and still be patched
+MAX_CONTEXT      = 3       # unchanged words borrowed on each side to make an old phrase unique
+MAX_ENTRIES      = 500
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+# ─────────────────────────────────────────────────────
+# FINGERPRINTS
+# ─────────────────────────────────────────────────────
+
+def normalize_text(text: str) -> str:
+    """Fold everything an export or copy-paste may change without changing the CV."""
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+def text_hash(normalized: str) -> str:
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def simhash(normalized: str) -> int:
+    """64-bit SimHash of the word 3-shingles of already-normalised text."""
+    words = normalized.split()
+    if not words:
+        return 0
+    shingles = [
+        " ".join(words[i : i + SHINGLE_WORDS])
+        for i in range(max(1, len(words) - SHINGLE_WORDS + 1))
+    ]
+    hashes = np.array(
+        [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big") for s in shingles],
+        dtype=np.uint64,
+    )
+    shifts = np.arange(FINGERPRINT_BITS, dtype=np.uint64)
+    bits   = (hashes[:, None] >> shifts) & np.uint64(1)
+    votes  = 2 * bits.sum(axis=0, dtype=np.int64) - len(shingles)
+    return sum(1 << i for i in np.nonzero(votes > 0)[0].tolist())
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def _bands(fingerprint: int) -> list:
+    width = FINGERPRINT_BITS // BANDS
+    mask  = (1 << width) - 1
+    return [(fingerprint >> (i * width)) & mask for i in range(BANDS)]
+
+
+# ─────────────────────────────────────────────────────
+# DIFF-UPDATE
+# ─────────────────────────────────────────────────────
+
+_CONTEXTS = sorted(
+    ((left, right) for left in range(MAX_CONTEXT + 1) for right in range(MAX_CONTEXT + 1)),
+    key=lambda lr: (lr[0] + lr[1], -lr[0]),
+)
+
+
+def _unique_field(cv: dict, phrase: str):
+    """The one string field containing phrase exactly once, else None."""
+    hits = [k for k, v in cv.items() if isinstance(v, str) and phrase in v]
+    if len(hits) == 1 and cv[hits[0]].count(phrase) == 1:
+        return hits[0]
+    return None
+
+
+def _patch(base_cv: dict, old_text: str, new_text: str):
+    """
+    Carry small word-level replacements from old_text → new_text into a copy
+    of base_cv. Each old phrase grows by up to MAX_CONTEXT unchanged words
+    per side until it occurs exactly once in the CV's string fields
+    ("2023)" alone is ambiguous, "Company 3 (2019 - 2023)" isn't).
+    Returns None when the edit can't be applied safely: insertions/
+    deletions, more than MAX_PATCH_WORDS changed, or no unique anchor.
+    """
+    old_words, new_words = old_text.split(), new_text.split()
+    matcher = difflib.SequenceMatcher(None, old_words, new_words, autojunk=False)
+
+    patched, changed = copy.deepcopy(base_cv), 0
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == "equal":
+            continue
+        if op != "replace":
+            return None
+        changed += max(i2 - i1, j2 - j1)
+        if changed > MAX_PATCH_WORDS:
+            return None
+        for left, right in _CONTEXTS:
+            if left > i1 or i2 + right > len(old_words):
+                continue
+            before, after = old_words[i1 - left : i1], old_words[i2 : i2 + right]
+            old = " ".join(before + old_words[i1:i2] + after)
+            field = _unique_field(patched, old)
+            if field is not None:
+                new = " ".join(before + new_words[j1:j2] + after)
+                patched[field] = patched[field].replace(old, new)
+                break
+        else:
+            return None
+    return patched
+
+
+# ─────────────────────────────────────────────────────
+# INDEX
+# ─────────────────────────────────────────────────────
+
+class CVIndex:
+    """Bounded index of prior extractions: raw text fingerprint → base CV."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, max_distance: int = MAX_DISTANCE):
+        self.max_entries  = max_entries
+        self.max_distance = max_distance
+
+        self._lock    = threading.Lock()
+        self._entries = OrderedDict()                  # text hash → entry dict
+        self._bands   = [{} for _ in range(BANDS)]     # band value → {text hashes}
+        self._counts  = {"exact": 0, "near": 0, "near_unpatchable": 0, "misses": 0, "added": 0}
+
+    def lookup(self, raw_text: str) -> tuple:
+        """
+        Return (base_cv, "exact" | "near") for a known CV, else (None, None).
+        The returned dict is a copy — callers may mutate it.
+        """
+        normalized = normalize_text(raw_text)
+        key = text_hash(normalized)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._counts["exact"] += 1
+                return copy.deepcopy(entry["base_cv"]), "exact"
+
+            fingerprint = simhash(normalized)
+            candidates = set()
+            for band, value in zip(self._bands, _bands(fingerprint)):
+                candidates |= band.get(value, set())
+            best = min(
+                (self._entries[k] for k in candidates),
+                key=lambda e: hamming(e["fingerprint"], fingerprint),
+                default=None,
+            )
+            if best is None or hamming(best["fingerprint"], fingerprint) > self.max_distance:
+                self._counts["misses"] += 1
+                return None, None
+            old_text, base_cv = best["raw_text"], best["base_cv"]
+
+        patched = _patch(base_cv, old_text, raw_text)
+        with self._lock:
+            if patched is None:
+                self._counts["near_unpatchable"] += 1
+                return None, None
+            self._counts["near"] += 1
+        return patched, "near"
+
+    def add(self, raw_text: str, base_cv: dict) -> None:
+        """Remember a successful extraction (incomplete/error results are skipped)."""
+        if not base_cv or base_cv.get("_missing_fields"):
+            return
+        if str(base_cv.get("experience", "")).startswith("<p><b>Extraction Error"):
+            return
+        normalized  = normalize_text(raw_text)
+        key         = text_hash(normalized)
+        fingerprint = simhash(normalized)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = {
+                "fingerprint": fingerprint,
+                "raw_text":    raw_text,
+                "base_cv":     copy.deepcopy(base_cv),
+            }
+            for band, value in zip(self._bands, _bands(fingerprint)):
+                band.setdefault(value, set()).add(key)
+            self._counts["added"] += 1
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        for band, value in zip(self._bands, _bands(entry["fingerprint"])):
+            keys = band.get(value)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del band[value]
+
+    def stats(self) -> dict:
+        with self._lock:
+            out = dict(self._counts)
+            out["entries"] = len(self._entries)
+            return out
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for band in self._bands:
+                band.clear()
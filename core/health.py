@@ -0,0 +1,166 @@
+"""
+core/health.py
+==============
+Per-backend health tracking + circuit breakers for the LLM cascade.
+
+A backend is a (provider, model) tuple, e.g. ("gemini", "gemini-2.0-flash").
+
+- EWMA latency and EWMA error rate per backend
+- Circuit opens after FAILURE_THRESHOLD consecutive failures
+- After OPEN_SECONDS one half-open probe is let through; success closes
+  the circuit, failure re-opens it
+- rank() orders healthy backends fastest-first for routing
+- No st imports — pure utility module
+"""
+
+import threading
+import time
+
+# ─────────────────────────────────────────────────────
+# CONSTANTS
+# ─────────────────────────────────────────────────────
+
+FAILURE_THRESHOLD = 3      # consecutive failures before the circuit opens
+OPEN_SECONDS      = 30.0   # how long an open circuit rejects calls before probing
+EWMA_ALPHA        = 0.3    # weight of the newest sample
+ERROR_PENALTY     = 30.0   # seconds added to the routing score per unit of error rate
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class HealthTracker:
+    """Thread-safe circuit breaker + latency tracker for LLM backends."""
+
+    def __init__(
+        self,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        open_seconds: float = OPEN_SECONDS,
+        alpha: float = EWMA_ALPHA,
+    ):
+        self.failure_threshold = failure_threshold
+        self.open_seconds      = open_seconds
+        self.alpha             = alpha
+
+        self._lock     = threading.Lock()
+        self._backends = {}   # (provider, model) → state dict
+
+    # ── routing ──────────────────────────────────────
+
+    def rank(self, backends: list) -> list:
+        """
+        Return the available backends, fastest first.
+        The routing score is EWMA latency plus ERROR_PENALTY × EWMA error rate,
+        so a backend that fails quickly never looks "fast".
+        Backends without latency samples keep their given order, after measured ones.
+        """
+        with self._lock:
+            now = time.time()
+            available = [b for b in backends if self._available(self._state(b), now)]
+            measured   = [b for b in available if self._state(b)["ewma_latency"] is not None]
+            unmeasured = [b for b in available if self._state(b)["ewma_latency"] is None]
+            measured.sort(key=lambda b: self._score(self._state(b)))
+            return measured + unmeasured
+
+    def acquire(self, backend: tuple) -> bool:
+        """
+        Ask to call backend now. Returns False while its circuit is open.
+        An expired open circuit moves to half-open and this caller becomes the probe.
+        """
+        with self._lock:
+            st  = self._state(backend)
+            now = time.time()
+            if st["state"] == CLOSED:
+                return True
+            if st["state"] == OPEN and now - st["opened_at"] >= self.open_seconds:
+                st["state"]   = HALF_OPEN
+                st["probing"] = False
+            if st["state"] == HALF_OPEN and not st["probing"]:
+                st["probing"] = True
+                return True
+            return False
+
+    # ── outcomes ─────────────────────────────────────
+
+    def record_success(self, backend: tuple, latency: float) -> None:
+        with self._lock:
+            st = self._state(backend)
+            st["calls"]       += 1
+            st["failures"]     = 0
+            st["state"]        = CLOSED
+            st["probing"]      = False
+            st["ewma_latency"] = self._ewma(st["ewma_latency"], latency)
+            st["ewma_errors"]  = self._ewma(st["ewma_errors"], 0.0)
+
+    def record_failure(self, backend: tuple, latency: float = None) -> None:
+        with self._lock:
+            st = self._state(backend)
+            st["calls"]      += 1
+            st["errors"]     += 1
+            st["failures"]   += 1
+            st["ewma_errors"] = self._ewma(st["ewma_errors"], 1.0)
+            if latency is not None:
+                st["ewma_latency"] = self._ewma(st["ewma_latency"], latency)
+            if st["state"] == HALF_OPEN or st["failures"] >= self.failure_threshold:
+                st["state"]     = OPEN
+                st["opened_at"] = time.time()
+            st["probing"] = False
+
+    def release(self, backend: tuple) -> None:
+        """Neutral outcome (e.g. model 404) — frees a half-open probe slot without scoring."""
+        with self._lock:
+            self._state(backend)["probing"] = False
+
+    # ── monitoring ───────────────────────────────────
+
+    def snapshot(self) -> dict:
+        """{"provider/model": {state, calls, errors, error_rate, ewma_latency, ...}}"""
+        with self._lock:
+            now = time.time()
+            out = {}
+            for (provider, model), st in self._backends.items():
+                out[f"{provider}/{model}"] = {
+                    "state":        st["state"],
+                    "available":    self._available(st, now),
+                    "calls":        st["calls"],
+                    "errors":       st["errors"],
+                    "error_rate":   round(st["ewma_errors"] or 0.0, 3),
+                    "ewma_latency": None if st["ewma_latency"] is None else round(st["ewma_latency"], 3),
+                    "consecutive_failures": st["failures"],
+                }
+            return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._backends.clear()
+
+    # ── internals (caller holds the lock) ────────────
+
+    def _state(self, backend: tuple) -> dict:
+        st = self._backends.get(backend)
+        if st is None:
+            st = {
+                "state": CLOSED, "failures": 0, "calls": 0, "errors": 0,
+                "ewma_latency": None, "ewma_errors": None,
+                "opened_at": 0.0, "probing": False,
+            }
+            self._backends[backend] = st
+        return st
+
+    def _available(self, st: dict, now: float) -> bool:
+        if st["state"] == CLOSED:
+            return True
+        if st["state"] == OPEN:
+            return now - st["opened_at"] >= self.open_seconds
+        return not st["probing"]
+
+    def _score(self, st: dict) -> float:
+        return st["ewma_latency"] + ERROR_PENALTY * (st["ewma_errors"] or 0.0)
+
+    def _ewma(self, current, sample: float) -> float:
+        if current is None:
+            return float(sample)
+        return self.alpha * sample + (1 - self.alpha) * current
+
+
+# Shared by every caller in this process
+HEALTH = HealthTracker()
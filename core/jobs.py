@@ -0,0 +1,210 @@
+"""
+core/jobs.py
+============
+Background job executor for slow LLM work, so the Streamlit script thread
+only submits and polls.
+
+- One process-wide pool; MAX_CONCURRENT jobs run at once across all
+  sessions, at most MAX_PENDING wait behind them (submit raises when full)
+- submit() returns a job id; get() returns a snapshot: state (queued /
+  running / done / failed / cancelled), result, error, latest partial
+- Generator jobs (e.g. stream_extract_base_cv) are iterated here: every
+  yielded value becomes the job's partial, so the UI can preview it
+- with_progress=True passes a progress(value) callback for the same purpose
+- cancel(): a queued job never starts; a running one is abandoned — its
+  result is discarded and generators stop at the next yield. Its thread
+  is busy until the call returns, so stats() keeps counting it as running
+  (and as cancelling) until then
+- Submitting a job with the same (owner, kind) as an active one cancels it
+- Finished jobs are dropped JOB_TTL seconds after they end
+- No st imports — pure utility module
+"""
+
+import inspect
+import itertools
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# ─────────────────────────────────────────────────────
+# CONSTANTS
+# ─────────────────────────────────────────────────────
+
+MAX_CONCURRENT = 4          # LLM jobs running at once — keep under the provider rate limit
+MAX_PENDING    = 32         # queued behind them before submit() refuses
+JOB_TTL        = 15 * 60    # seconds a finished job stays collectable
+
+ACTIVE_STATES = ("queued", "running")
+
+
+class _Job:
+    def __init__(self, job_id: str, kind: str, owner: str):
+        self.id        = job_id
+        self.kind      = kind
+        self.owner     = owner
+        self.state     = "queued"
+        self.result    = None
+        self.partial   = None
+        self.error     = None
+        self.submitted = time.time()
+        self.started   = None
+        self.finished  = None
+        self.cancelled = threading.Event()
+        self.future    = None
+
+    def snapshot(self) -> dict:
+        now = time.time()
+        return {
+            "id":        self.id,
+            "kind":      self.kind,
+            "state":     self.state,
+            "result":    self.result,
+            "partial":   self.partial,
+            "error":     self.error,
+            "waited":    round((self.started or now) - self.submitted, 1),
+            "elapsed":   round((self.finished or now) - (self.started or now), 1) if self.started else 0.0,
+        }
+
+
+# ─────────────────────────────────────────────────────
+# EXECUTOR
+# ─────────────────────────────────────────────────────
+
+class JobExecutor:
+    """Bounded background pool with job ids, status snapshots and cancellation."""
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT, max_pending: int = MAX_PENDING, ttl: float = JOB_TTL):
+        self.max_concurrent = max_concurrent
+        self.max_pending    = max_pending
+        self.ttl            = ttl
+
+        self._pool   = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="job")
+        self._lock   = threading.Lock()
+        self._jobs   = {}                               # id → _Job
+        self._active = {}                               # id → _Job whose worker thread is still busy
+        self._seq    = itertools.count(1)
+        self._counts = {"submitted": 0, "done": 0, "failed": 0, "cancelled": 0, "rejected": 0}
+
+    def submit(self, fn, *args, kind: str = "", owner: str = "", with_progress: bool = False, **kwargs) -> str:
+        """
+        Queue fn(*args, **kwargs) and return its job id. Any active job of
+        the same owner and kind is cancelled first. Raises RuntimeError when
+        MAX_PENDING jobs are already waiting.
+        """
+        with self._lock:
+            self._purge()
+            for job in self._jobs.values():
+                if job.owner == owner and job.kind == kind and job.state in ACTIVE_STATES:
+                    self._cancel(job)
+            queued = sum(1 for job in self._jobs.values() if job.state == "queued")
+            if queued >= self.max_pending:
+                self._counts["rejected"] += 1
+                raise RuntimeError("Server is busy — too many AI requests queued. Please try again shortly.")
+            job = _Job(f"{next(self._seq)}-{uuid.uuid4().hex[:8]}", kind, owner)
+            self._jobs[job.id] = job
+            self._counts["submitted"] += 1
+        if with_progress:
+            kwargs["progress"] = lambda value: self._set_partial(job, value)
+        job.future = self._pool.submit(self._run, job, fn, args, kwargs)
+        return job.id
+
+    def get(self, job_id: str):
+        """Snapshot dict of the job, or None if unknown / already purged."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.snapshot() if job is not None else None
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job. Returns False if it had already finished."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job is not None and self._cancel(job)
+
+    def forget(self, job_id: str) -> None:
+        """Drop a finished job once its result has been collected."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.state not in ACTIVE_STATES:
+                del self._jobs[job_id]
+
+    def stats(self) -> dict:
+        """
+        Counters plus pool occupancy: running = worker threads busy (abandoned
+        jobs included, they still hold a slot), cancelling = those abandoned.
+        """
+        with self._lock:
+            out = dict(self._counts)
+            out["running"]    = len(self._active)
+            out["cancelling"] = sum(1 for job in self._active.values() if job.cancelled.is_set())
+            out["queued"]     = sum(1 for job in self._jobs.values() if job.state == "queued")
+            return out
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for job in self._jobs.values():
+                self._cancel(job)
+        self._pool.shutdown(wait=False)
+
+    # ── internals ────────────────────────────────────
+
+    def _run(self, job: _Job, fn, args: tuple, kwargs: dict) -> None:
+        with self._lock:
+            if job.cancelled.is_set():
+                return
+            job.state   = "running"
+            job.started = time.time()
+            self._active[job.id] = job
+        try:
+            self._call(job, fn, args, kwargs)
+        finally:
+            with self._lock:
+                self._active.pop(job.id, None)
+
+    def _call(self, job: _Job, fn, args: tuple, kwargs: dict) -> None:
+        try:
+            result = fn(*args, **kwargs)
+            if inspect.isgenerator(result):
+                stream, result = result, None
+                for result in stream:
+                    if job.cancelled.is_set():
+                        stream.close()
+                        return
+                    self._set_partial(job, result)
+        except Exception as e:
+            self._finish(job, "failed", error=str(e))
+            return
+        self._finish(job, "done", result=result)
+
+    def _set_partial(self, job: _Job, value) -> None:
+        with self._lock:
+            job.partial = value
+
+    def _finish(self, job: _Job, state: str, result=None, error: str = None) -> None:
+        with self._lock:
+            if job.cancelled.is_set():
+                return                   # abandoned — keep the "cancelled" state
+            job.state, job.result, job.error = state, result, error
+            job.finished = time.time()
+            self._counts[state] += 1
+
+    def _cancel(self, job: _Job) -> bool:
+        """Caller holds the lock."""
+        if job.state not in ACTIVE_STATES:
+            return False
+        job.cancelled.set()
+        if job.future is not None:
+            job.future.cancel()          # no-op once running
+        job.state    = "cancelled"
+        job.finished = time.time()
+        self._counts["cancelled"] += 1
+        return True
+
+    def _purge(self) -> None:
+        """Caller holds the lock."""
+        cutoff = time.time() - self.ttl
+        for job_id in [
+            i for i, job in self._jobs.items()
+            if job.finished and job.finished < cutoff and i not in self._active
+        ]:
+            del self._jobs[job_id]
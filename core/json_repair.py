@@ -0,0 +1,204 @@
+"""
+core/json_repair.py
+===================
+Tolerant JSON recovery for truncated / messy LLM responses.
+
+- Single pass, recursive descent from the first "{"
+- Closes unterminated strings, arrays and objects at end of input
+- Accepts the usual model slips: trailing commas, raw newlines inside
+  strings, Python True/False/None, prose after the closing brace
+- Keeps every COMPLETE top-level field; a field cut off mid-value is
+  reported as truncated instead of being half-filled
+No st imports — pure utility module
+"""
+
+import json
+
+_WS = " \t\r\n"
+
+_LITERALS = {
+    "true": True, "false": False, "null": None,
+    "True": True, "False": False, "None": None,
+}
+
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class _Parser:
+    """Every parse_* method returns (value, complete)."""
+
+    def __init__(self, text: str, pos: int):
+        self.text = text
+        self.pos  = pos
+        self.n    = len(text)
+
+    def skip_ws(self) -> None:
+        while self.pos < self.n and self.text[self.pos] in _WS:
+            self.pos += 1
+
+    def parse_value(self):
+        self.skip_ws()
+        if self.pos >= self.n:
+            return None, False
+        ch = self.text[self.pos]
+        if ch == "{":
+            return self.parse_object()
+        if ch == "[":
+            return self.parse_array()
+        if ch == '"':
+            return self.parse_string()
+        return self.parse_scalar()
+
+    def parse_object(self):
+        self.pos += 1                       # consume "{"
+        obj = {}
+        while True:
+            self.skip_ws()
+            if self.pos >= self.n:
+                return obj, False
+            ch = self.text[self.pos]
+            if ch == "}":
+                self.pos += 1
+                return obj, True
+            if ch == ",":
+                self.pos += 1
+                continue
+            if ch != '"':
+                # Unquoted key or junk — skip to the next delimiter
+                self.pos += 1
+                continue
+            key, ok = self.parse_string()
+            if not ok:
+                return obj, False
+            self.skip_ws()
+            if self.pos >= self.n:
+                return obj, False
+            if self.text[self.pos] == ":":
+                self.pos += 1
+            value, ok = self.parse_value()
+            if not ok:
+                if value is not None:
+                    obj[key] = value
+                return obj, False
+            obj[key] = value
+
+    def parse_array(self):
+        self.pos += 1                       # consume "["
+        arr = []
+        while True:
+            self.skip_ws()
+            if self.pos >= self.n:
+                return arr, False
+            ch = self.text[self.pos]
+            if ch == "]":
+                self.pos += 1
+                return arr, True
+            if ch == ",":
+                self.pos += 1
+                continue
+            value, ok = self.parse_value()
+            if value is not None or ok:
+                arr.append(value)
+            if not ok:
+                return arr, False
+
+    def parse_string(self):
+        self.pos += 1                       # consume opening quote
+        out = []
+        start = self.pos
+        text, n = self.text, self.n
+        while self.pos < n:
+            ch = text[self.pos]
+            if ch == '"':
+                out.append(text[start : self.pos])
+                self.pos += 1
+                return "".join(out), True
+            if ch == "\\":
+                out.append(text[start : self.pos])
+                if self.pos + 1 >= n:
+                    self.pos = n
+                    return "".join(out), False
+                esc = text[self.pos + 1]
+                if esc == "u" and self.pos + 6 <= n:
+                    try:
+                        out.append(chr(int(text[self.pos + 2 : self.pos + 6], 16)))
+                        self.pos += 6
+                    except ValueError:
+                        out.append(esc)
+                        self.pos += 2
+                elif esc == "u":
+                    self.pos = n
+                    return "".join(out), False
+                else:
+                    out.append(_ESCAPES.get(esc, esc))
+                    self.pos += 2
+                start = self.pos
+                continue
+            self.pos += 1
+        out.append(text[start:])
+        return "".join(out), False
+
+    def parse_scalar(self):
+        start = self.pos
+        while self.pos < self.n and self.text[self.pos] not in ",}]" + _WS:
+            self.pos += 1
+        token = self.text[start : self.pos]
+        at_end = self.pos >= self.n
+        if token in _LITERALS:
+            return _LITERALS[token], not at_end
+        try:
+            value = json.loads(token)
+        except ValueError:
+            return None, False
+        # A number running into end-of-input may have been cut ("7" of "75")
+        return value, not at_end
+
+
+def repair_json(text: str) -> tuple:
+    """
+    Recover a top-level JSON object from messy / truncated text.
+
+    Returns (fields, truncated_keys):
+      fields          dict of every top-level field whose value was complete
+      truncated_keys  keys whose value was cut off (not included in fields)
+
+    Raises ValueError if the text has no "{" at all.
+    """
+    text = text or ""
+    start = text.find("{")
+    if start == -1:
+        raise ValueError("No JSON object found in response")
+
+    parser = _Parser(text, start)
+    parser.pos += 1
+    fields, truncated = {}, []
+
+    while True:
+        parser.skip_ws()
+        if parser.pos >= parser.n:
+            break
+        ch = text[parser.pos]
+        if ch == "}":
+            break
+        if ch != '"':
+            parser.pos += 1
+            continue
+        key, ok = parser.parse_string()
+        if not ok:
+            break
+        parser.skip_ws()
+        if parser.pos < parser.n and text[parser.pos] == ":":
+            parser.pos += 1
+        value, ok = parser.parse_value()
+        if ok:
+            fields[key] = value
+        else:
+            truncated.append(key)
+            break
+
+    return fields, truncated
+
+
+def missing_fields(fields: dict, truncated: list, required: list) -> list:
+    """Required keys that were truncated or never produced, in required order."""
+    return [key for key in required if key in truncated or key not in fields]
@@ -0,0 +1,164 @@
+"""
+core/json_stream.py
+===================
+Incremental JSON parser for streamed LLM output.
+
+- Feed text chunks as they arrive from the provider
+- Each top-level key of the outer {...} object is emitted as soon as its
+  value is complete (strings at the closing quote, arrays/objects at the
+  closing bracket, scalars at the next delimiter)
+- Markdown fences / chatter before the first "{" are ignored
+- Single pass: every character is scanned once
+- No st imports — pure utility module
+"""
+
+import json
+
+_WHITESPACE = " \t\r\n"
+
+
+class IncrementalJSONParser:
+    """
+    Usage:
+        parser = IncrementalJSONParser()
+        for chunk in stream:
+            for key, value in parser.feed(chunk):
+                ...
+        parser.fields   # every completed top-level field so far
+    """
+
+    def __init__(self):
+        self.fields = {}
+        self.done   = False
+
+        self._text  = ""
+        self._pos   = 0
+        self._state = "start"     # start → key → colon → value → after_value → key … → done
+        self._key   = None
+
+        # value scanning state
+        self._value_start = None
+        self._depth       = 0
+        self._in_string   = False
+        self._escape      = False
+        self._key_start   = None
+
+    # ── public API ───────────────────────────────────
+
+    def feed(self, chunk: str) -> list:
+        """Consume a chunk; return the (key, value) pairs completed by it."""
+        if self.done or not chunk:
+            return []
+        self._text += chunk
+        completed = []
+        text = self._text
+
+        while self._pos < len(text) and not self.done:
+            ch = text[self._pos]
+
+            if self._state == "start":
+                if ch == "{":
+                    self._state = "key"
+                self._pos += 1
+
+            elif self._state == "key":
+                if self._key_start is None:
+                    if ch == '"':
+                        self._key_start = self._pos
+                        self._escape    = False
+                    elif ch == "}":
+                        self.done = True
+                    self._pos += 1
+                else:
+                    if self._escape:
+                        self._escape = False
+                    elif ch == "\\":
+                        self._escape = True
+                    elif ch == '"':
+                        try:
+                            self._key = json.loads(text[self._key_start : self._pos + 1])
+                        except ValueError:
+                            self._key = text[self._key_start + 1 : self._pos]
+                        self._key_start = None
+                        self._state     = "colon"
+                    self._pos += 1
+
+            elif self._state == "colon":
+                if ch == ":":
+                    self._state       = "value"
+                    self._value_start = None
+                self._pos += 1
+
+            elif self._state == "value":
+                if self._value_start is None:
+                    if ch in _WHITESPACE:
+                        self._pos += 1
+                        continue
+                    self._value_start = self._pos
+                    self._depth       = 0
+                    self._in_string   = False
+                    self._escape      = False
+
+                end = self._scan_value(ch)
+                if end is not None:
+                    self._emit(text[self._value_start : end], completed)
+                    self._state = "after_value"
+                    if ch in ",}" and self._depth == 0 and end == self._pos:
+                        # scalar terminated by its delimiter — reprocess the delimiter
+                        continue
+                self._pos += 1
+
+            elif self._state == "after_value":
+                if ch == ",":
+                    self._state = "key"
+                elif ch == "}":
+                    self.done = True
+                self._pos += 1
+
+        return completed
+
+    # ── internals ────────────────────────────────────
+
+    def _scan_value(self, ch: str):
+        """Advance value state by one char; return end index (exclusive) when complete."""
+        start_ch = self._text[self._value_start]
+
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+                if self._depth == 0:
+                    return self._pos + 1          # plain string value
+            return None
+
+        if ch == '"':
+            self._in_string = True
+            return None
+
+        if ch in "[{":
+            self._depth += 1
+            return None
+
+        if ch in "]}":
+            if self._depth == 0:
+                return self._pos                  # scalar followed by closing brace
+            self._depth -= 1
+            if self._depth == 0 and start_ch in "[{":
+                return self._pos + 1
+            return None
+
+        if ch == "," and self._depth == 0 and start_ch not in "[{\"":
+            return self._pos                      # scalar followed by comma
+
+        return None
+
+    def _emit(self, raw: str, completed: list) -> None:
+        try:
+            value = json.loads(raw.strip())
+        except ValueError:
+            return                                # malformed value — leave it out
+        self.fields[self._key] = value
+        completed.append((self._key, value))
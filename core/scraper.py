@@ -8,15 +8,49 @@ CHANGES from original:
 - URL scraper logic preserved, just cleaner structure
 - _name_from_url() same logic, just cleaner
 - No st imports — pure utility module
+- PDF pages cached by (file hash, page index); optional page-parallel extraction
+  on a process pool
+- iter_pdf_pages(): lazy page generator; extract_pdf_text(max_tokens=...)
+  stops opening pages once the prompt budget is full (page-parallel in
+  waves of max_workers pages when parallel=True)
+- Adaptive layout: column count detected per page from a char x-position
+  histogram; layout=True extraction only for multi-column pages
+- URL scraping goes through the pooled session in core/sessions.py; the
+  LinkedIn warm-up request is made once per cookie TTL, not per profile
+- scrape_urls(): async bulk scraping with per-host concurrency caps and
+  politeness delays, results yielded as they complete
+- Optional on-disk HTTP cache (build_http_cache): extracted text + ETag /
+  Last-Modified; fresh entries skip the network, stale ones revalidate with
+  a conditional GET and a 304 reuses the stored text
+- Bounded streaming HTML extraction: the body is decoded incrementally up to
+  MAX_HTML_BYTES and fed to a small HTMLParser that stops once the page text
+  budget, og: tags and <title> are all in hand — same output as the
+  BeautifulSoup path (_extract_from_html, kept for the benchmark)
 """
 
+import asyncio
+import codecs
+import hashlib
+import html
+import io
+import os
 import random
 import re
+import threading
+import time
 import urllib.parse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from html.entities import html5 as HTML5_ENTITIES
+from html.parser import HTMLParser
 
+import numpy as np
 import pdfplumber
-import requests
 from bs4 import BeautifulSoup
+from charset_normalizer import from_bytes
+
+from core.cache import TieredCache, make_key
+from core.compaction import PAGE_BREAK, collapse_whitespace, estimate_tokens
+from core.sessions import SESSIONS
 
 # ─────────────────────────────────────────────────────
 # CONSTANTS
@@ -24,6 +58,32 @@ from bs4 import BeautifulSoup
 
 REQUEST_TIMEOUT = 10  # seconds
 
+# Bulk scraping (scrape_urls)
+BULK_CONCURRENCY = 16     # URLs in flight overall
+HOST_CONCURRENCY = 2      # URLs in flight per host
+POLITENESS_DELAY = 1.0    # seconds between request starts to the same host
+
+# Scraped-page HTTP cache
+HTTP_CACHE_PATH  = ".cache/http_pages.sqlite"
+HTTP_MAX_AGE     = 6 * 3600            # seconds an entry is served without revalidating
+HTTP_CACHE_TTL   = 30 * 24 * 3600      # seconds validators are kept for conditional GETs
+HTTP_CACHE_BYTES = 32 * 1024 * 1024
+
+# Streaming HTML extraction
+PAGE_TEXT_CHARS  = 2000               # visible text kept per page
+MAX_HTML_BYTES   = 8 * 1024 * 1024    # never read more of a body than this
+HTML_CHUNK_BYTES = 64 * 1024
+
+PDF_WORKERS        = min(4, os.cpu_count() or 1)
+PDF_PARALLEL_MIN   = 3      # below this many uncached pages a pool costs more than it saves
+PDF_PAGE_CACHE_MAX = 2048   # pages kept in memory across uploads/reruns
+
+# Column detection — x-position histogram over the page width
+LAYOUT_BINS       = 100
+GUTTER_MIN_BINS   = 3       # an empty vertical band ≥ 3% of page width…
+GUTTER_NOISE      = 0.05    # …"empty" = under 5% of the median occupied bin (footers, rules)
+GUTTER_SIDE_SHARE = 0.15    # …with ≥ 15% of the text on each side of it
+
 _USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
@@ -50,78 +110,766 @@ _BASE_HEADERS = {
 # PDF EXTRACTION
 # ─────────────────────────────────────────────────────
 
-def extract_pdf_text(uploaded_file) -> str:
+_page_cache = TieredCache(None, max_memory_entries=PDF_PAGE_CACHE_MAX)
+_pool       = None
+_pool_size  = 0
+_pool_lock  = threading.Lock()
+
+
+def _pdf_bytes(uploaded_file) -> bytes:
+    """Raw bytes from a path, bytes, Streamlit UploadedFile or any file-like object."""
+    if isinstance(uploaded_file, (bytes, bytearray)):
+        return bytes(uploaded_file)
+    if isinstance(uploaded_file, (str, os.PathLike)):
+        with open(uploaded_file, "rb") as f:
+            return f.read()
+    if hasattr(uploaded_file, "getvalue"):
+        return uploaded_file.getvalue()
+    uploaded_file.seek(0)
+    data = uploaded_file.read()
+    uploaded_file.seek(0)
+    return data
+
+
+def _page_key(file_hash: str, index: int, layout) -> str:
+    return make_key("pdf-page", file_hash, index, layout)
+
+
+def count_columns(page) -> int:
+    """
+    Text columns on a pdfplumber page, from where its characters sit.
+
+    Builds a histogram of char x-extents across the page width and counts
+    near-empty vertical bands (gutters) that have a real share of the text
+    on both sides. Right-aligned dates or a centred page number don't make
+    a page multi-column; a sidebar or a two-column body does.
+    """
+    chars = [c for c in page.chars if not c["text"].isspace()]
+    if len(chars) < 50:
+        return 1
+
+    width = float(page.width) or 1.0
+    x0 = np.array([c["x0"] for c in chars], dtype=np.float64)
+    x1 = np.array([c["x1"] for c in chars], dtype=np.float64)
+    lo = np.clip((x0 / width * LAYOUT_BINS).astype(np.int64), 0, LAYOUT_BINS - 1)
+    hi = np.clip((x1 / width * LAYOUT_BINS).astype(np.int64), 0, LAYOUT_BINS - 1)
+    # A glyph spans at most a bin or two at this resolution
+    hist = np.bincount(lo, minlength=LAYOUT_BINS) + np.bincount(hi[hi != lo], minlength=LAYOUT_BINS)
+    starts = np.bincount(lo, minlength=LAYOUT_BINS).cumsum()      # chars starting at or left of bin
+
+    occupied = np.nonzero(hist)[0]
+    first, last = occupied[0], occupied[-1]
+    empty = hist <= GUTTER_NOISE * np.median(hist[occupied])
+
+    total, columns, run = len(chars), 1, 0
+    for b in range(first, last + 1):
+        if empty[b]:
+            run += 1
+            continue
+        if run >= GUTTER_MIN_BINS:
+            left = starts[b - 1] / total
+            if GUTTER_SIDE_SHARE <= left <= 1 - GUTTER_SIDE_SHARE:
+                columns += 1
+        run = 0
+    return columns
+
+
+def _page_text(page, layout) -> str:
+    """layout: True / False, or "auto" = layout mode only for multi-column pages."""
+    if layout == "auto":
+        layout = count_columns(page) > 1
+    return page.extract_text(layout=layout) or ""
+
+
+def _extract_page_range(pdf_bytes: bytes, indexes: list, layout="auto") -> list:
+    """Worker: open the PDF once, extract the given pages → [(index, text)]."""
+    out = []
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        for i in indexes:
+            page = pdf.pages[i]
+            out.append((i, _page_text(page, layout)))
+            page.close()                   # drop parsed layout objects as we go
+    return out
+
+
+def _get_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    One process pool per server process, created on first parallel use and
+    replaced when a caller asks for a different size (the old pool finishes
+    the work it already has, then exits).
+    """
+    global _pool, _pool_size
+    with _pool_lock:
+        if _pool is None or _pool_size != max_workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool, _pool_size = ProcessPoolExecutor(max_workers=max_workers), max_workers
+        return _pool
+
+
+def page_cache_stats() -> dict:
+    return _page_cache.stats()
+
+
+def iter_pdf_pages(uploaded_file, layout="auto"):
+    """
+    Yield (page_index, text) one page at a time, in page order.
+
+    Pages are only opened when the consumer asks for them, and each page's
+    parsed objects are released before the next one is read, so memory stays
+    flat for any page count. Stopping iteration early closes the PDF.
+    """
+    data = _pdf_bytes(uploaded_file)
+    file_hash = hashlib.sha256(data).hexdigest()
+
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        for i, page in enumerate(pdf.pages):
+            key = _page_key(file_hash, i, layout)
+            text = _page_cache.get(key)
+            if text is None:
+                text = _page_text(page, layout)
+                _page_cache.set(key, text)
+            page.close()
+            yield i, text
+
+
+def _iter_pages_pooled(uploaded_file, max_workers: int, layout="auto"):
+    """
+    iter_pdf_pages() on the process pool: uncached pages are extracted
+    max_workers at a time, one page per worker, and yielded in page order.
+    At most one wave runs past the point where the consumer stops; a wave
+    with fewer than PDF_PARALLEL_MIN uncached pages is extracted here.
+    """
+    data = _pdf_bytes(uploaded_file)
+    file_hash = hashlib.sha256(data).hexdigest()
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        n_pages = len(pdf.pages)
+
+    for start in range(0, n_pages, max_workers):
+        wave  = range(start, min(start + max_workers, n_pages))
+        texts = {i: _page_cache.get(_page_key(file_hash, i, layout)) for i in wave}
+        todo  = [i for i in wave if texts[i] is None]
+        if len(todo) >= PDF_PARALLEL_MIN:
+            pool = _get_pool(max_workers)
+            futures = [pool.submit(_extract_page_range, data, [i], layout) for i in todo]
+            results = [pair for f in futures for pair in f.result()]
+        else:
+            results = _extract_page_range(data, todo, layout) if todo else []
+        for i, text in results:
+            texts[i] = text
+            _page_cache.set(_page_key(file_hash, i, layout), text)
+        for i in wave:
+            yield i, texts[i]
+
+
+def _extract_within_budget(
+    uploaded_file,
+    max_chars: int = None,
+    max_tokens: int = None,
+    layout="auto",
+    max_workers: int = 1,
+) -> str:
+    """
+    Consume iter_pdf_pages() (or its pooled variant when max_workers > 1)
+    until the budget is full. Sizes are measured on whitespace-collapsed
+    text — what compaction actually sends — so layout padding doesn't end
+    extraction early. The page that crosses the budget is kept; compaction
+    trims the overflow.
     """
-    Extract text from a PDF using pdfplumber.
-    layout=True preserves column order for multi-column CVs.
+    pages, chars, tokens = [], 0, 0
+    if max_workers > 1:
+        page_iter = _iter_pages_pooled(uploaded_file, max_workers, layout)
+    else:
+        page_iter = iter_pdf_pages(uploaded_file, layout)
+    try:
+        for _, text in page_iter:
+            if not text:
+                continue
+            pages.append(text)
+            compact = collapse_whitespace(text)
+            chars  += len(compact) + 1
+            tokens += estimate_tokens(compact)
+            if (max_chars and chars >= max_chars) or (max_tokens and tokens >= max_tokens):
+                break
+    finally:
+        page_iter.close()
+    return PAGE_BREAK.join(pages)
+
+
+def extract_pdf_text(
+    uploaded_file,
+    parallel: bool = False,
+    max_workers: int = PDF_WORKERS,
+    max_chars: int = None,
+    max_tokens: int = None,
+    layout="auto",
+) -> str:
     """
-    pages = []
-    with pdfplumber.open(uploaded_file) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text(layout=True)
-            if page_text:
-                pages.append(page_text)
-    return "\n".join(pages)
+    Extract text from a PDF using pdfplumber. Pages are joined with
+    PAGE_BREAK ("\\f", where older versions used "\\n") so compaction can
+    tell running headers/footers from repeated content; compact_text()
+    joins them with "\\n" again, so prompts see the same text as before.
+    layout=True preserves column order for multi-column CVs but is slower and
+    pads every line; the default "auto" uses it only on pages where
+    count_columns() finds more than one column.
+
+    Pages are cached by (file content hash, page index), so re-uploads and
+    reruns skip extraction entirely. parallel=True spreads uncached pages
+    over a process pool (output stays in page order).
+
+    With max_chars / max_tokens, pages are read lazily and extraction stops
+    once the budget is full; with parallel=True they are read max_workers
+    pages at a time on the pool, so up to one wave past the budget is
+    extracted (and cached) for nothing.
+    """
+    if max_chars or max_tokens:
+        workers = max_workers if parallel else 1
+        return _extract_within_budget(uploaded_file, max_chars, max_tokens, layout, max(1, workers))
+
+    data = _pdf_bytes(uploaded_file)
+    file_hash = hashlib.sha256(data).hexdigest()
+
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        n_pages = len(pdf.pages)
+
+    texts = {}
+    todo  = []
+    for i in range(n_pages):
+        cached = _page_cache.get(_page_key(file_hash, i, layout))
+        if cached is None:
+            todo.append(i)
+        else:
+            texts[i] = cached
+
+    if todo:
+        workers = max(1, min(max_workers, len(todo)))
+        if parallel and workers > 1 and len(todo) >= PDF_PARALLEL_MIN:
+            chunks = [todo[w::workers] for w in range(workers)]
+            pool = _get_pool(max_workers)
+            futures = [pool.submit(_extract_page_range, data, chunk, layout) for chunk in chunks]
+            results = [pair for f in futures for pair in f.result()]
+        else:
+            results = _extract_page_range(data, todo, layout)
+        for i, text in results:
+            texts[i] = text
+            _page_cache.set(_page_key(file_hash, i, layout), text)
+
+    return PAGE_BREAK.join(texts[i] for i in range(n_pages) if texts[i])
 
 
 # ─────────────────────────────────────────────────────
 # URL SCRAPING
 # ─────────────────────────────────────────────────────
 
-def scrape_url_text(url: str) -> str:
+_http_counts = {"fresh": 0, "revalidated": 0, "fetched": 0}
+_http_lock   = threading.Lock()
+
+
+def build_http_cache(path: str = HTTP_CACHE_PATH, **kwargs) -> TieredCache:
+    """Create the scraped-page cache (wrap in @st.cache_resource from app.py)."""
+    kwargs.setdefault("ttl", HTTP_CACHE_TTL)
+    kwargs.setdefault("max_disk_bytes", HTTP_CACHE_BYTES)
+    return TieredCache(path, **kwargs)
+
+
+def http_cache_stats() -> dict:
+    """How scrapes were served: fresh cache hit / 304 revalidation / full fetch."""
+    with _http_lock:
+        return dict(_http_counts)
+
+
+def _count(outcome: str) -> None:
+    with _http_lock:
+        _http_counts[outcome] += 1
+
+
+def _max_age(response) -> int:
+    """Freshness lifetime: Cache-Control max-age capped at HTTP_MAX_AGE; 0 = always revalidate."""
+    cache_control = response.headers.get("Cache-Control", "").lower()
+    if "no-cache" in cache_control:
+        return 0
+    match = re.search(r"max-age=(\d+)", cache_control)
+    return min(int(match.group(1)), HTTP_MAX_AGE) if match else HTTP_MAX_AGE
+
+
+def _cache_entry(cache: TieredCache, url: str) -> tuple:
+    """(key, entry or None, is_fresh) for url in the page cache."""
+    key   = make_key("http-page", url)
+    entry = cache.get(key) if cache is not None else None
+    fresh = entry is not None and time.time() - entry["fetched_at"] < entry["max_age"]
+    return key, entry, fresh
+
+
+def _extract_from_html(html: str) -> tuple:
+    """
+    og: meta tags + title + visible page text.
+    Returns (extracted_lines, is_authwall).
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    extracted = []
+
+    # og: meta tags (sometimes served even for public profiles)
+    og_title = soup.find("meta", property="og:title")
+    og_desc  = soup.find("meta", property="og:description")
+    if og_title and og_title.get("content"):
+        extracted.append(f"Profile: {og_title['content']}")
+    if og_desc and og_desc.get("content"):
+        extracted.append(f"Summary: {og_desc['content']}")
+
+    title_tag = soup.find("title")
+    if title_tag and title_tag.string:
+        extracted.append(f"Page Title: {title_tag.string}")
+
+    # Strip scripts/styles before getting visible text
+    for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+
+    page_text = soup.get_text(separator=" ", strip=True)
+
+    # Only use page text if it's real content (not just the authwall)
+    is_authwall = "authwall" in page_text.lower()[:300]
+    if len(page_text) > 200 and not is_authwall:
+        extracted.append(f"Page Content:\n{page_text[:2000]}")
+
+    return extracted, is_authwall
+
+
+# Tree-building rules of bs4's html.parser builder, mirrored by _ProfileParser.
+# Copied rather than read from bs4 internals, which may change between releases.
+_VOID_TAGS = frozenset([
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen", "link", "menuitem",
+    "meta", "param", "source", "track", "wbr",
+    "basefont", "bgsound", "command", "frame", "image", "isindex", "nextid", "spacer",
+])
+_PRESERVE_WS_TAGS = frozenset(["pre", "textarea"])
+_CONTAINER_TAGS   = frozenset(["rt", "rp", "style", "script", "template"])  # their strings aren't page text
+_REMOVED_TAGS     = frozenset(["script", "style", "noscript"])             # decomposed before get_text
+_ASCII_SPACES     = " \n\t\x0c\r"
+_OG_PROPERTIES    = ("og:title", "og:description")
+_NUMERIC_REF      = re.compile(r"([0-9]+|[xX][0-9a-fA-F]+)(.*)", re.DOTALL)
+
+# _ProfileParser resumes html.parser's buffer (rawdata / cdata_elem) across
+# chunks; should a Python release drop those, chunks are joined and parsed
+# by the BeautifulSoup path instead
+_STREAMING_PARSER = all(hasattr(HTMLParser(), attr) for attr in ("rawdata", "cdata_elem"))
+
+
+def _dereference_charref(name: str) -> tuple:
+    """
+    (text, trailing data) for a numeric character reference, the way bs4
+    decodes it: html.unescape rules (cp1252 for 0x80–0x9F, U+FFFD for
+    surrogates / out of range), except that noncharacters and control
+    codes are kept rather than dropped.
+    """
+    match = _NUMERIC_REF.match(name)
+    if match is None:
+        return "", name
+    digits, extra = match.groups()
+    text = html.unescape("&#%s;" % digits)
+    if not text:
+        text = chr(int(digits[1:], 16) if digits[0] in "xX" else int(digits))
+    return text, extra
+
+
+class _ProfileParser(HTMLParser):
+    """
+    Event-driven equivalent of _extract_from_html() without building a tree.
+
+    Follows bs4's html.parser builder wherever it affects the result: text
+    runs split at every tag/comment boundary, an end tag pops to the most
+    recent open tag of that name, void tags close immediately, entity and
+    character references decode the bs4 way, and strings under rt/rp/
+    template/script/style/noscript are not page text. Only the subtree of
+    the first <title> is recorded, to reproduce Tag.string.
+
+    bs4 feeds the whole document in one feed() call. When html.parser bails
+    on a malformed "&#" mid-buffer, everything after it is left for close();
+    feed() mirrors that so chunked input parses exactly like one string.
+
+    Inside a multi-chunk <script>/<style>, html.parser keeps re-buffering and
+    re-scanning the whole element body; that body is never page text, so
+    feed() drops all but a short tail (enough to match the closing tag).
+    """
+
+    def __init__(self, text_budget: int = PAGE_TEXT_CHARS):
+        super().__init__(convert_charrefs=False)
+        self.text_budget = text_budget
+        self.og          = {}      # og property → content of the FIRST meta carrying it
+        self.texts       = []      # stripped visible strings (until the budget is met)
+        self.text_len    = 0       # len(" ".join(self.texts))
+        self.title       = None    # <title>.string once known
+        self.title_done  = False
+
+        self._stack          = []
+        self._already_closed = []  # void tags closed on open; a later </tag> is ignored
+        self._data           = []
+        self._removed        = 0   # open script/style/noscript
+        self._contained      = 0   # open string-container tags
+        self._preserve_ws    = 0   # open pre/textarea
+        self._title_path     = None  # open nodes inside the first <title>
+        self._title_depth    = None
+        self._bailed         = False
+
+    @property
+    def complete(self) -> bool:
+        """Nothing later in the document can change the result."""
+        return (
+            self.text_len >= self.text_budget
+            and self.title_done
+            and all(p in self.og for p in _OG_PROPERTIES)
+        )
+
+    # ── tree bookkeeping ─────────────────────────────
+
+    def _push(self, tag: str) -> None:
+        if self._title_path is not None:
+            node = []
+            self._title_path[-1].append(node)
+            self._title_path.append(node)
+        elif tag == "title" and not self.title_done and self._title_depth is None:
+            self._title_depth = len(self._stack)
+            self._title_path  = [[]]
+        self._stack.append(tag)
+        self._removed     += tag in _REMOVED_TAGS
+        self._contained   += tag in _CONTAINER_TAGS
+        self._preserve_ws += tag in _PRESERVE_WS_TAGS
+
+    def _pop_to(self, tag: str) -> None:
+        if tag not in self._stack:
+            return
+        while self._stack:
+            name = self._stack.pop()
+            self._removed     -= name in _REMOVED_TAGS
+            self._contained   -= name in _CONTAINER_TAGS
+            self._preserve_ws -= name in _PRESERVE_WS_TAGS
+            if self._title_path is not None:
+                node = self._title_path.pop()
+                if len(self._stack) == self._title_depth:
+                    self._finish_title(node)
+            if name == tag:
+                return
+
+    def _finish_title(self, node: list) -> None:
+        # Tag.string: the only child string, looking through single-child tags
+        while len(node) == 1 and isinstance(node[0], list):
+            node = node[0]
+        self.title = node[0] if len(node) == 1 else None
+        self.title_done  = True
+        self._title_path = None
+
+    def _flush(self, kind: str = "text") -> None:
+        """bs4 endData(): close the current string (text, comment, cdata, …)."""
+        if not self._data:
+            return
+        data = "".join(self._data)
+        self._data = []
+
+        if self._title_path is not None:
+            if not self._preserve_ws and all(ch in _ASCII_SPACES for ch in data):
+                self._title_path[-1].append("\n" if "\n" in data else " ")
+            else:
+                self._title_path[-1].append(data)
+
+        visible = (kind == "text" and not self._contained) or kind == "cdata"
+        if visible and not self._removed and self.text_len < self.text_budget:
+            stripped = data.strip()
+            if stripped:
+                self.text_len += len(stripped) + (1 if self.texts else 0)
+                self.texts.append(stripped)
+
+    def _start(self, tag: str, attrs: list, handle_empty_element: bool) -> None:
+        self._flush()
+        if tag == "meta":
+            values = {key: "" if value is None else value for key, value in attrs}
+            prop = values.get("property")
+            if prop in _OG_PROPERTIES and prop not in self.og:
+                self.og[prop] = values.get("content")
+        self._push(tag)
+        if tag in _VOID_TAGS and handle_empty_element:
+            self._end(tag, check_already_closed=False)
+            self._already_closed.append(tag)
+
+    def _end(self, tag: str, check_already_closed: bool = True) -> None:
+        if check_already_closed and tag in self._already_closed:
+            self._already_closed.remove(tag)
+            return
+        self._flush()
+        self._pop_to(tag)
+
+    def _special(self, data: str, kind: str) -> None:
+        self._flush()
+        self._data.append(data)
+        self._flush(kind)
+
+    # ── HTMLParser callbacks ─────────────────────────
+
+    def feed(self, data):
+        if self._bailed:
+            self.rawdata += data        # a single feed() would only reach this at close()
+            return
+        if self.cdata_elem and self._title_path is None and len(self.rawdata) > 64:
+            self.rawdata = self.rawdata[-64:]
+        super().feed(data)
+
+    def handle_starttag(self, tag, attrs):
+        self._start(tag, attrs, True)
+
+    def handle_startendtag(self, tag, attrs):
+        self._start(tag, attrs, False)
+        self._end(tag, check_already_closed=False)
+
+    def handle_endtag(self, tag):
+        self._end(tag)
+
+    def handle_data(self, data):
+        if data == "&#":
+            self._bailed = True         # html.parser's "bail by consuming &#"
+        self._data.append(data)
+
+    def handle_charref(self, name):
+        dereferenced, extra = _dereference_charref(name)
+        self.handle_data(dereferenced)
+        self.handle_data(extra)
+
+    def handle_entityref(self, name):
+        character = HTML5_ENTITIES.get(name + ";")
+        self.handle_data(character if character is not None else "&%s" % name)
+
+    def handle_comment(self, data):
+        self._special(data, "comment")
+
+    def handle_decl(self, decl):
+        self._special(decl[len("DOCTYPE "):], "doctype")
+
+    def unknown_decl(self, data):
+        if data.upper().startswith("CDATA["):
+            self._special(data[len("CDATA["):], "cdata")
+        else:
+            self._special(data, "declaration")
+
+    def handle_pi(self, data):
+        self._special(data, "pi")
+
+    def finish(self) -> None:
+        """End of input: flush trailing text and close every open tag."""
+        self.close()
+        self._flush()
+        while self._stack:
+            self._pop_to(self._stack[-1])
+        self.title_done = True
+
+
+def _extract_from_chunks(chunks) -> tuple:
+    """
+    Same result as _extract_from_html() for text arriving in pieces; stops
+    consuming chunks as soon as the rest of the document can't matter.
+    """
+    if not _STREAMING_PARSER:
+        return _extract_from_html("".join(chunks))
+
+    parser = _ProfileParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+        if parser.complete:
+            break
+    else:
+        parser.finish()
+
+    extracted = []
+    og_title, og_desc = parser.og.get("og:title"), parser.og.get("og:description")
+    if og_title:
+        extracted.append(f"Profile: {og_title}")
+    if og_desc:
+        extracted.append(f"Summary: {og_desc}")
+    if parser.title:
+        extracted.append(f"Page Title: {parser.title}")
+
+    page_text = " ".join(parser.texts)
+    is_authwall = "authwall" in page_text.lower()[:300]
+    if len(page_text) > 200 and not is_authwall:
+        extracted.append(f"Page Content:\n{page_text[:PAGE_TEXT_CHARS]}")
+
+    return extracted, is_authwall
+
+
+def _iter_body_text(response, max_bytes: int = MAX_HTML_BYTES):
+    """
+    Decode a streamed body incrementally, at most max_bytes of it, the way
+    response.text would (declared charset, else detected with
+    charset_normalizer, as requests does; undecodable bytes replaced).
+    """
+    if response.encoding is None:
+        data = b""
+        for chunk in response.iter_content(HTML_CHUNK_BYTES):
+            data += chunk
+            if len(data) >= max_bytes:
+                break
+        data = data[:max_bytes]
+        best = from_bytes(data).best() if data else None
+        encoding = best.encoding if best else None
+        try:
+            yield str(data, encoding or "utf-8", errors="replace")
+        except (LookupError, TypeError):
+            yield str(data, errors="replace")
+        return
+
+    try:
+        decoder = codecs.getincrementaldecoder(response.encoding)(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    read = 0
+    for chunk in response.iter_content(HTML_CHUNK_BYTES):
+        chunk = chunk[: max_bytes - read]
+        read += len(chunk)
+        yield decoder.decode(chunk)
+        if read >= max_bytes:
+            break
+    yield decoder.decode(b"", final=True)
+
+
+def _extract_from_response(response) -> tuple:
+    """Stream, extract and release the connection (early exits included)."""
+    try:
+        return _extract_from_chunks(_iter_body_text(response))
+    finally:
+        response.close()
+
+
+def scrape_url_text(url: str, timeout: float = REQUEST_TIMEOUT, cache: TieredCache = None) -> str:
     """
     Try to scrape a public profile URL.
 
     Strategy:
-      1. Visit LinkedIn homepage to get cookies (anti-bot bypass)
+      0. cache given: a fresh entry is returned with no request; a stale one
+         is revalidated (If-None-Match / If-Modified-Since) and a 304 reuses it
+      1. Shared pooled session; LinkedIn warm-up cookies reused until they
+         expire (anti-bot bypass)
       2. Fetch actual profile with randomised UA + full browser headers
       3. Extract og: meta tags + visible page text
-      4. If authwall detected or text too short → fallback to name-from-slug
+      4. Authwall → refresh cookies once and retry
+      5. If still authwalled or text too short → fallback to name-from-slug
 
+    Only real extractions (HTTP 200, no authwall) are cached.
     Returns whatever text could be extracted (never raises).
     """
     headers = {**_BASE_HEADERS, "User-Agent": random.choice(_USER_AGENTS)}
 
+    key, entry, fresh = _cache_entry(cache, url)
+    if entry is not None:
+        if fresh:
+            _count("fresh")
+            return entry["text"]
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
     try:
-        session = requests.Session()
-        # Warm up session with real cookies
-        session.get("https://www.linkedin.com", headers=headers, timeout=8)
+        response = SESSIONS.get(url, headers=headers, timeout=timeout, allow_redirects=True, stream=True)
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            entry["fetched_at"] = time.time()
+            if "Cache-Control" in response.headers:      # else the stored policy stands
+                entry["max_age"] = _max_age(response)
+            cache.set(key, entry)
+            _count("revalidated")
+            return entry["text"]
+
+        extracted, is_authwall = _extract_from_response(response)
 
-        response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT, allow_redirects=True)
-        soup = BeautifulSoup(response.text, "html.parser")
+        authwalled = is_authwall or "authwall" in response.url.lower()
+        if authwalled and SESSIONS.needs_warmup(url) and SESSIONS.refresh_cookies(headers):
+            response = SESSIONS.get(url, headers=headers, timeout=timeout, allow_redirects=True, stream=True)
+            extracted, is_authwall = _extract_from_response(response)
+            authwalled = is_authwall or "authwall" in response.url.lower()
+
+        if extracted:
+            text = "\n".join(extracted)
+            _count("fetched")
+            no_store = "no-store" in response.headers.get("Cache-Control", "").lower()
+            if cache is not None and response.status_code == 200 and not authwalled and not no_store:
+                cache.set(key, {
+                    "text":          text,
+                    "etag":          response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "fetched_at":    time.time(),
+                    "max_age":       _max_age(response),
+                })
+            return text
+
+    except Exception:
+        pass  # Fall through to slug fallback
 
-        extracted = []
+    return _name_from_url(url)
 
-        # og: meta tags (sometimes served even for public profiles)
-        og_title = soup.find("meta", property="og:title")
-        og_desc  = soup.find("meta", property="og:description")
-        if og_title and og_title.get("content"):
-            extracted.append(f"Profile: {og_title['content']}")
-        if og_desc and og_desc.get("content"):
-            extracted.append(f"Summary: {og_desc['content']}")
 
-        title_tag = soup.find("title")
-        if title_tag and title_tag.string:
-            extracted.append(f"Page Title: {title_tag.string}")
+async def scrape_urls(
+    urls,
+    max_concurrency: int = BULK_CONCURRENCY,
+    per_host: int = HOST_CONCURRENCY,
+    delay: float = POLITENESS_DELAY,
+    timeout: float = REQUEST_TIMEOUT,
+    cache: TieredCache = None,
+):
+    """
+    Scrape many URLs concurrently. Async generator yielding
+    (index, url, text) in completion order; index is the position in urls.
 
-        # Strip scripts/styles before getting visible text
-        for tag in soup(["script", "style", "noscript"]):
-            tag.decompose()
+    - At most max_concurrency fetches overall and per_host per host
+    - Request starts to the same host are spaced at least delay seconds apart
+    - Each URL gets timeout seconds end to end (warm-up and retries
+      included), counted from when a worker thread picks it up — a URL
+      queued behind timed-out fetches still busy in their threads does not
+      time out before it starts; a URL that runs out of time gets the
+      _name_from_url() fallback, like any other failed scrape
 
-        page_text = soup.get_text(separator=" ", strip=True)
+    Fetches run scrape_url_text() on a max_concurrency-thread executor
+    (the loop's default one is only cpu_count + 4 wide) over the shared
+    pooled session (and the optional HTTP cache). Leaving the loop early
+    cancels the pending URLs.
+    """
+    urls     = list(urls)
+    total    = asyncio.Semaphore(max_concurrency)
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+    hosts = {}   # netloc → {"sem": Semaphore, "next": loop time of next allowed start}
 
-        # Only use page text if it's real content (not just the authwall)
-        is_authwall = "authwall" in page_text.lower()[:300]
-        if len(page_text) > 200 and not is_authwall:
-            extracted.append(f"Page Content:\n{page_text[:2000]}")
+    async def one(index: int, url: str) -> tuple:
+        host  = urllib.parse.urlparse(url).netloc.lower()
+        state = hosts.setdefault(host, {"sem": asyncio.Semaphore(per_host), "next": 0.0})
+        loop  = asyncio.get_running_loop()
+        if _cache_entry(cache, url)[2]:
+            return index, url, scrape_url_text(url, timeout, cache)   # no request, no politeness wait
+        async with state["sem"]:
+            now   = loop.time()
+            start = max(now, state["next"])
+            state["next"] = start + delay
+            if start > now:
+                await asyncio.sleep(start - now)
+            async with total:
+                started = loop.create_future()
 
-        if extracted:
-            return "\n".join(extracted)
+                def fetch():
+                    # Resolved before the result is posted, so the clock below starts here
+                    loop.call_soon_threadsafe(lambda: started.done() or started.set_result(None))
+                    return scrape_url_text(url, timeout, cache)
 
-    except Exception:
-        pass  # Fall through to slug fallback
+                job = loop.run_in_executor(executor, fetch)
+                await started
+                try:
+                    text = await asyncio.wait_for(job, timeout)
+                except asyncio.TimeoutError:
+                    text = _name_from_url(url)
+        return index, url, text
 
-    return _name_from_url(url)
+    tasks = [asyncio.ensure_future(one(i, url)) for i, url in enumerate(urls)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        executor.shutdown(wait=False)       # timed-out fetches finish in the background
 
 
 # ─────────────────────────────────────────────────────
@@ -0,0 +1,187 @@
+"""
+core/sessions.py
+================
+Process-wide pooled HTTP session for the URL scraper.
+
+- One requests.Session with keep-alive connection pools (HTTPAdapter) and
+  urllib3 retries for connect errors / 429 / 5xx
+- LinkedIn warm-up cookies fetched once and reused for COOKIE_TTL seconds;
+  refreshed early only when an authwall is detected
+- Warm-up only runs for URLs on the warm-up site (portfolios skip it)
+- Pool sizes, retries, TTL and WARMUP_URL are constructor/configure()
+  arguments, so tests can point the manager at a local stand-in server
+- No st imports — pure utility module
+"""
+
+import threading
+import time
+import urllib.parse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# ─────────────────────────────────────────────────────
+# CONSTANTS
+# ─────────────────────────────────────────────────────
+
+WARMUP_URL       = "https://www.linkedin.com"
+WARMUP_TIMEOUT   = 8          # seconds
+COOKIE_TTL       = 30 * 60    # seconds warm-up cookies are trusted
+MIN_REFRESH_GAP  = 60         # never re-warm more often than this (failed warm-ups included)
+
+POOL_CONNECTIONS = 10         # distinct hosts kept in the pool
+POOL_MAXSIZE     = 20         # connections kept per host
+MAX_RETRIES      = 2
+BACKOFF_FACTOR   = 0.3
+RETRY_STATUSES   = (429, 500, 502, 503, 504)
+
+
+def _site(url: str) -> str:
+    """Host without a leading "www." — linkedin.com and www.linkedin.com match."""
+    host = (urllib.parse.urlparse(url).netloc or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+# ─────────────────────────────────────────────────────
+# SESSION MANAGER
+# ─────────────────────────────────────────────────────
+
+class SessionManager:
+    """Owns the shared scraping session and its warm-up cookie lifetime."""
+
+    def __init__(
+        self,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        max_retries: int = MAX_RETRIES,
+        backoff_factor: float = BACKOFF_FACTOR,
+        cookie_ttl: float = COOKIE_TTL,
+        warmup_url: str = WARMUP_URL,
+        warmup_timeout: float = WARMUP_TIMEOUT,
+    ):
+        self._lock      = threading.RLock()
+        self._session   = None
+        self._warmed_at = 0.0     # last warm-up attempt
+        self._warm_ok   = False
+        self._stats     = {"requests": 0, "warmups": 0, "warmup_failures": 0, "authwall_refreshes": 0}
+        self.configure(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            cookie_ttl=cookie_ttl,
+            warmup_url=warmup_url,
+            warmup_timeout=warmup_timeout,
+        )
+
+    def configure(self, **settings) -> None:
+        """
+        Change pool/retry/warm-up settings. The current session is closed and
+        rebuilt on next use (cookies included).
+        """
+        with self._lock:
+            for name, value in settings.items():
+                if name not in (
+                    "pool_connections", "pool_maxsize", "max_retries", "backoff_factor",
+                    "cookie_ttl", "warmup_url", "warmup_timeout",
+                ):
+                    raise TypeError(f"Unknown session setting: {name}")
+                setattr(self, name, value)
+            self.close()
+
+    # ── session ──────────────────────────────────────
+
+    def session(self) -> requests.Session:
+        """The shared session, built on first use."""
+        with self._lock:
+            if self._session is None:
+                retry = Retry(
+                    total=self.max_retries,
+                    backoff_factor=self.backoff_factor,
+                    status_forcelist=RETRY_STATUSES,
+                    allowed_methods=("GET", "HEAD"),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    max_retries=retry,
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session   = None
+            self._warmed_at = 0.0
+            self._warm_ok   = False
+
+    # ── warm-up cookies ──────────────────────────────
+
+    def needs_warmup(self, url: str) -> bool:
+        return bool(self.warmup_url) and _site(url) == _site(self.warmup_url)
+
+    def _warm_up(self, headers: dict, force: bool = False) -> bool:
+        """Fetch warm-up cookies if stale. Returns True if a warm-up request was made."""
+        with self._lock:
+            age = time.time() - self._warmed_at
+            fresh = self._warm_ok and age < self.cookie_ttl
+            if fresh and not force:
+                return False
+            if age < MIN_REFRESH_GAP and (force or not self._warm_ok):
+                return False                 # just tried — don't stall every call on it
+            self._warmed_at = time.time()
+            self._stats["warmups"] += 1
+            session = self.session()
+        try:
+            session.get(self.warmup_url, headers=headers, timeout=self.warmup_timeout)
+            ok = True
+        except requests.RequestException:
+            ok = False
+        with self._lock:
+            self._warm_ok = ok
+            if not ok:
+                self._stats["warmup_failures"] += 1
+        return True
+
+    def refresh_cookies(self, headers: dict) -> bool:
+        """
+        Authwall seen: drop the warm-up cookies and fetch new ones, unless
+        that happened within MIN_REFRESH_GAP. Returns True if refreshed
+        (the caller should retry its request).
+        """
+        with self._lock:
+            if time.time() - self._warmed_at < MIN_REFRESH_GAP:
+                return False
+            self.session().cookies.clear()
+            self._stats["authwall_refreshes"] += 1
+        return self._warm_up(headers, force=True)
+
+    # ── requests ─────────────────────────────────────
+
+    def get(self, url: str, headers: dict = None, timeout: float = None, **kwargs) -> requests.Response:
+        """GET through the pooled session, warming up cookies first when the site needs them."""
+        headers = headers or {}
+        if self.needs_warmup(url):
+            self._warm_up(headers)
+        with self._lock:
+            self._stats["requests"] += 1
+            session = self.session()
+        return session.get(url, headers=headers, timeout=timeout, **kwargs)
+
+    def stats(self) -> dict:
+        with self._lock:
+            out = dict(self._stats)
+            out["cookies_age"] = round(time.time() - self._warmed_at, 1) if self._warmed_at else None
+            out["cookies_ok"]  = self._warm_ok
+            return out
+
+
+# Shared by every caller in this process
+SESSIONS = SessionManager()
@@ -0,0 +1,331 @@
+"""
+core/tailoring.py
+=================
+Parallel, section-wise ATS analysis + CV tailoring.
+
+ATS_PROMPT asks one call for scores, report AND the full rewritten CV, so
+output length (and latency) piles up and often hits MAX_TOKENS. Here the
+work is split into independent sub-requests that run concurrently:
+
+  scoring   → old ATS score, keyword analysis, report
+  summary   → headline, summary, skills
+  experience→ rewritten experience HTML
+  projects  → rewritten projects HTML (skipped if the CV has none)
+
+then one short review call on the merged CV:
+
+  review    → new ATS score, improvements made, hallucination check
+
+Results merge into the same dict shape normalise_analysis() produces, with
+the same fields analyze_and_tailor_cv returns.
+A failed section falls back to the untouched base CV section. If scoring
+or the review fails, both ATS scores are measured locally with
+core.ats_scoring (score_source = "local"), and the rewrite is reported as
+not fact-checked.
+No st imports — pure utility module
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+
+from core.ai_engine import (
+    BudgetedPrompt,
+    extract_json_string,
+    fill_prompt,
+    normalise_analysis,
+    to_html,
+    generate_with_fallback,
+    is_json_response,
+    inputs_budget,
+    split_budget,
+)
+from core.ats_scoring import score_cv
+from core.compaction import compact_json, compact_text
+from core.json_repair import repair_json
+
+# ─────────────────────────────────────────────────────
+# PROMPTS
+# ─────────────────────────────────────────────────────
+
+_RULES = """
+OUTPUT: ONLY a raw JSON object. No markdown. No explanation.
+
+CRITICAL RULES:
+- FORBIDDEN: Fake jobs, fake companies, fake degrees, fake projects, fake metrics
+- ALLOWED: Reorder, rewrite wording with JD keywords, sharpen impact
+"""
+
+SCORING_PROMPT = """
+You are a Senior ATS Expert and Professional CV Coach.
+Analyse the candidate's CV against the Job Description. Do NOT rewrite the CV.
+""" + _RULES + """
+Required JSON keys:
+1. "old_ats_score": integer 0-100
+2. "missing_keywords": array of 5-8 important JD keywords absent from CV
+3. "keyword_match_details": string explanation of match/mismatch
+4. "formatting_issues": array of 2-4 structural issues
+5. "section_scores": {"experience": 0, "skills": 0, "education": 0, "projects": 0, "overall_format": 0}
+6. "analysis_report": array of 4-6 strategic insights
+
+BASE CV:
+{cv}
+
+JOB DESCRIPTION:
+{jd}
+"""
+
+SUMMARY_PROMPT = """
+You are a Professional CV Writer tailoring a CV to a Job Description.
+Rewrite ONLY the headline, summary and skills.
+""" + _RULES + """
+Required JSON keys:
+- "headline": professional title aligned to the JD (string)
+- "summary": 2-3 sentence targeted summary (string)
+- "skills": comma-separated skills, JD-relevant ones first; only skills the CV supports (string)
+
+CURRENT HEADLINE: {headline}
+CURRENT SUMMARY: {summary}
+CURRENT SKILLS: {skills}
+
+JOB DESCRIPTION:
+{jd}
+"""
+
+SECTION_PROMPT = """
+You are a Professional CV Writer tailoring a CV to a Job Description.
+Rewrite ONLY the {section} section. Keep every entry; rewrite bullets with JD keywords.
+""" + _RULES + """
+Required JSON keys:
+- "{section}": SINGLE HTML string. Each entry:
+    {entry_title}
+    <ul><li>Bullet with metrics where present in the original</li></ul>
+
+CURRENT {section_upper}:
+{content}
+
+JOB DESCRIPTION:
+{jd}
+"""
+
+REVIEW_PROMPT = """
+You are a Senior ATS Expert reviewing a CV that was tailored to a Job Description.
+Compare the TAILORED CV with the BASE CV it was written from. Do NOT rewrite anything.
+
+OUTPUT: ONLY a raw JSON object. No markdown. No explanation.
+
+Required JSON keys:
+1. "new_ats_score": integer 0-100 for the TAILORED CV against the JD
+2. "improvements_made": array of 5-8 concrete improvements the TAILORED CV makes
+3. "hallucination_check": "Safe" if every job, company, degree, project and metric in the TAILORED CV is in the BASE CV, else describe what was added
+
+BASE CV:
+{cv}
+
+TAILORED CV:
+{tailored}
+
+JOB DESCRIPTION:
+{jd}
+"""
+
+# Title line of one entry, as the extraction prompt writes it
+ENTRY_TITLES = {
+    "experience": "<p><b>Title at Organisation (Start – End)</b></p>",
+    "projects":   "<p><b>Project Name | Tech Stack</b></p>",
+}
+
+UNCHECKED = (
+    "Not fact-checked — the AI review of the tailored CV failed. "
+    "Compare the tailored CV with your original before sending it."
+)
+
+_REWRITES = {"summary": "headline, summary and skills", "experience": "experience", "projects": "projects"}
+
+
+# ─────────────────────────────────────────────────────
+# SECTION RUNNERS
+# ─────────────────────────────────────────────────────
+
+def _ask_json(prompt, gemini_api_key: str, groq_api_key: str, cache) -> dict:
+    response = generate_with_fallback(
+        prompt, gemini_api_key, groq_api_key, temp=0.15, cache=cache, validate=is_json_response,
+    )
+    try:
+        parsed = json.loads(extract_json_string(response or ""))
+    except ValueError:
+        parsed, _ = repair_json(response)   # keep whatever complete fields survived
+    if not isinstance(parsed, dict) or not parsed:
+        raise ValueError("Section response is not a JSON object")
+    return parsed
+
+
+_TEMPLATES = (SCORING_PROMPT, SUMMARY_PROMPT, SECTION_PROMPT)
+
+
+def _section_jobs(base_cv: dict, jd_text: str) -> dict:
+    """name → prompt for every sub-request this CV needs, built per backend budget."""
+    source = json.dumps(base_cv, sort_keys=True, default=str)
+
+    @lru_cache(maxsize=None)
+    def inputs(budget: int) -> tuple:
+        # The longest template bounds every sub-request's instructions
+        cv_budget, jd_budget = split_budget(inputs_budget(budget, max(_TEMPLATES, key=len)))
+        jd, jd_report = compact_text(jd_text, jd_budget)
+        cv_str, cv_report = compact_json(base_cv, cv_budget)
+        return jd, jd_report, cv_str, cv_report, cv_budget
+
+    def scoring(budget):
+        jd, jd_report, cv_str, cv_report, _ = inputs(budget)
+        return fill_prompt(SCORING_PROMPT, cv=cv_str, jd=jd), [cv_report, jd_report]
+
+    def summary(budget):
+        jd, jd_report, _, _, _ = inputs(budget)
+        prompt = fill_prompt(
+            SUMMARY_PROMPT,
+            headline=base_cv.get("headline", ""),
+            summary=base_cv.get("summary", ""),
+            skills=base_cv.get("skills", ""),
+            jd=jd,
+        )
+        return prompt, [jd_report]
+
+    def section(name, html):
+        def build(budget):
+            jd, jd_report, _, _, cv_budget = inputs(budget)
+            content, content_report = compact_text(html, cv_budget)
+            prompt = fill_prompt(
+                SECTION_PROMPT,
+                section=name, section_upper=name.upper(), entry_title=ENTRY_TITLES[name],
+                content=content, jd=jd,
+            )
+            return prompt, [content_report, jd_report]
+        return BudgetedPrompt(build, SECTION_PROMPT, name, html, jd_text)
+
+    jobs = {
+        "scoring": BudgetedPrompt(scoring, SCORING_PROMPT, source, jd_text),
+        "summary": BudgetedPrompt(summary, SUMMARY_PROMPT, source, jd_text),
+    }
+    for name in ("experience", "projects"):
+        html = to_html(base_cv.get(name, ""))
+        if html:
+            jobs[name] = section(name, html)
+    return jobs
+
+
+def _review_prompt(base_cv: dict, tailored: dict, jd_text: str) -> BudgetedPrompt:
+    def build(budget):
+        cv_budget, jd_budget = split_budget(inputs_budget(budget, REVIEW_PROMPT))
+        cv_str, cv_report = compact_json(base_cv, cv_budget // 2)
+        tailored_str, tailored_report = compact_json(tailored, cv_budget - cv_budget // 2)
+        jd, jd_report = compact_text(jd_text, jd_budget)
+        prompt = fill_prompt(REVIEW_PROMPT, cv=cv_str, tailored=tailored_str, jd=jd)
+        return prompt, [cv_report, tailored_report, jd_report]
+    return BudgetedPrompt(
+        build,
+        REVIEW_PROMPT,
+        json.dumps(base_cv, sort_keys=True, default=str),
+        json.dumps(tailored, sort_keys=True, default=str),
+        jd_text,
+    )
+
+
+# ─────────────────────────────────────────────────────
+# PUBLIC API
+# ─────────────────────────────────────────────────────
+
+def analyze_and_tailor_cv_parallel(
+    base_cv_json: dict,
+    jd_text: str,
+    gemini_api_key: str,
+    groq_api_key: str,
+    cache=None,
+    on_section=None,
+) -> dict:
+    """
+    Drop-in replacement for analyze_and_tailor_cv that runs the scoring and
+    each tailored section as concurrent LLM calls.
+
+    on_section(name, result_or_None) fires on the calling thread as each
+    sub-request finishes (None = that section failed and fell back); the
+    review of the merged CV reports last, as "review".
+    Raises Exception only if every sub-request fails.
+    """
+    jobs = _section_jobs(base_cv_json, jd_text)
+    results, errors = {}, {}
+
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = {
+            pool.submit(_ask_json, prompt, gemini_api_key, groq_api_key, cache): name
+            for name, prompt in jobs.items()
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                errors[name] = str(e)
+            if on_section is not None:
+                on_section(name, results.get(name))
+
+    if not results:
+        raise Exception("All analysis sections failed.\n" + "\n".join(f"{k}: {v}" for k, v in errors.items()))
+
+    analysis = dict(results.get("scoring", {}))
+    if "scoring" in errors:
+        analysis["keyword_match_details"] = f"Scoring failed: {errors['scoring']}"
+
+    # Untouched sections come straight from the base CV
+    tailored = {
+        key: base_cv_json.get(key, "")
+        for key in ("name", "headline", "contact", "summary", "skills",
+                    "experience", "projects", "education", "certificates")
+    }
+    rewritten = []
+    summary = results.get("summary", {})
+    for key in ("headline", "summary", "skills"):
+        if summary.get(key):
+            tailored[key] = summary[key]
+            if "summary" not in rewritten:
+                rewritten.append("summary")
+    for section in ("experience", "projects"):
+        if results.get(section, {}).get(section):
+            tailored[section] = results[section][section]
+            rewritten.append(section)
+
+    # The rewrites ran blind to each other — score and fact-check the merged CV
+    try:
+        review = _ask_json(_review_prompt(base_cv_json, tailored, jd_text), gemini_api_key, groq_api_key, cache)
+    except Exception:
+        review = None
+    if on_section is not None:
+        on_section("review", review)
+
+    analysis["tailored_cv"] = tailored
+    if review is not None:
+        for key in ("new_ats_score", "improvements_made", "hallucination_check"):
+            if key in review:
+                analysis[key] = review[key]
+    if review is None or "hallucination_check" not in review:
+        analysis["hallucination_check"] = UNCHECKED     # never the unchecked "Safe" default
+    analysis = normalise_analysis(analysis)
+
+    if review is None or "old_ats_score" not in results.get("scoring", {}) or "new_ats_score" not in review:
+        _local_scores(analysis, base_cv_json, jd_text, rewritten, reviewed=review is not None)
+    return analysis
+
+
+def _local_scores(analysis: dict, base_cv_json: dict, jd_text: str, rewritten: list, reviewed: bool) -> None:
+    """LLM scores missing: measure both with score_cv so they share a scale."""
+    before = score_cv(base_cv_json, jd_text)
+    after  = score_cv(analysis["tailored_cv"], jd_text)
+    analysis["old_ats_score"] = before["old_ats_score"]
+    analysis["new_ats_score"] = after["old_ats_score"]
+    analysis["score_source"]  = "local"
+    if not reviewed:
+        gained = [kw for kw in after["matched_keywords"] if kw not in before["matched_keywords"]]
+        improvements = [f"Rewrote the {_REWRITES[name]} for this JD" for name in rewritten]
+        if gained:
+            improvements.append("JD keywords now covered: " + ", ".join(gained[:10]))
+        analysis["improvements_made"]   = improvements
+        analysis["hallucination_check"] = UNCHECKED
@@ -0,0 +1,282 @@
+"""
+templates/cv_model.py
+=====================
+Compact CV model the templates render from, built once per CV from the
+LLM JSON and kept in session state instead of the dict.
+
+- CVModel (__slots__): name, headline, summary, contacts, skills and four sections
+- experience / projects → Role items (title + bullets); education /
+  certificates → Entry items ("<p><b>Title</b> detail</p>")
+- The HTML strings the extraction prompt asks for
+  ("<p><b>Title</b></p><ul><li>…</li></ul>") are split once; sections the
+  model wrote as structured lists or dicts are first turned into key/value
+  HTML exactly as the templates always showed them (section_source)
+- HTML that doesn't fit those shapes is kept verbatim as a str item
+  (the job-title rewrite is applied to those when rendering)
+- to_dict() gives back the normalised dict core.ai_engine produces — for
+  prompts, keyword scoring and the content hash
+- Contact lines → Contact items (icon + text)
+- No st imports — pure utility module
+"""
+
+import re
+
+_TITLE_OPEN  = "<p><b>"
+_TITLE_CLOSE = "</b></p>"
+_JOB_TITLE   = "<div class='job-title'>"
+
+_TAG       = re.compile(r'<[^>]+>')
+_SEPARATOR = re.compile(r'[|\n,]')
+
+_ENTRY     = re.compile(r"<p><b>(.*?)</b>(.*?)</p>", re.S)
+
+_ROLE_FIELDS  = ("experience", "projects")
+_ENTRY_FIELDS = ("education", "certificates")
+_FIELDS       = ("name", "headline", "summary", "contact", "skills") + _ROLE_FIELDS + _ENTRY_FIELDS
+
+_PLACES = ['india','up','delhi','mumbai','city','remote','bengaluru','hyderabad','pune','noida','moradabad']
+
+
+# ─────────────────────────────────────────────────────
+# ITEMS
+# ─────────────────────────────────────────────────────
+
+def _bullet_list(bullets) -> str:
+    if bullets is None:
+        return ""
+    return "<ul>" + "".join(["<li>" + b + "</li>" for b in bullets]) + "</ul>"
+
+
+class Role:
+    """A job or project: bold title line plus an optional bullet list."""
+
+    __slots__ = ("title", "bullets")
+
+    def __init__(self, title: str, bullets: tuple = None):
+        self.title   = title
+        self.bullets = bullets     # None = no <ul> at all
+
+    def html(self) -> str:
+        return _JOB_TITLE + self.title + "</div>" + _bullet_list(self.bullets)
+
+    def source(self) -> str:
+        return _TITLE_OPEN + self.title + _TITLE_CLOSE + _bullet_list(self.bullets)
+
+
+class Entry:
+    """An education / certificate line: bold title plus trailing detail."""
+
+    __slots__ = ("title", "detail")
+
+    def __init__(self, title: str, detail: str = ""):
+        self.title  = title
+        self.detail = detail
+
+    def html(self) -> str:
+        return "<p><b>" + self.title + "</b>" + self.detail + "</p>"
+
+    source = html
+
+
+class Contact:
+    __slots__ = ("icon", "text")
+
+    def __init__(self, icon: str, text: str):
+        self.icon = icon
+        self.text = text
+
+
+# ─────────────────────────────────────────────────────
+# PARSING
+# ─────────────────────────────────────────────────────
+
+def _contact_icon(p: str) -> str:
+    pl = p.lower()
+    if '@' in p or 'email' in pl:
+        return "✉️"
+    if 'linkedin' in pl or 'lnkd' in pl:
+        return "🔗"
+    if 'github' in pl:
+        return "💻"
+    if any(c.isdigit() for c in p) and ('+' in p or p.replace(' ', '').replace('-','').replace('+','').isdigit()):
+        return "📞"
+    if any(x in pl for x in ['http','www','portfolio','site']):
+        return "🌐"
+    if any(x in pl for x in _PLACES):
+        return "📍"
+    if 'twitter' in pl or 'x.com' in pl:
+        return "🐦"
+    return "•"
+
+
+def parse_contacts(raw: str) -> tuple:
+    """Split a combined contact string (pipes, newlines, commas; tags stripped) into Contacts."""
+    parts = [p.strip() for p in _SEPARATOR.split(_TAG.sub('', raw)) if p.strip()]
+    return tuple(Contact(_contact_icon(p), p) for p in parts)
+
+
+def _bullets(body: str):
+    """Bullet texts if body is exactly <li>…</li>* (no nesting), else None."""
+    if not body:
+        return ()
+    if not (body.startswith("<li>") and body.endswith("</li>")) or _TITLE_CLOSE in body:
+        return None
+    bullets = tuple(body[4:-5].split("</li><li>"))
+    if any("<li>" in b or "</li>" in b for b in bullets):
+        return None
+    return bullets
+
+
+def parse_roles(html: str) -> tuple:
+    """
+    Split on the title markers: "<p><b>Title</b></p>" plus an adjacent
+    "<ul><li>…</li></ul>" becomes a Role; everything else is kept verbatim
+    (a marker the job-title rewrite touches never lands in a Role).
+    """
+    pieces = html.split(_TITLE_OPEN)
+    items = [pieces[0]] if pieces[0] else []
+    for piece in pieces[1:]:
+        title, closed, rest = piece.partition(_TITLE_CLOSE)
+        if not closed:
+            items.append(_TITLE_OPEN + piece)
+            continue
+        bullets = None
+        if rest.startswith("<ul>"):
+            body, ended, tail = rest[4:].partition("</ul>")
+            bullets = _bullets(body) if ended else None
+            if bullets is not None:
+                rest = tail
+        items.append(Role(title, bullets))
+        if rest:
+            items.append(rest)
+    return tuple(items)
+
+
+def parse_entries(html: str) -> tuple:
+    """Each <p><b>Title</b>detail</p> becomes an Entry; the rest is kept verbatim."""
+    items, pos = [], 0
+    for m in _ENTRY.finditer(html):
+        if m.start() > pos:
+            items.append(html[pos : m.start()])
+        items.append(Entry(m.group(1), m.group(2)))
+        pos = m.end()
+    if pos < len(html):
+        items.append(html[pos:])
+    return tuple(items)
+
+
+def _fields_html(item: dict) -> str:
+    return "<br>".join([f"<b>{str(k).replace('_',' ').title()}:</b> {str(v)}" for k, v in item.items()])
+
+
+def section_source(value) -> str:
+    """
+    A section value as HTML: HTML strings as-is, list items as <p> or (dicts)
+    a key/value <div>, a dict as one key/value <div> — how the templates have
+    always shown sections the LLM returned in structured form.
+    """
+    if not value:
+        return ""
+    if isinstance(value, list):
+        return "".join([
+            "<div style='margin-bottom:12px;'>" + _fields_html(item) + "</div>" if isinstance(item, dict)
+            else f"<p>{str(item)}</p>"
+            for item in value
+        ])
+    if isinstance(value, dict):
+        return "<div>" + _fields_html(value) + "</div>"
+    return str(value)
+
+
+def parse_section(value, roles: bool) -> tuple:
+    """Section items from the HTML string the extraction prompt asks for (or any value, see section_source)."""
+    html = section_source(value)
+    if not html:
+        return ()
+    return parse_roles(html) if roles else parse_entries(html)
+
+
+def _rewrite(html: str) -> str:
+    return html.replace(_TITLE_OPEN, _JOB_TITLE).replace(_TITLE_CLOSE, "</div>")
+
+
+def section_html(items: tuple, roles: bool = False) -> str:
+    """Rendered section; verbatim role-section HTML gets the job-title rewrite."""
+    if roles:
+        return "".join([_rewrite(item) if isinstance(item, str) else item.html() for item in items])
+    return "".join([item if isinstance(item, str) else item.html() for item in items])
+
+
+def source_html(items: tuple) -> str:
+    """The section as the normalised HTML string it came from (no rewrite)."""
+    return "".join([item if isinstance(item, str) else item.source() for item in items])
+
+
+# ─────────────────────────────────────────────────────
+# MODEL
+# ─────────────────────────────────────────────────────
+
+class CVModel:
+    """Everything a template reads, built once from the LLM's CV JSON (see from_dict)."""
+
+    __slots__ = (
+        "name", "headline", "summary", "contact", "contacts", "skills",
+        "experience", "projects", "education", "certificates", "extra",
+    )
+
+    def __init__(self, name, headline, summary, contact, contacts, skills,
+                 experience, projects, education, certificates, extra=None):
+        self.name         = name
+        self.headline     = headline
+        self.summary      = summary
+        self.contact      = contact       # raw string; shown as-is when no contact parts were found
+        self.contacts     = contacts      # (Contact, ...)
+        self.skills       = skills        # (str, ...)
+        self.experience   = experience    # (Role | str, ...)
+        self.projects     = projects
+        self.education    = education     # (Entry | str, ...)
+        self.certificates = certificates
+        self.extra        = extra         # any other keys of the source dict, or None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CVModel":
+        # Defensive type conversions
+        skills_raw = data.get("skills", "") or ""
+        skills = [s.strip() for s in skills_raw.split(',')] if isinstance(skills_raw, str) else [str(s).strip() for s in skills_raw]
+        contact = str(data.get("contact", ""))
+        return cls(
+            name=str(data.get("name", "Name Not Found")),
+            headline=str(data.get("headline", "")),
+            summary=str(data.get("summary", "") or ""),
+            contact=contact,
+            contacts=parse_contacts(contact),
+            skills=tuple(s for s in skills if s),
+            experience=parse_section(data.get("experience"), roles=True),
+            projects=parse_section(data.get("projects"), roles=True),
+            education=parse_section(data.get("education"), roles=False),
+            certificates=parse_section(data.get("certificates"), roles=False),
+            extra={k: v for k, v in data.items() if k not in _FIELDS} or None,
+        )
+
+    def to_dict(self) -> dict:
+        """The CV as a normalised dict (HTML-string sections, comma-separated skills)."""
+        out = {
+            "name":     self.name,
+            "headline": self.headline,
+            "summary":  self.summary,
+            "contact":  self.contact,
+            "skills":   ", ".join(self.skills),
+        }
+        for field in _ROLE_FIELDS + _ENTRY_FIELDS:
+            out[field] = source_html(getattr(self, field))
+        if self.extra:
+            out.update(self.extra)
+        return out
+
+    def contact_text(self, separator: str = "<br>") -> str:
+        if not self.contacts:
+            return self.contact
+        return separator.join([c.icon + " " + c.text for c in self.contacts])
+
+    def section_html(self, field: str) -> str:
+        return section_html(getattr(self, field), roles=field in _ROLE_FIELDS)
@@ -1,80 +1,118 @@
-def render_cv(template_name, data):
-    name = str(data.get("name", "Name Not Found"))
-    headline = str(data.get("headline", ""))
-    contact = str(data.get("contact", ""))
-
-    # Defensive type conversions
-    skills_raw = data.get("skills", "")
-    skills = [s.strip() for s in skills_raw.split(',')] if isinstance(skills_raw, str) else [str(s).strip() for s in skills_raw]
-    skills = [s for s in skills if s]
-
-    def to_html(val):
-        if not val: return ""
-        if isinstance(val, list):
-            parts = []
-            for item in val:
-                if isinstance(item, dict):
-                    lines = [f"<b>{str(k).replace('_',' ').title()}:</b> {str(v)}" for k, v in item.items()]
-                    parts.append("<div style='margin-bottom:12px;'>" + "<br>".join(lines) + "</div>")
-                else:
-                    parts.append(f"<p>{str(item)}</p>")
-            return "".join(parts)
-        if isinstance(val, dict):
-            lines = [f"<b>{str(k).replace('_',' ').title()}:</b> {str(v)}" for k, v in val.items()]
-            return "<div>" + "<br>".join(lines) + "</div>"
-        return str(val)
-
-    experience   = to_html(data.get("experience", ""))
-    education    = to_html(data.get("education", ""))
-    certificates = to_html(data.get("certificates", ""))
-    projects     = to_html(data.get("projects", ""))
-
-    # Clean up bold job-title tags for scoped CSS classes
-    experience = experience.replace("<p><b>", "<div class='job-title'>").replace("</b></p>", "</div>")
-    projects   = projects.replace("<p><b>", "<div class='job-title'>").replace("</b></p>", "</div>")
-
-    has_edu  = bool(education and len(education) > 5)
-    has_cert = bool(certificates and len(certificates) > 5)
-    has_proj = bool(projects and len(projects) > 5)
-
-    def format_contact(raw: str, separator="<br>") -> str:
-        """Splits a combined contact string into icon-prefixed separate lines."""
-        import re
-        # Split on pipe | or newline; strip whitespace and html tags
-        raw_clean = re.sub(r'<[^>]+>', '', raw)  # strip any existing HTML tags
-        parts = [p.strip() for p in re.split(r'[|\n,]', raw_clean) if p.strip()]
-        lines = []
-        for p in parts:
-            pl = p.lower()
-            if '@' in p or 'email' in pl:
-                icon = "✉️"
-            elif 'linkedin' in pl or 'lnkd' in pl:
-                icon = "🔗"
-            elif 'github' in pl:
-                icon = "💻"
-            elif any(c.isdigit() for c in p) and ('+' in p or p.replace(' ', '').replace('-','').replace('+','').isdigit()):
-                icon = "📞"
-            elif any(x in pl for x in ['http','www','portfolio','site']):
-                icon = "🌐"
-            elif any(x in pl for x in ['india','up','delhi','mumbai','city','remote','bengaluru','hyderabad','pune','noida','moradabad']):
-                icon = "📍"
-            elif 'twitter' in pl or 'x.com' in pl:
-                icon = "🐦"
-            else:
-                icon = "•"
-            lines.append(f"{icon} {p}")
-        return separator.join(lines) if lines else raw
-
-    contact_lines = format_contact(contact, separator="<br>")   # newline-separated for sidebars
-    contact_inline = format_contact(contact, separator=" &nbsp;|&nbsp; ")  # inline for header bars
-
-    # =============================================
-    # TEMPLATE 1 — Premium Two-Column (Navy & White)
-    # Ref: Mariana Anderson
-    # =============================================
-    if template_name == "1. Premium Two-Column (Navy & White)":
-        skill_li = "".join([f'<li class="sk">{s}</li>' for s in skills])
-        return f"""<html><head>
+"""
+templates/cv_styles.py
+======================
+The 7 HTML/CSS CV templates.
+
+- Each template is compiled once at import: its source is split into static
+  fragments and named slots (string.Formatter syntax, so CSS braces are
+  written doubled exactly as in an f-string)
+- prepare_cv() builds a CVModel (templates/cv_model.py) from a CV dict once;
+  slots emit HTML straight from its roles, entries, contacts and skills
+- render_cv() / render_all() accept either form; a CVModel is rendered by
+  any number of templates without being re-parsed (gallery, switching)
+- Templates are looked up in TEMPLATES by display name and their slots are
+  filled with a single join
+- Unknown names fall back to DEFAULT_TEMPLATE (the dark premium design)
+- No st imports — pure utility module
+"""
+
+import string
+
+from templates.cv_model import CVModel, parse_contacts
+
+
+# ─────────────────────────────────────────────────────
+# FIELD PREPARATION
+# ─────────────────────────────────────────────────────
+
+def format_contact(raw: str, separator="<br>") -> str:
+    """Splits a combined contact string into icon-prefixed separate lines."""
+    lines = [c.icon + " " + c.text for c in parse_contacts(raw)]
+    return separator.join(lines) if lines else raw
+
+
+def prepare_cv(data) -> CVModel:
+    """Build the model every template renders from (a CVModel is returned as-is)."""
+    if isinstance(data, CVModel):
+        return data
+    return CVModel.from_dict(data)
+
+
+# ─────────────────────────────────────────────────────
+# COMPILED TEMPLATES
+# ─────────────────────────────────────────────────────
+
+# Slots every template may use without declaring them
+_COMMON_SLOTS = {
+    "name":           lambda cv: cv.name,
+    "name_lines":     lambda cv: cv.name.replace(" ", "<br>"),
+    "headline":       lambda cv: cv.headline,
+    "contact_lines":  lambda cv: cv.contact_text("<br>"),               # newline-separated for sidebars
+    "contact_inline": lambda cv: cv.contact_text(" &nbsp;|&nbsp; "),    # inline for header bars
+    "experience":     lambda cv: cv.section_html("experience"),
+    "projects":       lambda cv: cv.section_html("projects"),
+    "education":      lambda cv: cv.section_html("education"),
+    "certificates":   lambda cv: cv.section_html("certificates"),
+}
+
+
+def _each(before: str, after: str):
+    """Skills slot: every skill wrapped in before/after."""
+    return lambda cv: "".join([before + s + after for s in cv.skills])
+
+
+def _joined(separator: str):
+    """Skills slot: skills as one separated string."""
+    return lambda cv: separator.join(cv.skills)
+
+
+def _section(field: str, before: str, after: str):
+    """Optional section slot: the wrapped field, or nothing when it is (nearly) empty."""
+    def slot(cv):
+        html = cv.section_html(field)
+        return before + html + after if len(html) > 5 else ""
+    return slot
+
+
+class CompiledTemplate:
+    """A template source split once into static fragments and slot positions."""
+
+    def __init__(self, name: str, source: str, slots: dict):
+        self.name = name
+        self._parts = []          # static fragments, with None where a slot goes
+        self._slots = []          # (index into _parts, slot function)
+        for literal, field, _, _ in string.Formatter().parse(source):
+            if literal:
+                self._parts.append(literal)
+            if field is not None:
+                getter = slots.get(field) or _COMMON_SLOTS.get(field)
+                if getter is None:
+                    raise KeyError(f"Template {name!r} has no slot {field!r}")
+                self._slots.append((len(self._parts), getter))
+                self._parts.append(None)
+
+    def render(self, cv: CVModel) -> str:
+        """Fill the slots from the CV model and join once."""
+        out = self._parts[:]
+        for index, getter in self._slots:
+            out[index] = getter(cv)
+        return "".join(out)
+
+
+TEMPLATES = {}    # display name → CompiledTemplate, in selectbox order
+
+
+def _register(name: str, source: str, **slots) -> None:
+    TEMPLATES[name] = CompiledTemplate(name, source, slots)
+
+
+# =============================================
+# TEMPLATE 1 — Premium Two-Column (Navy & White)
+# Ref: Mariana Anderson
+# =============================================
+_register(
+    "1. Premium Two-Column (Navy & White)",
+    """<html><head>
 <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
 <style>
 *{{box-sizing:border-box;margin:0;padding:0}}body{{font-family:'Inter',sans-serif;background:#dde1e7;}}
@@ -97,26 +135,31 @@ def render_cv(template_name, data):
 <div class="cv">
   <div class="lc">
     <h3>Contact</h3><p>{contact_lines}</p>
-    <h3>Skills</h3><ul class="sk-list">{"".join([f'<li class="sk">{s}</li>' for s in skills])}</ul>
-    {"<h3>Education</h3><div class='std'>"+education+"</div>" if has_edu else ""}
-    {"<h3>Certifications</h3><div class='std'>"+certificates+"</div>" if has_cert else ""}
+    <h3>Skills</h3><ul class="sk-list">{skills}</ul>
+    {education_section}
+    {certificates_section}
   </div>
   <div class="rc">
     <div class="name">{name}</div>
     <div class="hl">{headline}</div>
     <div class="sh">Experience</div>
     <div class="exp">{experience}</div>
-    {"<div class='sh'>Projects</div><div class='exp'>"+projects+"</div>" if has_proj else ""}
+    {projects_section}
   </div>
-</div></body></html>"""
-
-    # =============================================
-    # TEMPLATE 2 — Executive Corporate (Clean & Bold)
-    # Ref: Ethan Smith
-    # =============================================
-    elif template_name == "2. Executive Corporate (Clean & Bold)":
-        sk_str = ", ".join(skills)
-        return f"""<html><head>
+</div></body></html>""",
+    skills=_each('<li class="sk">', '</li>'),
+    education_section=_section("education", "<h3>Education</h3><div class='std'>", "</div>"),
+    certificates_section=_section("certificates", "<h3>Certifications</h3><div class='std'>", "</div>"),
+    projects_section=_section("projects", "<div class='sh'>Projects</div><div class='exp'>", "</div>"),
+)
+
+# =============================================
+# TEMPLATE 2 — Executive Corporate (Clean & Bold)
+# Ref: Ethan Smith
+# =============================================
+_register(
+    "2. Executive Corporate (Clean & Bold)",
+    """<html><head>
 <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@400;600;700&display=swap" rel="stylesheet">
 <style>
 *{{box-sizing:border-box;margin:0;padding:0}}body{{font-family:'Montserrat',sans-serif;background:#f0f2f5;}}
@@ -142,23 +185,28 @@ def render_cv(template_name, data):
     <div>
       <div class="sh">Professional Experience</div>
       <div class="exp">{experience}</div>
-      {"<div class='sh' style='margin-top:28px;'>Projects</div><div class='exp'>"+projects+"</div>" if has_proj else ""}
+      {projects_section}
     </div>
     <div>
-      <div class="sb"><div class="sh">Core Competencies</div><div class="st">{sk_str}</div></div>
-      {"<div class='sb'><div class='sh'>Education</div><div class='st'>"+education+"</div></div>" if has_edu else ""}
-      {"<div class='sb'><div class='sh'>Certifications</div><div class='st'>"+certificates+"</div></div>" if has_cert else ""}
+      <div class="sb"><div class="sh">Core Competencies</div><div class="st">{skills}</div></div>
+      {education_section}
+      {certificates_section}
     </div>
   </div>
-</div></body></html>"""
-
-    # =============================================
-    # TEMPLATE 3 — Creative Professional (Ribbons & Colors)
-    # Ref: Steven Terry
-    # =============================================
-    elif template_name == "3. Creative Professional (Ribbons & Colors)":
-        sk_pills = "".join([f'<span class="pill">{s}</span>' for s in skills])
-        return f"""<html><head>
+</div></body></html>""",
+    skills=_joined(", "),
+    projects_section=_section("projects", "<div class='sh' style='margin-top:28px;'>Projects</div><div class='exp'>", "</div>"),
+    education_section=_section("education", "<div class='sb'><div class='sh'>Education</div><div class='st'>", "</div></div>"),
+    certificates_section=_section("certificates", "<div class='sb'><div class='sh'>Certifications</div><div class='st'>", "</div></div>"),
+)
+
+# =============================================
+# TEMPLATE 3 — Creative Professional (Ribbons & Colors)
+# Ref: Steven Terry
+# =============================================
+_register(
+    "3. Creative Professional (Ribbons & Colors)",
+    """<html><head>
 <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@400;500;700;900&display=swap" rel="stylesheet">
 <style>
 *{{box-sizing:border-box;margin:0;padding:0}}body{{font-family:'Roboto',sans-serif;background:#e0e7ff;}}
@@ -184,23 +232,28 @@ def render_cv(template_name, data):
     <div class="rib">✒️ Contact</div>
     <div class="lt">{contact_lines}</div>
     <div class="rib">🛠️ Skills</div>
-    <div class="pw">{sk_pills}</div>
-    {"<div class='rib'>🎓 Education</div><div class='lt'>"+education+"</div>" if has_edu else ""}
-    {"<div class='rib'>📜 Certificates</div><div class='lt'>"+certificates+"</div>" if has_cert else ""}
+    <div class="pw">{skills}</div>
+    {education_section}
+    {certificates_section}
   </div>
   <div class="rc">
     <div class="rbr">💼 Work Experience</div>
     <div class="rt">{experience}</div>
-    {"<div class='rbr'>🚀 Projects</div><div class='rt'>"+projects+"</div>" if has_proj else ""}
+    {projects_section}
   </div>
-</div></body></html>"""
-
-    # =============================================
-    # TEMPLATE 4 — Minimalist Clean (Kinsley Morrison Ref)
-    # =============================================
-    elif template_name == "4. Minimalist Clean (Kinsley Morrison)":
-        sk_list = "".join([f'<li class="sk">{s}</li>' for s in skills])
-        return f"""<html><head>
+</div></body></html>""",
+    skills=_each('<span class="pill">', '</span>'),
+    education_section=_section("education", "<div class='rib'>🎓 Education</div><div class='lt'>", "</div>"),
+    certificates_section=_section("certificates", "<div class='rib'>📜 Certificates</div><div class='lt'>", "</div>"),
+    projects_section=_section("projects", "<div class='rbr'>🚀 Projects</div><div class='rt'>", "</div>"),
+)
+
+# =============================================
+# TEMPLATE 4 — Minimalist Clean (Kinsley Morrison Ref)
+# =============================================
+_register(
+    "4. Minimalist Clean (Kinsley Morrison)",
+    """<html><head>
 <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;600;700&display=swap" rel="stylesheet">
 <style>
 *{{box-sizing:border-box;margin:0;padding:0}}body{{font-family:'Raleway',sans-serif;background:#f5f5f5;}}
@@ -220,28 +273,33 @@ def render_cv(template_name, data):
   <div class="lc">
     <div class="sh-left">Contact</div>
     <p>{contact_lines}</p>
-    {"<div class='sh-left'>Education</div><p>"+education+"</p>" if has_edu else ""}
+    {education_section}
     <div class="sh-left">Skills</div>
-    <ul>{"".join([f'<li class="sk">{s}</li>' for s in skills])}</ul>
-    {"<div class='sh-left'>Certifications</div><p>"+certificates+"</p>" if has_cert else ""}
+    <ul>{skills}</ul>
+    {certificates_section}
   </div>
   <div class="rc">
-    <div class="bigname">{name.replace(" ", "<br>")}</div>
+    <div class="bigname">{name_lines}</div>
     <hr class="divider">
     <div style="font-size:13px;color:#888;text-transform:uppercase;letter-spacing:2px;margin-bottom:24px;">{headline}</div>
     <div class="sh-right">Work Experience</div>
     <div class="exp">{experience}</div>
-    {"<div class='sh-right'>Projects</div><div class='exp'>"+projects+"</div>" if has_proj else ""}
+    {projects_section}
   </div>
-</div></body></html>"""
-
-    # =============================================
-    # TEMPLATE 5 — Modern Single Column (Theodora Ref)
-    # Teal accent, clean professional centre layout
-    # =============================================
-    elif template_name == "5. Modern Single Column (Teal Accent)":
-        sk_tags = "".join([f'<span class="tag">{s}</span>' for s in skills])
-        return f"""<html><head>
+</div></body></html>""",
+    skills=_each('<li class="sk">', '</li>'),
+    education_section=_section("education", "<div class='sh-left'>Education</div><p>", "</p>"),
+    certificates_section=_section("certificates", "<div class='sh-left'>Certifications</div><p>", "</p>"),
+    projects_section=_section("projects", "<div class='sh-right'>Projects</div><div class='exp'>", "</div>"),
+)
+
+# =============================================
+# TEMPLATE 5 — Modern Single Column (Theodora Ref)
+# Teal accent, clean professional centre layout
+# =============================================
+_register(
+    "5. Modern Single Column (Teal Accent)",
+    """<html><head>
 <link href="https://fonts.googleapis.com/css2?family=Nunito+Sans:wght@400;600;700;800&display=swap" rel="stylesheet">
 <style>
 *{{box-sizing:border-box;margin:0;padding:0}}body{{font-family:'Nunito Sans',sans-serif;background:#f0f4f8;}}
@@ -265,22 +323,27 @@ def render_cv(template_name, data):
   </div>
   <div class="body">
     <div class="sh">Skills & Expertise</div>
-    <div style="margin-bottom:8px;">{sk_tags}</div>
+    <div style="margin-bottom:8px;">{skills}</div>
     <div class="sh">Experience</div>
     <div class="exp">{experience}</div>
-    {"<div class='sh'>Projects</div><div class='exp'>"+projects+"</div>" if has_proj else ""}
-    {"<div class='sh'>Education</div><div class='st'>"+education+"</div>" if has_edu else ""}
-    {"<div class='sh'>Certifications</div><div class='st'>"+certificates+"</div>" if has_cert else ""}
+    {projects_section}
+    {education_section}
+    {certificates_section}
   </div>
-</div></body></html>"""
-
-    # =============================================
-    # TEMPLATE 6 — Academic / Structured (Joanne Ref)
-    # Classic serif layout, great for academia & research
-    # =============================================
-    elif template_name == "6. Academic Structured (Classic)":
-        sk_grid = "".join([f'<li class="sk">{s}</li>' for s in skills])
-        return f"""<html><head>
+</div></body></html>""",
+    skills=_each('<span class="tag">', '</span>'),
+    projects_section=_section("projects", "<div class='sh'>Projects</div><div class='exp'>", "</div>"),
+    education_section=_section("education", "<div class='sh'>Education</div><div class='st'>", "</div>"),
+    certificates_section=_section("certificates", "<div class='sh'>Certifications</div><div class='st'>", "</div>"),
+)
+
+# =============================================
+# TEMPLATE 6 — Academic / Structured (Joanne Ref)
+# Classic serif layout, great for academia & research
+# =============================================
+_register(
+    "6. Academic Structured (Classic)",
+    """<html><head>
 <link href="https://fonts.googleapis.com/css2?family=EB+Garamond:wght@400;600;700&display=swap" rel="stylesheet">
 <style>
 *{{box-sizing:border-box;margin:0;padding:0}}body{{font-family:'EB Garamond',serif;background:#fff;color:#111;}}
@@ -302,21 +365,26 @@ hr{{border:none;border-top:2px solid #111;margin:14px 0;}}
   <div class="ct">{contact_inline}</div>
   <hr>
   <div class="sh">Core Competencies</div>
-  <ul style="padding:0;margin-bottom:10px;">{"".join([f'<li class="sk">{s}</li>' for s in skills])}</ul>
+  <ul style="padding:0;margin-bottom:10px;">{skills}</ul>
   <div class="sh">Professional Experience</div>
   <div class="exp">{experience}</div>
-  {"<div class='sh'>Projects & Research</div><div class='exp'>"+projects+"</div>" if has_proj else ""}
-  {"<div class='sh'>Education</div><div class='st'>"+education+"</div>" if has_edu else ""}
-  {"<div class='sh'>Awards & Certifications</div><div class='st'>"+certificates+"</div>" if has_cert else ""}
-</div></body></html>"""
-
-    # =============================================
-    # TEMPLATE 7 — Dark Premium (Two-Column Dark)
-    # Modern dark/charcoal with gold accents
-    # =============================================
-    else:  # "7. Dark Premium (Gold & Charcoal)"
-        sk_pills = "".join([f'<span class="pill">{s}</span>' for s in skills])
-        return f"""<html><head>
+  {projects_section}
+  {education_section}
+  {certificates_section}
+</div></body></html>""",
+    skills=_each('<li class="sk">', '</li>'),
+    projects_section=_section("projects", "<div class='sh'>Projects & Research</div><div class='exp'>", "</div>"),
+    education_section=_section("education", "<div class='sh'>Education</div><div class='st'>", "</div>"),
+    certificates_section=_section("certificates", "<div class='sh'>Awards & Certifications</div><div class='st'>", "</div>"),
+)
+
+# =============================================
+# TEMPLATE 7 — Dark Premium (Two-Column Dark)
+# Modern dark/charcoal with gold accents
+# =============================================
+_register(
+    "7. Dark Premium (Gold & Charcoal)",
+    """<html><head>
 <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;600;700&display=swap" rel="stylesheet">
 <style>
 *{{box-sizing:border-box;margin:0;padding:0}}body{{font-family:'Poppins',sans-serif;background:#1a1a2e;}}
@@ -340,13 +408,33 @@ hr{{border:none;border-top:2px solid #111;margin:14px 0;}}
     <div class="lsh">Contact</div>
     <p>{contact_lines}</p>
     <div class="lsh">Skills</div>
-    <div>{sk_pills}</div>
-    {"<div class='lsh'>Education</div><div class='st'>"+education+"</div>" if has_edu else ""}
-    {"<div class='lsh'>Certifications</div><div class='st'>"+certificates+"</div>" if has_cert else ""}
+    <div>{skills}</div>
+    {education_section}
+    {certificates_section}
   </div>
   <div class="rc">
     <div class="rsh">Experience</div>
     <div class="exp">{experience}</div>
-    {"<div class='rsh'>Projects</div><div class='exp'>"+projects+"</div>" if has_proj else ""}
+    {projects_section}
   </div>
-</div></body></html>"""
+</div></body></html>""",
+    skills=_each('<span class="pill">', '</span>'),
+    education_section=_section("education", "<div class='lsh'>Education</div><div class='st'>", "</div>"),
+    certificates_section=_section("certificates", "<div class='lsh'>Certifications</div><div class='st'>", "</div>"),
+    projects_section=_section("projects", "<div class='rsh'>Projects</div><div class='exp'>", "</div>"),
+)
+
+
+DEFAULT_TEMPLATE = "7. Dark Premium (Gold & Charcoal)"
+TEMPLATE_NAMES   = list(TEMPLATES)
+
+
+def render_cv(template_name, data):
+    template = TEMPLATES.get(template_name) or TEMPLATES[DEFAULT_TEMPLATE]
+    return template.render(prepare_cv(data))
+
+
+def render_all(data, template_names=None) -> dict:
+    """Render several templates (default: all, in TEMPLATE_NAMES order) from one preparation."""
+    prepared = prepare_cv(data)
+    return {name: render_cv(name, prepared) for name in (template_names or TEMPLATE_NAMES)}
@@ -0,0 +1,246 @@
+"""
+templates/export.py
+===================
+Server-side CV export to PDF and DOCX, served as bytes (no data: URIs).
+
+- PDF: WeasyPrint renders the chosen template's HTML; DOCX: python-docx
+  builds a plain, ATS-friendly document from the CVModel (template-agnostic)
+- Both libraries are optional — available_formats() lists what is installed
+  (pip install weasyprint python-docx)
+- Renderers are pooled: a PDF renderer keeps its font configuration and the
+  fetched web fonts/CSS, a DOCX renderer keeps the parsed base document
+- Artifacts cached by content hash (PDF: the page HTML, DOCX: the CV) in a
+  TieredCache — memory LRU + optional SQLite file
+- No st imports — pure utility module
+"""
+
+import contextlib
+import html as html_lib
+import io
+import re
+import threading
+
+from core.cache import TieredCache, make_key
+from templates.cv_model import Entry, Role
+
+try:
+    import weasyprint
+    from weasyprint.text.fonts import FontConfiguration
+except (ImportError, OSError):       # not installed, or its system libraries (Pango) are missing
+    weasyprint = None
+
+try:
+    import docx
+except ImportError:
+    docx = None
+
+# ─────────────────────────────────────────────────────
+# CONSTANTS
+# ─────────────────────────────────────────────────────
+
+EXPORT_CACHE_PATH  = ".cache/exports.sqlite"
+EXPORT_CACHE_TTL   = 7 * 24 * 3600
+EXPORT_CACHE_BYTES = 64 * 1024 * 1024
+EXPORT_MEMORY      = 32               # artifacts kept in memory
+EXPORT_WORKERS     = 2                # concurrent renders per format (PDF layout is CPU-heavy)
+FETCH_TIMEOUT      = 10               # seconds per font/CSS fetch
+
+FORMATS = {
+    "pdf":  {"label": "PDF",  "mime": "application/pdf", "extension": "pdf", "module": "weasyprint"},
+    "docx": {
+        "label": "Word", "extension": "docx", "module": "python-docx",
+        "mime": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    },
+}
+
+_TAG   = re.compile(r"<[^>]+>")
+_BREAK = re.compile(r"<br\s*/?>", re.I)
+
+
+def available_formats() -> list:
+    """Export formats whose renderer library is importable, in FORMATS order."""
+    installed = {"pdf": weasyprint is not None, "docx": docx is not None}
+    return [fmt for fmt in FORMATS if installed[fmt]]
+
+
+def build_export_cache(path: str = EXPORT_CACHE_PATH, **kwargs) -> TieredCache:
+    """Create the artifact cache (wrap in @st.cache_resource from app.py)."""
+    kwargs.setdefault("ttl", EXPORT_CACHE_TTL)
+    kwargs.setdefault("max_disk_bytes", EXPORT_CACHE_BYTES)
+    kwargs.setdefault("max_memory_entries", EXPORT_MEMORY)
+    return TieredCache(path, **kwargs)
+
+
+def _text(fragment: str) -> str:
+    """HTML fragment → plain text (line breaks kept)."""
+    return html_lib.unescape(_TAG.sub("", _BREAK.sub("\n", fragment))).strip()
+
+
+# ─────────────────────────────────────────────────────
+# RENDERERS
+# ─────────────────────────────────────────────────────
+
+class _PDFRenderer:
+    """
+    One WeasyPrint setup. Font configuration and fetched resources (the
+    templates' Google Fonts CSS + font files) are reused across renders.
+    """
+
+    _resources      = {}                # url → fetched resource, shared by all renderers
+    _resources_lock = threading.Lock()
+
+    def __init__(self):
+        self._fonts = FontConfiguration()
+
+    def _fetch(self, url: str) -> dict:
+        with self._resources_lock:
+            cached = self._resources.get(url)
+        if cached is None:
+            cached = weasyprint.default_url_fetcher(url, timeout=FETCH_TIMEOUT)
+            if "file_obj" in cached:
+                cached["string"] = cached.pop("file_obj").read()
+            with self._resources_lock:
+                self._resources[url] = cached
+        return dict(cached)
+
+    def render(self, page_html: str, cv) -> bytes:
+        document = weasyprint.HTML(string=page_html, url_fetcher=self._fetch)
+        return document.write_pdf(font_config=self._fonts)
+
+
+class _DocxRenderer:
+    """python-docx document builder; the base .docx package is parsed once."""
+
+    def __init__(self):
+        buffer = io.BytesIO()
+        docx.Document().save(buffer)
+        self._base = buffer.getvalue()
+
+    def _section(self, document, heading: str, items: tuple) -> None:
+        if not items:
+            return
+        document.add_heading(heading, level=1)
+        for item in items:
+            if isinstance(item, Role):
+                document.add_paragraph().add_run(_text(item.title)).bold = True
+                for bullet in item.bullets or ():
+                    document.add_paragraph(_text(bullet), style="List Bullet")
+            elif isinstance(item, Entry):
+                paragraph = document.add_paragraph()
+                paragraph.add_run(_text(item.title)).bold = True
+                detail = _text(item.detail)
+                if detail:
+                    paragraph.add_run(" " + detail)
+            else:
+                text = _text(item)
+                if text:
+                    document.add_paragraph(text)
+
+    def render(self, page_html: str, cv) -> bytes:
+        document = docx.Document(io.BytesIO(self._base))
+        document.add_heading(_text(cv.name), level=0)
+        headline = _text(cv.headline)
+        if headline:
+            document.add_paragraph().add_run(headline).italic = True
+        contacts = " | ".join(c.text for c in cv.contacts) or _text(cv.contact)
+        if contacts:
+            document.add_paragraph(contacts)
+        if cv.skills:
+            document.add_heading("Skills", level=1)
+            document.add_paragraph(", ".join(_text(s) for s in cv.skills))
+        self._section(document, "Experience", cv.experience)
+        self._section(document, "Projects", cv.projects)
+        self._section(document, "Education", cv.education)
+        self._section(document, "Certifications", cv.certificates)
+        out = io.BytesIO()
+        document.save(out)
+        return out.getvalue()
+
+
+class RendererPool:
+    """At most `size` renderers in use at once; idle ones are reused, never rebuilt."""
+
+    def __init__(self, factory, size: int = EXPORT_WORKERS):
+        self._factory = factory
+        self._slots   = threading.BoundedSemaphore(size)
+        self._lock    = threading.Lock()
+        self._idle    = []
+        self.created  = 0
+
+    @contextlib.contextmanager
+    def lease(self):
+        with self._slots:
+            with self._lock:
+                renderer = self._idle.pop() if self._idle else None
+            if renderer is None:
+                renderer = self._factory()
+                with self._lock:
+                    self.created += 1
+            try:
+                yield renderer
+            finally:
+                with self._lock:
+                    self._idle.append(renderer)
+
+
+# ─────────────────────────────────────────────────────
+# EXPORTER
+# ─────────────────────────────────────────────────────
+
+class Exporter:
+    """Pooled renderers in front of a content-addressed artifact cache."""
+
+    def __init__(self, cache: TieredCache = None, workers: int = EXPORT_WORKERS):
+        self._cache    = cache if cache is not None else TieredCache(None, max_memory_entries=EXPORT_MEMORY)
+        self._pools    = {"pdf": RendererPool(_PDFRenderer, workers), "docx": RendererPool(_DocxRenderer, workers)}
+        self._lock     = threading.Lock()
+        self._building = {}               # artifact key → lock held while it renders
+        self._counts   = {"cached": 0, "rendered": 0, "failed": 0}
+
+    @staticmethod
+    def _key(fmt: str, page_html: str, cv_key: str) -> str:
+        # A PDF depends on the template's HTML; a DOCX only on the CV content
+        return make_key("export", fmt, page_html if fmt == "pdf" else cv_key)
+
+    def cached(self, fmt: str, page_html: str, cv_key: str):
+        """The artifact if it was built before, else None — never renders."""
+        return self._cache.get(self._key(fmt, page_html, cv_key))
+
+    def export(self, fmt: str, page_html: str, cv, cv_key: str) -> bytes:
+        """
+        Bytes of the CV in fmt ("pdf" | "docx"). page_html is render_cv()
+        output, cv the CVModel and cv_key its content hash (cv_hash).
+        Raises RuntimeError when the format's library isn't installed.
+        """
+        if fmt not in available_formats():
+            raise RuntimeError(f"{FORMATS[fmt]['label']} export needs `pip install {FORMATS[fmt]['module']}`")
+        key = self._key(fmt, page_html, cv_key)
+        with self._lock:
+            building = self._building.setdefault(key, threading.Lock())
+        with building:                    # concurrent requests for one artifact render it once
+            try:
+                data = self._cache.get(key)
+                if data is not None:
+                    with self._lock:
+                        self._counts["cached"] += 1
+                    return data
+                try:
+                    with self._pools[fmt].lease() as renderer:
+                        data = renderer.render(page_html, cv)
+                except Exception:
+                    with self._lock:
+                        self._counts["failed"] += 1
+                    raise
+                self._cache.set(key, data)
+                with self._lock:
+                    self._counts["rendered"] += 1
+                return data
+            finally:
+                with self._lock:
+                    self._building.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            out = dict(self._counts)
+        out["renderers"] = {fmt: pool.created for fmt, pool in self._pools.items()}
+        return out
@@ -0,0 +1,81 @@
+"""
+templates/render_cache.py
+=========================
+Memoised CV rendering, so Streamlit reruns that change nothing do no
+rendering or encoding.
+
+- Key = (template name, cv_hash of the CV); cv_hash is sha256 over canonical
+  JSON (a CVModel is hashed via to_dict()), so equal CVs share entries
+  across sessions
+- Value = {"html", "bytes"} — the page plus its UTF-8 download payload
+- Bounded LRU (memory-only TieredCache); hit/miss counters via stats()
+- A CVModel is only parsed when some requested template misses
+- No st imports — pure utility module
+"""
+
+import json
+
+from core.cache import TieredCache, make_key
+from templates.cv_model import CVModel
+from templates.cv_styles import TEMPLATE_NAMES, prepare_cv, render_cv
+
+# ─────────────────────────────────────────────────────
+# CONSTANTS
+# ─────────────────────────────────────────────────────
+
+RENDER_CACHE_ENTRIES = 128          # (template, CV) pairs; ~100 KB each for a large CV
+RENDER_TTL           = 24 * 3600    # seconds
+
+
+def cv_hash(data) -> str:
+    """Stable content hash of a CV dict or CVModel (key order and object identity don't matter)."""
+    if isinstance(data, CVModel):
+        data = data.to_dict()
+    return make_key(json.dumps(data, sort_keys=True, ensure_ascii=False, default=str))
+
+
+# ─────────────────────────────────────────────────────
+# CACHE
+# ─────────────────────────────────────────────────────
+
+class RenderCache:
+    """LRU of rendered templates keyed by template name and CV content."""
+
+    def __init__(self, max_entries: int = RENDER_CACHE_ENTRIES, ttl: float = RENDER_TTL):
+        self._cache = TieredCache(None, ttl=ttl, max_memory_entries=max_entries)
+
+    def render(self, template_name: str, data: dict, cv_key: str = None) -> dict:
+        """
+        {"html", "bytes"} for one template. data may be a CV dict or a
+        CVModel; pass cv_key (cv_hash of the original CV) to skip hashing.
+        """
+        return self.render_all(data, [template_name], cv_key=cv_key)[template_name]
+
+    def render_all(self, data: dict, template_names=None, cv_key: str = None) -> dict:
+        """Template name → {"html", "bytes"}; misses share one preparation."""
+        cv_key   = cv_key or cv_hash(data)
+        prepared = None
+        out      = {}
+        for name in template_names or TEMPLATE_NAMES:
+            key = make_key(name, cv_key)
+            entry = self._cache.get(key)
+            if entry is None:
+                if prepared is None:
+                    prepared = prepare_cv(data)
+                html  = render_cv(name, prepared)
+                entry = {"html": html, "bytes": html.encode("utf-8")}
+                self._cache.set(key, entry)
+            out[name] = entry
+        return out
+
+    def stats(self) -> dict:
+        stats = self._cache.stats()
+        return {
+            "hits":     stats["hits"],
+            "misses":   stats["misses"],
+            "hit_rate": stats["hit_rate"],
+            "entries":  stats["memory_entries"],
+        }
+
+    def clear(self) -> None:
+        self._cache.clear()
@@ -0,0 +1,58 @@
+import types
+
+import pytest
+
+from core.clients import REGISTRY
+from core.health import HEALTH
+
+
+class FakeLLM:
+    """
+    Scripted Gemini / Groq backends. Each provider answers from its list in
+    order (the last entry repeats); an entry is a string, an exception to
+    raise, or a callable(prompt) -> string.
+    """
+
+    def __init__(self):
+        self.gemini  = ["{}"]
+        self.groq    = ["{}"]
+        self.calls   = {"gemini": 0, "groq": 0}
+        self.prompts = {"gemini": [], "groq": []}
+
+    def answer(self, provider: str, prompt: str) -> str:
+        script = getattr(self, provider)
+        entry  = script[min(self.calls[provider], len(script) - 1)]
+        self.calls[provider] += 1
+        self.prompts[provider].append(prompt)
+        if isinstance(entry, Exception):
+            raise entry
+        return entry(prompt) if callable(entry) else entry
+
+    def gemini_model(self, api_key, model_name):
+        def generate_content(prompt, generation_config=None, stream=False):
+            text = self.answer("gemini", prompt)
+            if stream:
+                return iter([types.SimpleNamespace(text=text)])
+            return types.SimpleNamespace(text=text)
+        return types.SimpleNamespace(generate_content=generate_content)
+
+    def groq_client(self, api_key):
+        def create(messages, model=None, temperature=None, max_tokens=None, stream=False):
+            text = self.answer("groq", messages[0]["content"])
+            if stream:
+                delta = types.SimpleNamespace(content=text)
+                return iter([types.SimpleNamespace(choices=[types.SimpleNamespace(delta=delta)])])
+            message = types.SimpleNamespace(content=text)
+            return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+        return types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create)))
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    fake = FakeLLM()
+    monkeypatch.setattr(REGISTRY, "gemini_model", fake.gemini_model)
+    monkeypatch.setattr(REGISTRY, "groq", fake.groq_client)
+    monkeypatch.setattr(REGISTRY, "gemini_candidates", lambda api_key, models: list(models))
+    HEALTH.reset()
+    yield fake
+    HEALTH.reset()
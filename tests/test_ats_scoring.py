@@ -0,0 +1,52 @@
+from core.ats_scoring import MISSING_KEYWORDS, score_cv, score_cv_many
+
+CV = {
+    "headline":   "Data Engineer",
+    "summary":    "Data engineer building batch and streaming pipelines on Spark and Kafka for analytics teams.",
+    "contact":    "jane@example.com | +44 7700 900123",
+    "skills":     "Python, SQL, Spark, Kafka, Airflow, AWS",
+    "experience": "<p><b>Data Engineer at Acme</b></p><ul><li>Built Spark pipelines</li><li>Ran Kafka streams</li></ul>",
+    "education":  "<p><b>BSc Computer Science</b></p>",
+}
+
+MATCHING_JD = """We are hiring a data engineer. You will build Spark pipelines and Kafka streams
+in Python and SQL, orchestrated with Airflow on AWS. Spark pipelines experience required."""
+UNRELATED_JD = """Pastry chef wanted: laminated dough, croissants, sourdough baking, chocolate
+tempering, plated desserts and pastry kitchen management."""
+
+
+def test_score_is_deterministic_and_bounded():
+    first = score_cv(CV, MATCHING_JD)
+    assert first == score_cv(CV, MATCHING_JD)
+    assert 0 <= first["old_ats_score"] <= 100
+    assert set(first) == {
+        "old_ats_score", "keyword_coverage", "similarity",
+        "missing_keywords", "matched_keywords", "section_scores",
+    }
+
+
+def test_matching_jd_scores_higher_and_reports_keywords():
+    good, bad = score_cv(CV, MATCHING_JD), score_cv(CV, UNRELATED_JD)
+    assert good["old_ats_score"] > bad["old_ats_score"]
+    assert {"spark", "kafka", "airflow", "spark pipelines"} <= set(good["matched_keywords"])
+    assert "pastry" in bad["missing_keywords"] and len(bad["missing_keywords"]) <= MISSING_KEYWORDS
+    assert good["keyword_coverage"] > bad["keyword_coverage"]
+
+
+def test_filler_words_are_not_keywords():
+    result = score_cv(CV, "Strong candidate with excellent skills and years of experience in Rust.")
+    assert result["missing_keywords"] == ["rust"]
+
+
+def test_section_scores_include_the_format_check():
+    sections = score_cv(CV, MATCHING_JD)["section_scores"]
+    assert set(sections) == {"experience", "skills", "education", "projects", "overall_format"}
+    assert sections["skills"] > sections["projects"] == 0
+    assert score_cv({}, MATCHING_JD)["section_scores"]["overall_format"] == 0
+
+
+def test_many_scores_align_with_jds_and_rank_like_single_scoring():
+    scores = score_cv_many(CV, [UNRELATED_JD, MATCHING_JD, ""])
+    assert scores.shape == (3,) and scores.dtype.kind == "i"
+    assert scores[1] > scores[0]
+    assert len(score_cv_many(CV, [])) == 0
@@ -0,0 +1,53 @@
+import threading
+import time
+
+from core import batch
+from core.batch import batch_analyze_and_tailor_cv, run_batch
+
+
+def test_results_follow_input_order_and_errors_stay_in_their_entry():
+    def work(n):
+        time.sleep(0.01 * (5 - n))                  # finish in reverse order
+        if n == 2:
+            raise ValueError("bad item")
+        return n * 10
+
+    entries = run_batch(work, range(5), max_workers=5)
+    assert [e["index"] for e in entries] == [0, 1, 2, 3, 4]
+    assert [e["result"] for e in entries] == [0, 10, None, 30, 40]
+    assert entries[2]["error"] == "bad item"
+    assert all(e["error"] is None for i, e in enumerate(entries) if i != 2)
+
+
+def test_concurrency_is_bounded_and_progress_runs_on_the_caller():
+    lock, running, peak = threading.Lock(), [0], [0]
+
+    def work(n):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return n
+
+    caller, seen = threading.get_ident(), []
+    run_batch(work, range(12), max_workers=3,
+              on_progress=lambda done, total, entry: seen.append((done, total, threading.get_ident())))
+    assert peak[0] <= 3
+    assert [done for done, _, _ in seen] == list(range(1, 13))
+    assert all(total == 12 and ident == caller for _, total, ident in seen)
+
+
+def test_empty_batch():
+    assert run_batch(lambda item: item, []) == []
+
+
+def test_matrix_has_one_entry_per_cv_and_jd(monkeypatch):
+    monkeypatch.setattr(batch, "analyze_and_tailor_cv", lambda cv, jd, *args, **kwargs: f"{cv['name']}×{jd}")
+    matrix = batch_analyze_and_tailor_cv([{"name": "a"}, {"name": "b"}], ["x", "y", "z"], "g", "q")
+    assert [[e["result"] for e in row] for row in matrix] == [
+        ["a×x", "a×y", "a×z"],
+        ["b×x", "b×y", "b×z"],
+    ]
+    assert matrix[1][2]["index"] == 1 * 3 + 2
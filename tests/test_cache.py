@@ -0,0 +1,60 @@
+import time
+
+from core.cache import TieredCache, make_key
+
+
+def test_make_key_is_length_prefixed():
+    assert make_key("ab", "c") != make_key("a", "bc")
+    assert make_key("a", 1) == make_key("a", 1)
+
+
+def test_entries_expire_after_ttl():
+    cache = TieredCache(ttl=0.05)
+    cache.set("k", "v")
+    assert cache.get("k") == "v"
+    time.sleep(0.06)
+    assert cache.get("k") is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_memory_tier_is_lru_bounded():
+    cache = TieredCache(max_memory_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_disk_tier_survives_a_new_instance(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = TieredCache(path)
+    cache.set("json", {"name": "Priya"})
+    cache.set("raw", b"\x00pdf")
+    cache.close()
+
+    reopened = TieredCache(path)
+    assert reopened.get("json") == {"name": "Priya"}
+    assert reopened.get("raw") == b"\x00pdf"
+    assert reopened.stats()["disk_hits"] == 2
+
+
+def test_disk_tier_evicts_least_recently_used_over_budget(tmp_path):
+    cache = TieredCache(str(tmp_path / "cache.sqlite"), max_disk_bytes=250)
+    for i in range(5):
+        cache.set(f"k{i}", "x" * 100)
+        time.sleep(0.01)
+    stats = cache.stats()
+    assert stats["disk_bytes"] <= 250
+    assert stats["evictions"] == 3
+    assert cache.get("k4") == "x" * 100
+
+
+def test_get_any_skips_rejected_values():
+    cache = TieredCache()
+    cache.set("first", "prose")
+    cache.set("second", "{}")
+    assert cache.get_any(["first", "second"]) == ("first", "prose")
+    assert cache.get_any(["first", "second"], accept=lambda v: v.startswith("{")) == ("second", "{}")
+    assert cache.get_any(["first"], accept=lambda v: False) == (None, None)
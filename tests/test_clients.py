@@ -0,0 +1,94 @@
+import threading
+import types
+
+import pytest
+
+from core import clients
+from core.clients import ClientRegistry
+
+
+@pytest.fixture
+def fake_sdks(monkeypatch):
+    """Record genai.configure / GenerativeModel / Groq construction instead of touching the SDKs."""
+    calls = {"configure": [], "models": [], "groq": [], "listed": []}
+    listing = {"names": ["gemini-a", "gemini-b"]}
+
+    def list_models():
+        calls["listed"].append(1)
+        return [
+            types.SimpleNamespace(name=f"models/{n}", supported_generation_methods=["generateContent"])
+            for n in listing["names"]
+        ] + [types.SimpleNamespace(name="models/embedder", supported_generation_methods=["embedContent"])]
+
+    fake_genai = types.SimpleNamespace(
+        configure=lambda api_key: calls["configure"].append(api_key),
+        GenerativeModel=lambda name: calls["models"].append(name) or types.SimpleNamespace(name=name),
+        list_models=list_models,
+    )
+    monkeypatch.setattr(clients, "genai", fake_genai)
+    monkeypatch.setattr(clients, "Groq", lambda api_key: calls["groq"].append(api_key) or object())
+    calls["listing"] = listing
+    return calls
+
+
+def test_groq_client_is_shared_per_key(fake_sdks):
+    registry = ClientRegistry()
+    assert registry.groq("k1") is registry.groq("k1")
+    assert registry.groq("k2") is not registry.groq("k1")
+    assert fake_sdks["groq"] == ["k1", "k2"]
+
+
+def test_genai_is_configured_only_when_the_key_changes(fake_sdks):
+    registry = ClientRegistry()
+    first = registry.gemini_model("k1", "gemini-a")
+    assert registry.gemini_model("k1", "gemini-a") is first
+    registry.gemini_model("k1", "gemini-b")
+    assert fake_sdks["configure"] == ["k1"]
+
+    registry.gemini_model("k2", "gemini-a")
+    assert fake_sdks["configure"] == ["k1", "k2"]
+    assert registry.gemini_model("k1", "gemini-a") is not first    # built again under k1's config
+    assert fake_sdks["configure"] == ["k1", "k2", "k1"]
+
+
+def test_candidates_put_the_sticky_model_first_and_skip_missing_ones():
+    registry = ClientRegistry(refresh_interval=float("inf"))       # no background listing
+    models = ["a", "b", "c"]
+    assert registry.gemini_candidates("k", models) == models
+
+    registry.mark_success("k", "c")
+    assert registry.gemini_candidates("k", models) == ["c", "a", "b"]
+    assert registry.gemini_candidates("other", models) == models
+
+    registry.mark_missing("k", "c")
+    registry.mark_missing("k", "a")
+    assert registry.gemini_candidates("k", models) == ["b"]
+    registry.mark_missing("k", "b")
+    assert registry.gemini_candidates("k", models) == models        # never leave nothing to try
+
+
+def test_refresh_limits_candidates_to_listed_models(fake_sdks):
+    registry = ClientRegistry()
+    registry.mark_missing("k", "gemini-b")
+    registry._refresh("k")
+    assert registry.snapshot()["available"][clients._key_id("k")] == ["gemini-a", "gemini-b"]
+    assert registry.snapshot()["missing"][clients._key_id("k")] == []    # listing supersedes the 404
+
+    registry._refreshed_at[clients._key_id("k")] = float("inf")
+    assert registry.gemini_candidates("k", ["gemini-x", "gemini-b", "gemini-a"]) == ["gemini-b", "gemini-a"]
+
+    fake_sdks["listing"]["names"] = []
+    registry._refresh("k")                                          # empty listing keeps the old view
+    assert registry.snapshot()["available"][clients._key_id("k")] == ["gemini-a", "gemini-b"]
+
+
+def test_background_refresh_runs_once_per_interval(monkeypatch):
+    registry = ClientRegistry(refresh_interval=60)
+    ran = threading.Event()
+    count = []
+    monkeypatch.setattr(registry, "_refresh", lambda api_key: count.append(api_key) or ran.set())
+    registry.gemini_candidates("k", ["a"])
+    assert ran.wait(1)
+    registry.gemini_candidates("k", ["a"])
+    registry.gemini_candidates("k", ["a"])
+    assert count == ["k"]
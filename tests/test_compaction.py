@@ -0,0 +1,65 @@
+import json
+
+from core.compaction import PAGE_BREAK, compact_json, compact_text, estimate_tokens, remove_furniture
+
+
+def test_roles_sharing_a_title_are_kept():
+    text = "\n".join([
+        "Priya Sharma",
+        "Bangalore, India",
+        "EXPERIENCE",
+        "Acme Corp",
+        "Software Engineer   2022 - 2024",
+        "Bangalore, India",
+        "Built Spark pipelines",
+        "Globex",
+        "Software Engineer   2020 - 2022",
+        "Bangalore, India",
+        "Led a team of five",
+        "Initech",
+        "Software Engineer   2018 - 2020",
+        "Bangalore, India",
+        "Migrated CI to Kubernetes",
+    ])
+    out, report = compact_text(text)
+    assert report["furniture_removed"] == 0
+    for dates in ("2022 - 2024", "2020 - 2022", "2018 - 2020"):
+        assert f"Software Engineer  {dates}" in out
+    assert out.count("Bangalore, India") == 4
+
+
+def test_running_header_and_page_numbers_are_dropped():
+    pages = [
+        "Priya Sharma — CV\nSoftware Engineer 2022 - 2024\nBuilt Spark pipelines\nPage 1 of 3",
+        "Priya Sharma — CV\nSoftware Engineer 2020 - 2022\nLed a team of five\nPage 2 of 3",
+        "Priya Sharma — CV\nSoftware Engineer 2018 - 2020\nMigrated CI to Kubernetes\n- 3 -",
+    ]
+    out, removed = remove_furniture(PAGE_BREAK.join(pages))
+    assert removed == 5
+    assert out.count("Priya Sharma — CV") == 1
+    assert "Page" not in out and "- 3 -" not in out
+    assert out.count("Software Engineer") == 3
+
+
+def test_year_on_its_own_line_is_not_a_page_number():
+    out, removed = remove_furniture("B.Tech Computer Science\nIIT Bombay\n2014")
+    assert removed == 0
+    assert out.endswith("2014")
+
+
+def test_compact_json_drops_whole_bullets_not_the_tail():
+    role = (
+        "<p><b>Engineer at Co{i} (2020 – 2022)</b></p><ul>"
+        "<li>Cut p99 latency by 40% with Kafka</li>"
+        "<li>Attended team meetings and helped out with various things</li>"
+        "<li>Attended team meetings and helped out with various things</li>"
+        "</ul>"
+    )
+    cv = {"name": "Priya Sharma", "skills": "Python, Kafka", "experience": "".join(role.format(i=i) for i in range(20))}
+    out, report = compact_json(cv, 600)
+    experience = json.loads(out)["experience"]
+    assert estimate_tokens(out) <= 600
+    assert report["lines_dropped"] > 0
+    assert experience.count("40% with Kafka") == 20
+    assert experience.count("<ul>") == experience.count("</ul>") == 20
+    assert "Co19" in experience
@@ -0,0 +1,51 @@
+from core.ai_engine import _normalise_base_cv
+from templates.cv_model import CVModel, Entry, Role
+from templates.cv_styles import TEMPLATES, render_cv
+
+# A CV with raw structured sections, and those sections as the templates
+# have always shown them (key/value blocks, plain strings in <p>).
+RAW = {
+    "name":       "Ada Lovelace",
+    "headline":   "Engineer",
+    "contact":    "ada@example.com | London",
+    "skills":     ["Python", "SQL"],
+    "experience": [{"title": "Dev", "company": "X", "bullets": ["a", "b"]}, "Freelance"],
+    "education":  [{"degree": "BSc", "school": "MIT", "year": ""}],
+    "projects":   {"name": "Engine", "stack": "brass"},
+}
+BASELINE = {
+    "experience": (
+        "<div style='margin-bottom:12px;'><b>Title:</b> Dev<br><b>Company:</b> X<br>"
+        "<b>Bullets:</b> ['a', 'b']</div><p>Freelance</p>"
+    ),
+    "education": "<div style='margin-bottom:12px;'><b>Degree:</b> BSc<br><b>School:</b> MIT<br><b>Year:</b> </div>",
+    "projects":  "<div><b>Name:</b> Engine<br><b>Stack:</b> brass</div>",
+}
+
+
+def test_structured_sections_render_as_before():
+    model = CVModel.from_dict(RAW)
+    for field, html in BASELINE.items():
+        assert model.section_html(field) == html
+    as_strings = dict(RAW, **BASELINE)
+    for name in TEMPLATES:
+        assert render_cv(name, RAW) == render_cv(name, as_strings)
+
+
+def test_html_sections_split_into_items():
+    model = CVModel.from_dict({
+        "experience": "<p><b>Dev at X</b></p><ul><li>a</li><li>b</li></ul>",
+        "education":  "<p><b>BSc</b> MIT, 2020</p>",
+    })
+    (role,) = model.experience
+    assert isinstance(role, Role) and role.title == "Dev at X" and role.bullets == ("a", "b")
+    (entry,) = model.education
+    assert isinstance(entry, Entry) and entry.detail == " MIT, 2020"
+    assert model.section_html("experience") == "<div class='job-title'>Dev at X</div><ul><li>a</li><li>b</li></ul>"
+
+
+def test_to_dict_round_trips_a_normalised_cv():
+    normalised = _normalise_base_cv(dict(RAW, experience=[{"title": "Dev", "bullets": ["a"]}], summary="Hi", links="x"))
+    back = CVModel.from_dict(normalised).to_dict()
+    assert back == normalised
+    assert CVModel.from_dict(back).to_dict() == back
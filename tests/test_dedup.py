@@ -0,0 +1,63 @@
+import pytest
+
+from core.dedup import CVIndex, hamming, normalize_text, simhash
+
+ROLES = [
+    f"Data Engineer at Company {i} (20{10 + i} - 20{11 + i}) built pipelines for squad {i} and cut costs {i}0%"
+    for i in range(12)
+]
+RAW = "Jane Doe\nData Engineer\n" + "\n".join(ROLES)
+BASE_CV = {"name": "Jane Doe", "headline": "Data Engineer", "experience": " ".join(ROLES)}
+
+
+@pytest.fixture
+def index():
+    idx = CVIndex()
+    idx.add(RAW, BASE_CV)
+    return idx
+
+
+def test_normalisation_folds_spacing_case_and_punctuation():
+    assert normalize_text("  Jane   DOE,\n(Data—Engineer) ") == "jane doe data engineer"
+    assert simhash(normalize_text(RAW)) == simhash(normalize_text(RAW.upper().replace("\n", "  ")))
+    assert simhash("") == 0
+
+
+def test_one_changed_word_stays_within_the_near_distance():
+    edited = normalize_text(RAW.replace("squad 4", "squad 5"))
+    assert hamming(simhash(normalize_text(RAW)), simhash(edited)) <= 3
+    unrelated = normalize_text("Pastry chef with ten years of laminated dough and sourdough " * 5)
+    assert hamming(simhash(normalize_text(RAW)), simhash(unrelated)) > 3
+
+
+def test_exact_match_returns_a_copy(index):
+    cv, kind = index.lookup(RAW.replace("\n", "   ").lower())
+    assert (cv, kind) == (BASE_CV, "exact")
+    cv["name"] = "changed"
+    assert index.lookup(RAW)[0]["name"] == "Jane Doe"
+
+
+def test_near_match_is_patched_with_a_unique_anchor(index):
+    cv, kind = index.lookup(RAW.replace("(2013 - 2014)", "(2013 - 2015)"))
+    assert kind == "near"
+    assert cv["experience"] == BASE_CV["experience"].replace("Company 3 (2013 - 2014)", "Company 3 (2013 - 2015)")
+
+
+def test_unpatchable_near_match_and_misses(index):
+    inserted = RAW.replace("built pipelines for squad 7", "built pipelines quickly for squad 7")
+    assert index.lookup(inserted) == (None, None)
+    assert index.lookup("Pastry chef with ten years of laminated dough " * 5) == (None, None)
+    stats = index.stats()
+    assert stats["misses"] + stats["near_unpatchable"] == 2
+
+
+def test_incomplete_results_are_not_indexed_and_the_index_is_bounded():
+    idx = CVIndex(max_entries=2)
+    idx.add("partial", {"name": "x", "_missing_fields": ["skills"]})
+    idx.add("error", {"experience": "<p><b>Extraction Error</b></p>"})
+    assert idx.stats()["entries"] == 0
+    for i in range(3):
+        idx.add(f"cv number {i} " * 20, {"name": str(i)})
+    assert idx.stats()["entries"] == 2
+    assert idx.lookup("cv number 0 " * 20) == (None, None)    # oldest evicted
+    assert idx.lookup("cv number 2 " * 20)[1] == "exact"
@@ -0,0 +1,74 @@
+import threading
+import time
+
+import pytest
+
+from benchmarks._cv_samples import make_cv, normalised
+from templates import export
+from templates.cv_model import CVModel
+from templates.export import Exporter, RendererPool
+from templates.render_cache import cv_hash
+
+CV = CVModel.from_dict(normalised(make_cv(2, 10)))
+
+
+class _SlowRenderer:
+    """Stands in for the PDF/DOCX renderers: counts renders, takes a little while."""
+
+    renders = []
+
+    def render(self, page_html, cv):
+        _SlowRenderer.renders.append(page_html)
+        time.sleep(0.05)
+        return f"artifact of {page_html}".encode()
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    _SlowRenderer.renders = []
+    monkeypatch.setattr(export, "available_formats", lambda: ["pdf", "docx"])
+    ex = Exporter(workers=2)
+    ex._pools = {fmt: RendererPool(_SlowRenderer, 2) for fmt in ("pdf", "docx")}
+    return ex
+
+
+def test_concurrent_requests_render_an_artifact_once(exporter):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(exporter.export("pdf", "<html>a</html>", CV, "k")))
+        for _ in range(6)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [b"artifact of <html>a</html>"] * 6
+    assert _SlowRenderer.renders == ["<html>a</html>"]
+    assert exporter.stats()["rendered"] == 1 and exporter.stats()["cached"] == 5
+
+
+def test_artifacts_are_keyed_by_what_they_depend_on(exporter):
+    assert exporter.cached("pdf", "<html>a</html>", "k") is None
+    exporter.export("pdf", "<html>a</html>", CV, "k")
+    assert exporter.cached("pdf", "<html>a</html>", "other") is not None       # PDF: the page HTML
+    exporter.export("docx", "<html>a</html>", CV, "k")
+    assert exporter.cached("docx", "<html>b</html>", "k") is not None         # DOCX: the CV only
+    assert exporter.cached("docx", "<html>a</html>", "other") is None
+
+
+def test_renderers_are_pooled_and_reused(exporter):
+    for i in range(5):
+        exporter.export("pdf", f"<html>{i}</html>", CV, "k")
+    assert exporter.stats()["renderers"]["pdf"] == 1
+
+
+def test_missing_library_is_reported(monkeypatch):
+    monkeypatch.setattr(export, "available_formats", lambda: [])
+    with pytest.raises(RuntimeError, match="pip install"):
+        Exporter().export("pdf", "<html></html>", CV, "k")
+
+
+def test_docx_export_builds_a_document():
+    pytest.importorskip("docx")
+    data = Exporter().export("docx", "", CV, cv_hash(CV))
+    assert data[:2] == b"PK"                                                  # a zip container
@@ -0,0 +1,75 @@
+import time
+
+import pytest
+
+from core.health import CLOSED, HALF_OPEN, OPEN, HealthTracker
+
+A = ("gemini", "fast")
+B = ("groq", "slow")
+
+
+@pytest.fixture
+def health():
+    return HealthTracker(failure_threshold=2, open_seconds=0.05, alpha=0.5)
+
+
+def _state(health, backend):
+    return health.snapshot()["/".join(backend)]["state"]
+
+
+def test_circuit_opens_after_consecutive_failures(health):
+    health.record_failure(A)
+    health.record_success(A, 0.1)                   # a success resets the streak
+    health.record_failure(A)
+    assert _state(health, A) == CLOSED and health.acquire(A)
+    health.record_failure(A)
+    assert _state(health, A) == OPEN
+    assert not health.acquire(A)
+    assert health.rank([A, B]) == [B]
+
+
+def test_half_open_lets_one_probe_through(health):
+    health.record_failure(A)
+    health.record_failure(A)
+    time.sleep(0.06)
+    assert health.rank([A]) == [A]
+    assert health.acquire(A)                        # this caller is the probe
+    assert _state(health, A) == HALF_OPEN
+    assert not health.acquire(A)
+    assert health.rank([A]) == []
+
+    health.release(A)                               # neutral outcome frees the slot
+    assert health.acquire(A)
+    health.record_success(A, 0.2)
+    assert _state(health, A) == CLOSED and health.acquire(A)
+
+
+def test_failed_probe_reopens_the_circuit(health):
+    health.record_failure(A)
+    health.record_failure(A)
+    time.sleep(0.06)
+    assert health.acquire(A)
+    health.record_failure(A)
+    assert _state(health, A) == OPEN and not health.acquire(A)
+
+
+def test_rank_prefers_low_latency_and_penalises_errors(health):
+    health.record_success(A, 0.5)
+    health.record_success(B, 2.0)
+    new = ("gemini", "unmeasured")
+    assert health.rank([new, B, A]) == [A, B, new]
+
+    health.record_failure(A, latency=0.1)           # fails fast — must not look fast
+    assert health.rank([A, B]) == [B, A]
+
+
+def test_snapshot_tracks_ewma_and_counts(health):
+    health.record_success(A, 1.0)
+    health.record_success(A, 3.0)
+    health.record_failure(A)
+    snap = health.snapshot()["gemini/fast"]
+    assert snap["ewma_latency"] == 2.0
+    assert snap["error_rate"] == 0.5
+    assert (snap["calls"], snap["errors"], snap["consecutive_failures"]) == (3, 1, 1)
+    health.reset()
+    assert health.snapshot() == {}
@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+from core import ai_engine
+from core.ai_engine import agenerate_with_fallback, is_json_response
+from core.cache import TieredCache
+
+VALID = '{"name": "Priya Sharma"}'
+
+
+def _run(prompt, cache, **kwargs):
+    return asyncio.run(agenerate_with_fallback(
+        prompt, "g", "q", cache=cache, hedge_after=0.05, validate=is_json_response, **kwargs
+    ))
+
+
+def test_invalid_primary_falls_back_and_is_not_cached(fake_llm):
+    fake_llm.gemini = ["Here is the CV you asked for."]
+    fake_llm.groq   = [VALID]
+    cache = TieredCache()
+    assert _run("extract", cache) == VALID
+    assert _run("extract", cache) == VALID
+    assert fake_llm.calls == {"gemini": 1, "groq": 1}
+
+
+def test_invalid_cached_value_is_a_miss(fake_llm):
+    cache = TieredCache()
+    for key in ai_engine._cache_candidates("extract", 0.2):
+        cache.set(key, "prose from an older build")
+    fake_llm.gemini = [VALID]
+    assert _run("extract", cache) == VALID
+    assert fake_llm.calls["gemini"] == 1
+
+
+def test_slow_primary_is_hedged(fake_llm):
+    fake_llm.gemini = [lambda prompt: time.sleep(0.5) or VALID]
+    fake_llm.groq   = ['{"name": "from groq"}']
+    assert _run("extract", None) == '{"name": "from groq"}'
+
+
+def test_two_invalid_answers_return_the_first_uncached(fake_llm):
+    fake_llm.gemini = ['{"name": "Priya", "skills": "Ka']
+    fake_llm.groq   = ["no json here"]
+    cache = TieredCache()
+    assert _run("extract", cache) == '{"name": "Priya", "skills": "Ka'
+    assert cache.stats()["memory_entries"] == 0
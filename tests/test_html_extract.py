@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from core.scraper import _extract_from_chunks, _extract_from_html, _iter_body_text
+
+LOREM = "Senior data engineer building streaming pipelines and mentoring the team. " * 8
+
+# Fixed corpus: profile-shaped pages plus the markup edge cases the streaming
+# parser has to build the same tree for as bs4's html.parser builder.
+CORPUS = [
+    "",
+    "plain text, no markup at all " * 10,
+    f"""<!DOCTYPE html><html><head><title>Jane Doe | LinkedIn</title>
+    <meta property="og:title" content="Jane Doe">
+    <meta property="og:description" content="Data engineer &amp; mentor">
+    <script>var wall = "<div>authwall</div>";</script><style>p {{ color: red }}</style>
+    </head><body><main><h1>Jane Doe</h1><p>{LOREM}</p></main></body></html>""",
+    f"<html><body><div class='authwall'>Sign in</div><p>authwall to continue</p><p>{LOREM}</p></body></html>",
+    f"<title>T &amp; co &#65;&#x42; &nbsp;</title><p>{LOREM}<br>line<br/>two</p><img src=x><p>after &foo; &amp</p>",
+    f"<noscript>enable js</noscript><template><p>hidden?</p></template><p>{LOREM}</p>",
+    "<title>first</title><title>second</title><meta property=og:title content='Unquoted'/>" + LOREM,
+    f"<!-- <title>commented</title> --><![CDATA[cdata]]><?php echo 1 ?><p>{LOREM}</p>",
+    f"<p>unclosed <b>bold <span>nested</p></div></br><ruby>漢<rt>kan</rt></ruby>{LOREM}",
+    f"<pre>  keep\n  spacing  </pre><textarea><p>not a tag</p></textarea>{LOREM}",
+    "<meta property='og:title'><meta property=\"og:description\" content=\"\"><title></title>" + LOREM,
+    "<p>" + "long page text " * 400 + "</p>",
+]
+
+_PIECES = [
+    "<html>", "</html>", "<head>", "</head>", "<body>", "</body>", "<title>", "</title>",
+    "<title>T &amp; co</title>", "<meta property='og:title' content='Jane &lt;Doe&gt;'>",
+    "<script>var a='<div>authwall</div>';</script>", "<style>p{}</style>", "<noscript>", "</noscript>",
+    "<p>", "</p>", "<div>", "</div>", "<br>", "</br>", "<img src=x>", "<pre>", "</pre>",
+    "<!-- c -->", "<![CDATA[cd]]>", "&nbsp;", "&#65;", "&foo;", "&amp", "hello", "world ", "\n",
+    "authwall", "Ü", "lorem ipsum dolor sit amet " * 5,
+]
+
+
+def _chunked(html: str, size: int) -> list:
+    return [html[i : i + size] for i in range(0, len(html), size)] or [""]
+
+
+@pytest.mark.parametrize("html", CORPUS)
+@pytest.mark.parametrize("size", [1, 7, 64, 1 << 20])
+def test_streaming_parser_matches_bs4(html, size):
+    assert _extract_from_chunks(_chunked(html, size)) == _extract_from_html(html)
+
+
+def test_streaming_parser_matches_bs4_on_generated_markup():
+    rnd = random.Random(17)
+    for _ in range(300):
+        html = "".join(rnd.choice(_PIECES) for _ in range(rnd.randint(0, 80)))
+        assert _extract_from_chunks(_chunked(html, rnd.randint(1, 40))) == _extract_from_html(html), html
+
+
+class _Body:
+    def __init__(self, data: bytes, encoding=None):
+        self.data, self.encoding = data, encoding
+
+    def iter_content(self, size):
+        return (self.data[i : i + size] for i in range(0, len(self.data), size))
+
+
+def test_body_is_decoded_with_declared_or_detected_charset():
+    text = "Zürich — Ångström résumé, naïve café. " * 20
+    assert "".join(_iter_body_text(_Body(text.encode("utf-8"), "utf-8"))) == text
+    assert "".join(_iter_body_text(_Body(text.encode("utf-8")))) == text
+    cyrillic = "Инженер данных, строит потоковые конвейеры и наставляет команду. " * 20
+    assert "".join(_iter_body_text(_Body(cyrillic.encode("cp1251")))) == cyrillic
+    assert len("".join(_iter_body_text(_Body(text.encode("utf-8"), "utf-8"), max_bytes=40))) < 40
@@ -0,0 +1,79 @@
+import http.server
+import threading
+
+import pytest
+
+from core import scraper
+from core.scraper import build_http_cache, scrape_url_text
+
+PAGE = (
+    "<html><head><title>Jane Doe</title><meta property='og:title' content='Jane Doe'></head>"
+    "<body><p>" + "Data engineer building streaming pipelines. " * 10 + "</p></body></html>"
+).encode()
+
+
+class _Origin(http.server.BaseHTTPRequestHandler):
+    """ETag-validated pages; path picks the Cache-Control policy."""
+
+    protocol_version = "HTTP/1.1"
+    requests = []
+    policies = {"/fresh": "max-age=3600", "/stale": "no-cache", "/private": "no-store"}
+
+    def do_GET(self):
+        conditional = self.headers.get("If-None-Match") == '"v1"'
+        _Origin.requests.append((self.path, conditional))
+        self.send_response(304 if conditional else 200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Cache-Control", self.policies.get(self.path, ""))
+        body = b"" if conditional else PAGE
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def origin():
+    _Origin.requests = []
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Origin)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return build_http_cache(str(tmp_path / "pages.sqlite"))
+
+
+def test_fresh_entry_skips_the_network(origin, cache):
+    first = scrape_url_text(origin + "/fresh", cache=cache)
+    assert "Jane Doe" in first
+    before = scraper.http_cache_stats()["fresh"]
+    assert scrape_url_text(origin + "/fresh", cache=cache) == first
+    assert _Origin.requests == [("/fresh", False)]
+    assert scraper.http_cache_stats()["fresh"] == before + 1
+
+
+def test_stale_entry_is_revalidated_and_a_304_reuses_it(origin, cache):
+    first = scrape_url_text(origin + "/stale", cache=cache)
+    before = scraper.http_cache_stats()["revalidated"]
+    assert scrape_url_text(origin + "/stale", cache=cache) == first
+    assert _Origin.requests == [("/stale", False), ("/stale", True)]
+    assert scraper.http_cache_stats()["revalidated"] == before + 1
+
+
+def test_no_store_pages_are_never_cached(origin, cache):
+    scrape_url_text(origin + "/private", cache=cache)
+    scrape_url_text(origin + "/private", cache=cache)
+    assert _Origin.requests == [("/private", False), ("/private", False)]
+
+
+def test_entries_survive_a_new_cache_instance(origin, tmp_path):
+    path = str(tmp_path / "shared.sqlite")
+    scrape_url_text(origin + "/fresh", cache=build_http_cache(path))
+    scrape_url_text(origin + "/fresh", cache=build_http_cache(path))
+    assert len(_Origin.requests) == 1
@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pytest
+
+from core.jobs import JobExecutor
+
+
+def _wait(jobs, job_id, states=("done", "failed", "cancelled"), timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        snap = jobs.get(job_id)
+        if snap["state"] in states:
+            return snap
+        time.sleep(0.005)
+    raise AssertionError(f"job stuck in {jobs.get(job_id)['state']}")
+
+
+@pytest.fixture
+def jobs():
+    executor = JobExecutor(max_concurrent=1, max_pending=2)
+    yield executor
+    executor.shutdown()
+
+
+def test_result_and_error_are_reported(jobs):
+    ok   = jobs.submit(lambda x: x * 2, 21, owner="s1")
+    boom = jobs.submit(lambda: 1 / 0, owner="s2")
+    assert _wait(jobs, ok)["result"] == 42
+    failed = _wait(jobs, boom)
+    assert failed["state"] == "failed" and "division" in failed["error"]
+
+
+def test_generator_partials_and_final_value(jobs):
+    release = threading.Event()
+
+    def stream():
+        yield "first"
+        release.wait(1)
+        yield "second"
+
+    job_id = jobs.submit(stream)
+    deadline = time.time() + 1
+    while jobs.get(job_id)["partial"] != "first" and time.time() < deadline:
+        time.sleep(0.005)
+    assert jobs.get(job_id)["partial"] == "first"
+    release.set()
+    assert _wait(jobs, job_id)["result"] == "second"
+
+
+def test_cancelled_running_job_holds_its_slot_until_it_returns(jobs):
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(2)
+        return "late"
+
+    job_id = jobs.submit(slow)
+    assert started.wait(1)
+    assert jobs.cancel(job_id)
+    assert jobs.get(job_id)["state"] == "cancelled"
+    stats = jobs.stats()
+    assert stats["running"] == 1 and stats["cancelling"] == 1
+
+    release.set()
+    deadline = time.time() + 1
+    while jobs.stats()["running"] and time.time() < deadline:
+        time.sleep(0.005)
+    stats = jobs.stats()
+    assert stats["running"] == 0 and stats["cancelling"] == 0
+    assert jobs.get(job_id)["result"] is None        # the late result is discarded
+
+
+def test_queued_job_never_starts_once_cancelled(jobs):
+    release = threading.Event()
+    ran = []
+    blocker = jobs.submit(release.wait, 2, owner="s1")
+    queued  = jobs.submit(lambda: ran.append(1), owner="s2")
+    assert jobs.cancel(queued)
+    release.set()
+    _wait(jobs, blocker)
+    time.sleep(0.02)
+    assert ran == [] and jobs.get(queued)["state"] == "cancelled"
+
+
+def test_same_owner_and_kind_replaces_the_active_job(jobs):
+    release = threading.Event()
+    first  = jobs.submit(release.wait, 2, kind="tailor", owner="s1")
+    other  = jobs.submit(lambda: "kept", kind="tailor", owner="s2")
+    second = jobs.submit(lambda: "new", kind="tailor", owner="s1")
+    assert jobs.get(first)["state"] == "cancelled"
+    release.set()
+    assert _wait(jobs, second)["result"] == "new"
+    assert _wait(jobs, other)["result"] == "kept"
+
+
+def test_submit_refuses_when_the_queue_is_full(jobs):
+    release = threading.Event()
+    jobs.submit(release.wait, 2, owner="s0")
+    time.sleep(0.02)                                  # let it start so the rest queue
+    jobs.submit(lambda: None, owner="s1")
+    jobs.submit(lambda: None, owner="s2")
+    with pytest.raises(RuntimeError):
+        jobs.submit(lambda: None, owner="s3")
+    assert jobs.stats()["rejected"] == 1
+    release.set()
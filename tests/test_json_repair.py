@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from core.ai_engine import BASE_CV_KEYS, clean_and_parse_json
+from core.json_repair import missing_fields, repair_json
+
+CV = {key: f"<p><b>{key}</b> value, with \"quotes\" and é</p>" for key in BASE_CV_KEYS}
+
+
+def test_well_formed_object_round_trips():
+    text = json.dumps({"a": {"b": [1, 2.5, None]}, "c": "é\n"})
+    assert repair_json(text) == (json.loads(text), [])
+
+
+@pytest.mark.parametrize("text, fields", [
+    ('```json\n{"a": 1}\n```', {"a": 1}),
+    ('Sure! Here it is: {"a": 1} Let me know.', {"a": 1}),
+    ('{"a": 1, "b": [1, 2,],}', {"a": 1, "b": [1, 2]}),
+    ('{"a": True, "b": None, "c": False}', {"a": True, "b": None, "c": False}),
+    ('{"a": "line\nbreak"}', {"a": "line\nbreak"}),
+])
+def test_common_model_slips_are_accepted(text, fields):
+    assert repair_json(text) == (fields, [])
+
+
+@pytest.mark.parametrize("text, fields, truncated", [
+    ('{"a": 1, "b": "cut', {"a": 1}, ["b"]),
+    ('{"a": 1, "b": [1, 2', {"a": 1}, ["b"]),
+    ('{"a": 1, "b": {"c": 1, "d', {"a": 1}, ["b"]),
+    ('{"a": 1, "n": 7', {"a": 1}, ["n"]),          # "7" may be the start of "75"
+    ('{"a": 1, "s": "x\\', {"a": 1}, ["s"]),
+    ('{"a": 1, ', {"a": 1}, []),
+])
+def test_a_field_cut_off_mid_value_is_reported_not_kept(text, fields, truncated):
+    assert repair_json(text) == (fields, truncated)
+
+
+def test_text_without_an_object_is_rejected():
+    with pytest.raises(ValueError):
+        repair_json("no json here")
+
+
+def test_missing_fields_keeps_required_order():
+    assert missing_fields({"b": 1}, ["c"], ["a", "b", "c"]) == ["a", "c"]
+    assert missing_fields({"a": 1, "b": 2}, [], ["a", "b"]) == []
+
+
+def test_every_truncation_keeps_the_complete_fields():
+    text = json.dumps(CV, ensure_ascii=False, indent=2)
+    for cut in range(1, len(text), 7):
+        fields, truncated = repair_json(text[:cut])
+        assert all(CV[key] == value for key, value in fields.items())
+        assert len(truncated) <= 1
+        missing = missing_fields(fields, truncated, BASE_CV_KEYS)
+        assert set(missing) == set(BASE_CV_KEYS) - set(fields)
+
+
+def test_clean_and_parse_lists_missing_fields_for_a_follow_up():
+    text = json.dumps(CV, indent=2)
+    result = clean_and_parse_json(text[: len(text) // 2])
+    assert result["_missing_fields"]
+    assert result["name"] == CV["name"]
+    assert "_missing_fields" not in clean_and_parse_json(text)
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from core.json_stream import IncrementalJSONParser
+
+DOC = {
+    "name": "Jane \"JD\" Doe",
+    "skills": ["Python", "SQL {not a brace}", "C\\C++"],
+    "experience": "<p><b>Dev</b></p><ul><li>a, b</li></ul>",
+    "score": 87,
+    "ratio": -1.5e2,
+    "remote": True,
+    "manager": None,
+    "nested": {"a": [1, {"b": "]"}], "c": {}},
+    "unicode": "Zürich — 🚀",
+}
+
+
+def _feed_all(text: str, size: int) -> tuple:
+    parser = IncrementalJSONParser()
+    order = []
+    for i in range(0, len(text), size):
+        order += [key for key, _ in parser.feed(text[i : i + size])]
+    return parser, order
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 1 << 20])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_any_chunking_yields_every_field_once_in_order(size, indent):
+    text = "```json\n" + json.dumps(DOC, indent=indent) + "\n```\nHope that helps!"
+    parser, order = _feed_all(text, size)
+    assert parser.fields == DOC
+    assert order == list(DOC)
+    assert parser.done
+
+
+def test_fields_are_emitted_as_soon_as_their_value_closes():
+    parser = IncrementalJSONParser()
+    assert parser.feed('Sure: {"name": "Ja') == []
+    assert parser.feed('ne", "skills": ["a",') == [("name", "Jane")]
+    assert parser.feed(' "b"]') == [("skills", ["a", "b"])]
+    assert parser.feed(', "score": 8') == []                # "8" may still become "87"
+    assert parser.feed('7') == []
+    assert parser.feed('}') == [("score", 87)]
+    assert parser.done and parser.feed('{"late": 1}') == []
+
+
+def test_a_malformed_value_is_skipped_and_parsing_continues():
+    parser, order = _feed_all('{"a": tru, "b": 2}', 3)
+    assert parser.fields == {"b": 2} and order == ["b"]
+
+
+def test_truncated_stream_keeps_the_completed_fields():
+    text = json.dumps(DOC)
+    parser, _ = _feed_all(text[: text.index('"score"') + 9], 5)
+    assert parser.fields == {k: DOC[k] for k in ("name", "skills", "experience")}
+    assert not parser.done
@@ -0,0 +1,69 @@
+import io
+
+import pytest
+
+from benchmarks._pdf_samples import make_pdf
+from core import scraper
+
+
+@pytest.fixture(autouse=True)
+def fresh_page_cache():
+    scraper._page_cache.clear()
+    yield
+    scraper._page_cache.clear()
+
+
+def test_pool_is_resized_when_the_worker_count_changes():
+    two = scraper._get_pool(2)
+    assert scraper._get_pool(2) is two
+    three = scraper._get_pool(3)
+    assert three is not two and scraper._pool_size == 3
+
+
+def test_parallel_output_matches_serial():
+    data = make_pdf(4)
+    serial = scraper.extract_pdf_text(io.BytesIO(data))
+    scraper._page_cache.clear()
+    assert scraper.extract_pdf_text(io.BytesIO(data), parallel=True, max_workers=3) == serial
+    assert serial.count(scraper.PAGE_BREAK) == 3
+
+
+def test_budgeted_parallel_output_matches_serial():
+    data = make_pdf(8)
+    serial = scraper.extract_pdf_text(io.BytesIO(data), max_tokens=2000)
+    scraper._page_cache.clear()
+    pooled = scraper.extract_pdf_text(io.BytesIO(data), parallel=True, max_workers=3, max_tokens=2000)
+    assert pooled == serial
+    assert len(serial) < len(scraper.extract_pdf_text(io.BytesIO(data)))
+
+
+def test_pages_are_read_lazily_and_cached(monkeypatch):
+    data = make_pdf(6)
+    opened = []
+    real = scraper._page_text
+    monkeypatch.setattr(scraper, "_page_text", lambda page, layout: opened.append(page.page_number) or real(page, layout))
+
+    pages = scraper.iter_pdf_pages(io.BytesIO(data))
+    assert [next(pages)[0], next(pages)[0]] == [0, 1]
+    pages.close()
+    assert opened == [1, 2]                           # pdfplumber numbers pages from 1
+
+    assert [i for i, _ in scraper.iter_pdf_pages(io.BytesIO(data))] == list(range(6))
+    assert opened == [1, 2, 3, 4, 5, 6]               # the first two came from the cache
+
+
+def test_budget_stops_after_the_page_that_fills_it(monkeypatch):
+    data = make_pdf(6)
+    full = scraper.extract_pdf_text(io.BytesIO(data)).split(scraper.PAGE_BREAK)
+    page_tokens = scraper.estimate_tokens(scraper.collapse_whitespace(full[0]))
+    scraper._page_cache.clear()
+
+    opened = []
+    real = scraper._page_text
+    monkeypatch.setattr(scraper, "_page_text", lambda page, layout: opened.append(1) or real(page, layout))
+    text = scraper.extract_pdf_text(io.BytesIO(data), max_tokens=page_tokens + 1)
+    assert text.split(scraper.PAGE_BREAK) == full[:2]  # the crossing page is kept whole
+    assert len(opened) == 2
+
+    by_chars = scraper.extract_pdf_text(io.BytesIO(data), max_chars=10)
+    assert by_chars == full[0]
@@ -0,0 +1,52 @@
+from core import ai_engine
+from core.ai_engine import (
+    GEMINI_MODELS,
+    GROQ_MODEL,
+    INPUT_TOKEN_BUDGETS,
+    MIN_INPUT_TOKENS,
+    compaction_stats,
+    generate_with_fallback,
+    split_budget,
+)
+from core.cache import TieredCache
+from core.compaction import estimate_tokens
+from core.tailoring import _section_jobs
+
+CV = {
+    "name": "Priya Sharma",
+    "skills": "Python, Kafka, dbt",
+    "experience": "".join(
+        f"<p><b>Data Engineer at Co{i} (2018 – 2020)</b></p><ul>"
+        + "<li>Cut p99 latency by 40% by moving batch jobs to Kafka streams</li>" * 6
+        + "</ul>"
+        for i in range(60)
+    ),
+}
+JD = "Senior data engineer with Kafka, dbt and Snowflake experience.\n" * 600
+
+
+def test_split_budget_stays_within_budget():
+    for budget in (1000, 3500, 6000, 8000, 20000):
+        cv, jd = split_budget(budget)
+        assert cv + jd == budget
+    assert split_budget(8000) == (4800, 3200)
+    assert split_budget(6000) == (MIN_INPUT_TOKENS["cv"], MIN_INPUT_TOKENS["jd"])
+
+
+def test_prompts_fit_each_backend_budget():
+    prompts = [ai_engine._ats_prompt(CV, JD), ai_engine._extract_prompt(JD), *_section_jobs(CV, JD).values()]
+    for model in (GEMINI_MODELS[0], GROQ_MODEL):
+        for prompt in prompts:
+            assert estimate_tokens(prompt.for_model(model)) <= INPUT_TOKEN_BUDGETS[model]
+
+
+def test_cache_probe_does_not_build_the_prompt(fake_llm):
+    cache = TieredCache()
+    before = compaction_stats()["calls"]
+    generate_with_fallback(ai_engine._ats_prompt(CV, JD), "g", "q", cache=cache)
+    sent = compaction_stats()["calls"]
+    assert sent - before == 2                       # CV + JD of the one prompt sent
+
+    generate_with_fallback(ai_engine._ats_prompt(CV, JD), "g", "q", cache=cache)
+    assert compaction_stats()["calls"] == sent      # served from cache, nothing compacted
+    assert fake_llm.calls["gemini"] == 1
@@ -0,0 +1,45 @@
+from benchmarks._cv_samples import make_cv, normalised
+from templates import render_cache
+from templates.cv_model import CVModel
+from templates.cv_styles import TEMPLATE_NAMES, render_cv
+from templates.render_cache import RenderCache, cv_hash
+
+CV = normalised(make_cv(2, 10))
+
+
+def test_hash_ignores_key_order_and_model_wrapping():
+    reordered = dict(reversed(list(CV.items())))
+    assert cv_hash(reordered) == cv_hash(CV)
+    assert cv_hash(CVModel.from_dict(CV)) == cv_hash(CVModel.from_dict(reordered))
+    assert cv_hash(dict(CV, name="Someone Else")) != cv_hash(CV)
+
+
+def test_idle_rerun_does_no_rendering(monkeypatch):
+    cache = RenderCache()
+    first = cache.render(TEMPLATE_NAMES[0], CV)
+    assert first["html"] == render_cv(TEMPLATE_NAMES[0], CV)
+    assert first["bytes"] == first["html"].encode("utf-8")
+
+    monkeypatch.setattr(render_cache, "render_cv", lambda *args: (_ for _ in ()).throw(AssertionError("rendered")))
+    monkeypatch.setattr(render_cache, "prepare_cv", lambda *args: (_ for _ in ()).throw(AssertionError("parsed")))
+    assert cache.render(TEMPLATE_NAMES[0], dict(CV), cv_key=cv_hash(CV)) is first
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "entries": 1}
+
+
+def test_render_all_only_renders_the_misses_from_one_preparation(monkeypatch):
+    cache = RenderCache()
+    cache.render(TEMPLATE_NAMES[0], CV)
+    prepared = []
+    real = render_cache.prepare_cv
+    monkeypatch.setattr(render_cache, "prepare_cv", lambda data: prepared.append(1) or real(data))
+    pages = cache.render_all(CV)
+    assert list(pages) == TEMPLATE_NAMES and len(prepared) == 1
+    assert cache.stats()["entries"] == len(TEMPLATE_NAMES)
+
+
+def test_cache_is_bounded():
+    cache = RenderCache(max_entries=2)
+    cache.render_all(CV, TEMPLATE_NAMES[:3])
+    assert cache.stats()["entries"] == 2
+    cache.clear()
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,48 @@
+from core import ai_engine
+from core.ai_engine import EXTRACTION_ERROR, extract_base_cv, generate_with_fallback, is_json_response
+from core.cache import TieredCache
+from core.dedup import CVIndex
+
+CV_JSON = '{"name": "Priya Sharma", "headline": "Data Engineer", "contact": "", "summary": "", "skills": "Kafka", "experience": "", "projects": "", "education": "", "certificates": ""}'
+
+
+def test_is_json_response():
+    assert is_json_response('```json\n{"a": 1}\n```')
+    assert not is_json_response("I can't help with that.")
+    assert not is_json_response('{"a": 1, "b": [')
+    assert not is_json_response("")
+
+
+def test_failed_extraction_is_retried_not_replayed(fake_llm):
+    fake_llm.gemini = ["Sorry, I can't read that CV.", CV_JSON]
+    cache, index = TieredCache(), CVIndex()
+
+    first = extract_base_cv("Priya Sharma\nData Engineer", "g", "q", cache=cache, index=index)
+    assert EXTRACTION_ERROR in first["experience"]
+
+    second = extract_base_cv("Priya Sharma\nData Engineer", "g", "q", cache=cache, index=index)
+    assert second["name"] == "Priya Sharma"
+    assert fake_llm.calls["gemini"] == 2
+
+    third = extract_base_cv("Priya Sharma\nData Engineer", "g", "q", cache=cache, index=index)
+    assert third["name"] == "Priya Sharma"
+    assert fake_llm.calls["gemini"] == 2
+
+
+def test_truncated_json_is_not_cached(fake_llm):
+    fake_llm.gemini = ['{"name": "Priya", "skills": "Ka', CV_JSON]
+    cache = TieredCache()
+    prompt = ai_engine._extract_prompt("Priya")
+    for _ in range(2):
+        generate_with_fallback(prompt, "g", "q", cache=cache, validate=is_json_response)
+    assert generate_with_fallback(prompt, "g", "q", cache=cache, validate=is_json_response) == CV_JSON
+    assert fake_llm.calls["gemini"] == 2
+
+
+def test_prose_is_cached_only_when_the_caller_accepts_it(fake_llm):
+    fake_llm.gemini = ["Dear hiring manager"]
+    cache = TieredCache()
+    generate_with_fallback("letter", "g", "q", cache=cache)
+    assert generate_with_fallback("letter", "g", "q", cache=cache) == "Dear hiring manager"
+    assert generate_with_fallback("letter", "g", "q", cache=cache, validate=is_json_response) == "Dear hiring manager"
+    assert fake_llm.calls["gemini"] == 2
@@ -0,0 +1,66 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core import scraper
+
+
+class _FakeFetch:
+    """Stands in for scrape_url_text: records per-host concurrency and start times."""
+
+    def __init__(self, seconds=0.02, slow=()):
+        self.seconds, self.slow = seconds, set(slow)
+        self.lock    = threading.Lock()
+        self.running = {}
+        self.peak    = {}
+        self.starts  = {}
+
+    def __call__(self, url, timeout=None, cache=None):
+        host = url.split("/")[2]
+        with self.lock:
+            self.running[host] = self.running.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.running[host])
+            self.starts.setdefault(host, []).append(time.monotonic())
+        time.sleep(1.0 if url in self.slow else self.seconds)
+        with self.lock:
+            self.running[host] -= 1
+        return f"text of {url}"
+
+
+def _collect(urls, **kwargs) -> list:
+    async def run():
+        return [item async for item in scraper.scrape_urls(urls, **kwargs)]
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def fetch(monkeypatch):
+    fake = _FakeFetch()
+    monkeypatch.setattr(scraper, "scrape_url_text", fake)
+    return fake
+
+
+def test_every_url_is_yielded_once_with_its_index(fetch):
+    urls = [f"https://h{i % 3}.example/p{i}" for i in range(9)]
+    results = _collect(urls, delay=0)
+    assert sorted(index for index, _, _ in results) == list(range(9))
+    assert all(text == f"text of {urls[index]}" and url == urls[index] for index, url, text in results)
+
+
+def test_per_host_cap_and_politeness_delay(fetch):
+    urls = [f"https://same.example/p{i}" for i in range(4)] + ["https://other.example/p"]
+    _collect(urls, per_host=1, delay=0.05)
+    assert fetch.peak["same.example"] == 1
+    starts = fetch.starts["same.example"]
+    assert all(b - a >= 0.045 for a, b in zip(starts, starts[1:]))
+    assert fetch.starts["other.example"][0] - starts[0] < 0.05    # other hosts don't wait
+
+
+def test_a_url_that_runs_out_of_time_gets_the_name_fallback(monkeypatch):
+    slow = "https://www.linkedin.com/in/jane-doe-123"
+    monkeypatch.setattr(scraper, "scrape_url_text", _FakeFetch(slow=[slow]))
+    results = dict((url, text) for _, url, text in _collect([slow, "https://fast.example/"], delay=0, timeout=0.2))
+    assert results[slow] == scraper._name_from_url(slow)
+    assert results["https://fast.example/"] == "text of https://fast.example/"
@@ -0,0 +1,77 @@
+import http.server
+import threading
+
+import pytest
+
+from core.sessions import SessionManager
+
+
+class _StandIn(http.server.BaseHTTPRequestHandler):
+    """Warm-up page sets a cookie; /profile reports it; /flaky fails once with 503."""
+
+    protocol_version = "HTTP/1.1"
+    hits = {}
+
+    def do_GET(self):
+        _StandIn.hits[self.path] = _StandIn.hits.get(self.path, 0) + 1
+        if self.path == "/":
+            self._send(200, b"home", {"Set-Cookie": "li=warm; Path=/"})
+        elif self.path == "/profile":
+            self._send(200, (self.headers.get("Cookie") or "no cookie").encode())
+        elif self.path == "/flaky" and _StandIn.hits[self.path] == 1:
+            self._send(503, b"busy")
+        else:
+            self._send(200, b"ok")
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _StandIn.hits = {}
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _StandIn)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_warm_up_cookies_fetched_once_and_reused(server):
+    sessions = SessionManager(warmup_url=server + "/", backoff_factor=0)
+    for _ in range(3):
+        assert sessions.get(server + "/profile", timeout=5).text == "li=warm"
+    assert _StandIn.hits["/"] == 1
+    assert sessions.stats()["warmups"] == 1 and sessions.stats()["cookies_ok"]
+
+
+def test_other_sites_skip_the_warm_up(server):
+    sessions = SessionManager(warmup_url="http://localhost:1/", backoff_factor=0)
+    assert sessions.get(server + "/profile", timeout=5).text == "no cookie"
+    assert "/" not in _StandIn.hits
+    assert sessions.stats()["warmups"] == 0
+
+
+def test_retries_server_errors(server):
+    sessions = SessionManager(warmup_url="", backoff_factor=0)
+    assert sessions.get(server + "/flaky", timeout=5).status_code == 200
+    assert _StandIn.hits["/flaky"] == 2
+
+
+def test_configure_rebuilds_the_session(server):
+    sessions = SessionManager(warmup_url=server + "/", backoff_factor=0)
+    sessions.get(server + "/profile", timeout=5)
+    sessions.configure(max_retries=0)
+    assert sessions.stats()["cookies_ok"] is False
+    assert sessions.get(server + "/flaky", timeout=5).status_code == 503
+    assert _StandIn.hits["/"] == 2
+    with pytest.raises(TypeError):
+        sessions.configure(pool_size=3)
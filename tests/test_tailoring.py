@@ -0,0 +1,52 @@
+import json
+
+from core.tailoring import UNCHECKED, analyze_and_tailor_cv_parallel
+
+BASE = {
+    "name": "Priya Sharma", "headline": "Engineer", "contact": "", "summary": "Builds pipelines.",
+    "skills": "Python, SQL", "experience": "<p><b>Engineer at Acme (2020 – 2024)</b></p><ul><li>Built ETL in Python</li></ul>",
+    "projects": "", "education": "", "certificates": "",
+}
+JD = "Data engineer with Kafka, dbt and Python."
+
+ANSWERS = {
+    "Analyse the candidate's CV": {"old_ats_score": 48, "missing_keywords": ["kafka", "dbt"], "analysis_report": ["ok"]},
+    "Rewrite ONLY the headline": {"headline": "Data Engineer", "summary": "Python data engineer.", "skills": "Python, SQL"},
+    "Rewrite ONLY the experience": {"experience": "<p><b>Engineer at Acme (2020 – 2024)</b></p><ul><li>Built Python ETL pipelines</li></ul>"},
+    "reviewing a CV": {"new_ats_score": 71, "improvements_made": ["Led with data engineering"], "hallucination_check": "Safe"},
+}
+
+
+def _answer(prompt):
+    for marker, answer in ANSWERS.items():
+        if marker in prompt:
+            return json.dumps(answer)
+    return "not json"
+
+
+def test_parallel_path_returns_the_serial_fields(fake_llm):
+    fake_llm.gemini = [_answer]
+    seen = []
+    analysis = analyze_and_tailor_cv_parallel(BASE, JD, "g", "q", on_section=lambda name, _: seen.append(name))
+    assert analysis["old_ats_score"] == 48 and analysis["new_ats_score"] == 71
+    assert analysis["improvements_made"] == ["Led with data engineering"]
+    assert analysis["hallucination_check"] == "Safe"
+    assert "score_source" not in analysis
+    assert analysis["tailored_cv"]["headline"] == "Data Engineer"
+    assert seen[-1] == "review" and sorted(seen[:-1]) == ["experience", "scoring", "summary"]
+
+
+def test_review_sees_the_merged_cv(fake_llm):
+    fake_llm.gemini = [_answer]
+    analyze_and_tailor_cv_parallel(BASE, JD, "g", "q")
+    review = next(p for p in fake_llm.prompts["gemini"] if "reviewing a CV" in p)
+    assert "Built Python ETL pipelines" in review and "Python data engineer." in review
+
+
+def test_failed_review_falls_back_to_labelled_local_scores(fake_llm):
+    fake_llm.gemini = [lambda prompt: "not json" if "reviewing a CV" in prompt else _answer(prompt)]
+    fake_llm.groq   = ["still not json"]
+    analysis = analyze_and_tailor_cv_parallel(BASE, JD, "g", "q")
+    assert analysis["score_source"] == "local"
+    assert analysis["hallucination_check"] == UNCHECKED
+    assert "Safe" not in analysis["hallucination_check"]
@@ -0,0 +1,38 @@
+import pytest
+
+from benchmarks._cv_samples import make_cv, normalised
+from templates import cv_model
+from templates.cv_styles import DEFAULT_TEMPLATE, TEMPLATE_NAMES, prepare_cv, render_all, render_cv
+
+CV = normalised(make_cv(3, 12))
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Count CVModel.from_dict calls."""
+    calls = []
+    real = cv_model.CVModel.from_dict.__func__
+    monkeypatch.setattr(cv_model.CVModel, "from_dict", classmethod(lambda cls, d: calls.append(1) or real(cls, d)))
+    return calls
+
+
+def test_render_all_matches_render_cv_for_every_template():
+    pages = render_all(CV)
+    assert list(pages) == TEMPLATE_NAMES and len(pages) == 7
+    for name, html in pages.items():
+        assert html == render_cv(name, CV)
+        assert CV["name"].split()[-1] in html          # some templates break the name over lines
+
+
+def test_render_all_prepares_the_cv_once(parses):
+    render_all(CV)
+    assert len(parses) == 1
+    model = prepare_cv(CV)
+    render_all(model, TEMPLATE_NAMES[:2])
+    assert prepare_cv(model) is model and len(parses) == 2
+
+
+def test_subset_and_unknown_template():
+    subset = render_all(CV, TEMPLATE_NAMES[2:4])
+    assert list(subset) == TEMPLATE_NAMES[2:4]
+    assert render_cv("no such template", CV) == render_cv(DEFAULT_TEMPLATE, CV)